@@ -0,0 +1,43 @@
+# ARQUIVO: benchmarks/bench_bcrypt.py
+"""
+Benchmark: hashes bcrypt por segundo em cada fator de custo nesta máquina.
+
+Uso: python -m benchmarks.bench_bcrypt [--min 8] [--max 14] [--budget 1.0] [--target 250]
+"""
+import argparse
+import time
+
+import bcrypt
+
+from src.database.auth_queries import BCRYPT_TARGET_MS, calibrate_bcrypt_cost
+
+
+def hashes_per_second(cost: int, budget: float) -> float:
+    """Repete hashes até gastar `budget` segundos (mínimo de 1 hash)."""
+    salt = bcrypt.gensalt(rounds=cost)
+    count, start = 0, time.perf_counter()
+    while True:
+        bcrypt.hashpw(b"benchmark", salt)
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= budget:
+            return count / elapsed
+
+
+def run(min_cost: int, max_cost: int, budget: float, target_ms: int):
+    print(f"{'custo':>5} {'hash/s':>10} {'ms/hash':>10}")
+    for cost in range(min_cost, max_cost + 1):
+        rate = hashes_per_second(cost, budget)
+        print(f"{cost:>5} {rate:>10.1f} {1000 / rate:>10.1f}")
+    print(f"\nCusto calibrado para {target_ms} ms: {calibrate_bcrypt_cost(target_ms)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--min", type=int, default=8)
+    parser.add_argument("--max", type=int, default=14)
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="Segundos medidos por custo")
+    parser.add_argument("--target", type=int, default=BCRYPT_TARGET_MS)
+    args = parser.parse_args()
+    run(args.min, args.max, args.budget, args.target)
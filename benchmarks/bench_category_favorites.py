@@ -0,0 +1,87 @@
+# ARQUIVO: benchmarks/bench_category_favorites.py
+"""
+Benchmark: favoritar/desfavoritar uma categoria com muitas receitas.
+
+Compara a cascata antiga (uma linha em favorite_recipes por receita, numa única
+transação de escrita) com a resolução na leitura (migração 007).
+
+Uso: python -m benchmarks.bench_category_favorites [--recipes 50000]
+"""
+import argparse
+import os
+import time
+import uuid
+
+import src.database.database as db_module
+from src.database.category_queries import CategoryQueries
+from src.database.database import db_connection
+from src.database.recipe_queries import RecipeQueries
+from src.models.recipe import RecipeCreate
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def _legacy_cascade(user_id: int, cat_id: int):
+    """Reprodução da cascata anterior, apenas para comparação."""
+    with db_connection() as conn:
+        conn.execute("BEGIN")
+        conn.execute(
+            "INSERT INTO favorite_categories (user_id, category_id) VALUES (?,?)", (user_id, cat_id))
+        conn.execute("""
+            INSERT OR IGNORE INTO favorite_recipes (user_id, recipe_id)
+            SELECT ?, id FROM recipes WHERE category_id=?
+        """, (user_id, cat_id))
+        conn.commit()
+        conn.execute("BEGIN")
+        conn.execute(
+            "DELETE FROM favorite_categories WHERE user_id=? AND category_id=?", (user_id, cat_id))
+        conn.execute("""
+            DELETE FROM favorite_recipes
+            WHERE user_id=? AND recipe_id IN (SELECT id FROM recipes WHERE category_id=?)
+        """, (user_id, cat_id))
+        conn.commit()
+
+
+def run(total: int):
+    db_name = f"bench_favorites_{uuid.uuid4().hex[:8]}.db"
+    db_module.DB_NAME = db_name
+    db_module.DB_PATH = os.path.join(db_module.DB_DIR, db_name)
+    db_module.init_database()
+
+    try:
+        with db_connection() as conn:
+            user_id = conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('Bench', 'bench@local', 'h')").lastrowid
+            cat_id = conn.execute(
+                "INSERT INTO categories (name, user_id) VALUES ('Bench', NULL)").lastrowid
+            conn.commit()
+
+        recipes = RecipeQueries()
+        items = (RecipeCreate(category_id=cat_id, title=f"Receita {n}", instructions="x")
+                 for n in range(total))
+        ms, _ = _timed(recipes.create_recipes_bulk, items, user_id)
+        print(f"Carga: {total} receitas em {ms:.0f} ms")
+
+        ms, _ = _timed(_legacy_cascade, user_id, cat_id)
+        print(f"Cascata antiga (favoritar + desfavoritar): {ms:.1f} ms")
+
+        categories = CategoryQueries()
+        ms_on, _ = _timed(categories.toggle_favorite_cascade, cat_id, user_id)
+        ms_page, (page, _) = _timed(recipes.search_page, user_id)
+        assert all(r['is_favorite'] for r in page)
+        ms_off, _ = _timed(categories.toggle_favorite_cascade, cat_id, user_id)
+        print(f"Resolução na leitura: favoritar {ms_on:.2f} ms, "
+              f"desfavoritar {ms_off:.2f} ms, 1ª página da busca {ms_page:.2f} ms")
+    finally:
+        db_module.close_all_pools()
+        os.remove(db_module.DB_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--recipes", type=int, default=50000)
+    run(parser.parse_args().recipes)
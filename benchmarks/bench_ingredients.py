@@ -0,0 +1,67 @@
+# ARQUIVO: benchmarks/bench_ingredients.py
+"""
+Benchmark: vazão do parser de ingredientes (linhas por segundo).
+
+O corpus combina quantidades, unidades e nomes em PT/EN (frações, faixas, "a gosto")
+e mede parse_ingredients com linhas todas distintas (cache frio) e com a repetição
+típica de um catálogo real (mesmas linhas em muitas receitas).
+
+Uso: python -m benchmarks.bench_ingredients [--lines 200000] [--distinct 5000]
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from src.utils.ingredient_parser import parse_ingredient, parse_ingredients
+
+QUANTITIES = ["1", "2", "3", "1/2", "1 1/2", "½", "1½", "2-3", "2 a 3", "1,5", "200", "meia", "uma", "¾", "10"]
+UNITS = ["xícara (chá) de", "xícaras de", "colher (sopa) de", "colheres de sopa de", "colher de chá de",
+         "g de", "kg de", "ml de", "litros de", "lata de", "dentes de", "pitada de", "cups", "tbsp", "tsp",
+         "oz", "", ""]
+NAMES = ["farinha de trigo", "açúcar", "leite", "manteiga sem sal", "ovos", "alho picado", "sal",
+         "azeite de oliva", "fermento químico", "cebola média", "all-purpose flour", "sugar",
+         "olive oil", "tomate sem pele", "chocolate em pó 50%", "creme de leite"]
+TO_TASTE = ["Sal a gosto", "Pimenta-do-reino a gosto", "salt to taste", "Azeite q.b.", "Cheiro-verde a gosto"]
+
+
+def distinct_lines(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    lines = []
+    while len(lines) < count:
+        if rng.random() < 0.08:
+            line = rng.choice(TO_TASTE)
+        else:
+            line = f"{rng.choice(QUANTITIES)} {rng.choice(UNITS)} {rng.choice(NAMES)}"
+        # Sufixo numerado garante linhas distintas (sem ajuda do cache)
+        lines.append(f"{line} ({len(lines)})" if rng.random() < 0.5 else f"- {line} {len(lines)}")
+    return lines
+
+
+def build_corpus(total: int, distinct: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    pool = distinct_lines(distinct, seed)
+    return [pool[rng.randrange(distinct)] for _ in range(total)]
+
+
+def _measure(lines: List[str]) -> float:
+    parse_ingredient.cache_clear()
+    start = time.perf_counter()
+    parse_ingredients(lines)
+    return len(lines) / (time.perf_counter() - start)
+
+
+def run(total: int, distinct: int):
+    unique = distinct_lines(total)
+    catalog = build_corpus(total, distinct)
+    print(f"{'cenário':<38} {'linhas':>9} {'linhas/s':>12}")
+    print(f"{'linhas distintas (cache frio)':<38} {len(unique):>9} {_measure(unique):>12,.0f}")
+    print(f"{'catálogo com repetições':<38} {len(catalog):>9} {_measure(catalog):>12,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--distinct", type=int, default=5_000)
+    args = parser.parse_args()
+    run(args.lines, args.distinct)
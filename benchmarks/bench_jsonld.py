@@ -0,0 +1,115 @@
+# ARQUIVO: benchmarks/bench_jsonld.py
+"""
+Benchmark: extração do JSON-LD de receitas, BeautifulSoup (antes) x varredura (depois).
+
+Sem --corpus, gera um corpus sintético com o perfil de sites de receita pesados
+(1-3 MB: menus, comentários, scripts de anúncio) e grava em --save, se informado.
+Com --corpus DIR, usa páginas salvas (*.html) desse diretório.
+
+Uso: python -m benchmarks.bench_jsonld [--corpus DIR] [--save DIR] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import random
+import time
+from typing import Dict
+
+from src.services.jsonld_extractor import extract_recipe, extract_recipe_soup
+
+RECIPE = {
+    "@context": "https://schema.org", "@type": "Recipe", "name": "Bolo de Cenoura",
+    "totalTime": "PT50M", "recipeYield": "12 porções",
+    "recipeIngredient": ["3 cenouras médias", "4 ovos", "2 xícaras de açúcar"],
+    "recipeInstructions": [{"@type": "HowToStep", "text": "Bata tudo."}],
+    "author": {"@type": "Person", "name": "Ana"},
+}
+
+
+def _filler(rng: random.Random, target_bytes: int) -> str:
+    """Marcação típica: menus, cards, comentários e scripts inline."""
+    parts, size = [], 0
+    while size < target_bytes:
+        n = rng.randint(1, 10 ** 6)
+        chunk = (
+            f'<div class="card card-{n}"><a href="/receita/{n}"><img src="/img/{n}.jpg" alt="Receita {n}">'
+            f'<span class="title">Receita número {n}</span></a><p>Comentário {n}: ficou ótimo &amp; fácil!</p>'
+            f'<ul class="menu"><li><a href="/c/{n % 50}">Categoria</a></li></ul></div>\n'
+        )
+        if n % 7 == 0:
+            chunk += f'<script>window.ads=window.ads||[];ads.push({{"slot":{n},"t":"<div>"}});</script>\n'
+        parts.append(chunk)
+        size += len(chunk)
+    return "".join(parts)
+
+
+def _ld(data) -> str:
+    return f'<script type="application/ld+json">{json.dumps(data, ensure_ascii=False)}</script>'
+
+
+def build_corpus(seed: int = 42) -> Dict[str, str]:
+    rng = random.Random(seed)
+    org = {"@context": "https://schema.org", "@type": "Organization", "name": "Portal"}
+    return {
+        # WordPress + Yoast: grafo no <head>
+        "yoast_head_1mb.html": f"<html><head>{_ld({'@context': 'https://schema.org', '@graph': [org, RECIPE]})}</head>"
+                               f"<body>{_filler(rng, 1_000_000)}</body></html>",
+        # Vários blocos, Recipe no fim do <body>
+        "multi_block_footer_2mb.html": f"<html><head>{_ld(org)}</head><body>{_filler(rng, 2_000_000)}"
+                                       f"{_ld([{'@type': 'BreadcrumbList'}, RECIPE])}</body></html>",
+        # Página sem receita estruturada
+        "no_jsonld_1_5mb.html": f"<html><head></head><body>{_filler(rng, 1_500_000)}</body></html>",
+        # Página muito pesada com receita no meio
+        "heavy_middle_3mb.html": f"<html><body>{_filler(rng, 1_500_000)}{_ld(RECIPE)}"
+                                 f"{_filler(rng, 1_500_000)}</body></html>",
+    }
+
+
+def _best_ms(fn, document: bytes, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(document)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def run(corpus: Dict[str, bytes], repeat: int):
+    print(f"{'página':<30} {'KB':>7} {'soup ms':>10} {'varredura ms':>13} {'ganho':>8}")
+    total_before = total_after = 0.0
+    for name, document in sorted(corpus.items()):
+        assert extract_recipe(document) == extract_recipe_soup(document), name
+        before = _best_ms(extract_recipe_soup, document, repeat)
+        after = _best_ms(extract_recipe, document, repeat)
+        total_before += before
+        total_after += after
+        print(f"{name:<30} {len(document) // 1024:>7} {before:>10.1f} {after:>13.2f} {before / after:>7.0f}x")
+    print(f"{'total':<30} {'':>7} {total_before:>10.1f} {total_after:>13.2f} {total_before / total_after:>7.0f}x")
+
+
+def _load_dir(directory: str) -> Dict[str, bytes]:
+    corpus = {}
+    for name in os.listdir(directory):
+        if name.endswith(".html"):
+            with open(os.path.join(directory, name), "rb") as f:
+                corpus[name] = f.read()
+    return corpus
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", help="Diretório com páginas salvas (*.html)")
+    parser.add_argument("--save", help="Grava o corpus sintético neste diretório")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.corpus:
+        pages = _load_dir(args.corpus)
+    else:
+        pages = {name: html.encode("utf-8") for name, html in build_corpus().items()}
+        if args.save:
+            os.makedirs(args.save, exist_ok=True)
+            for name, document in pages.items():
+                with open(os.path.join(args.save, name), "wb") as f:
+                    f.write(document)
+    run(pages, args.repeat)
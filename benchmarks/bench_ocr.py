@@ -0,0 +1,91 @@
+# ARQUIVO: benchmarks/bench_ocr.py
+"""
+Benchmark: OCR de fotos de página, imagem crua (antes) x pré-processada (depois) x cache.
+
+Sem --images, gera uma "foto de celular" sintética (4032 x 3024, JPEG, inclinada,
+com fundo de mesa em volta da página). Com --images, usa as fotos informadas.
+Sem pytesseract, mede só o pré-processamento (pixels entregues ao OCR e tempo).
+
+Uso: python -m benchmarks.bench_ocr [--images FOTO ...] [--repeat 3]
+"""
+import argparse
+import io
+import shutil
+import tempfile
+import time
+from typing import List, Tuple
+
+from src.services import ocr_service
+from src.services.ocr_service import ImageOcr, OcrCache, OcrSettings
+
+LINES = ["Bolo de Cenoura", "Ingredientes", "3 cenouras médias", "4 ovos", "1 xícara de óleo",
+         "2 xícaras de açúcar", "2 1/2 xícaras de farinha de trigo", "1 colher de sopa de fermento",
+         "Modo de preparo", "Bata as cenouras, os ovos e o óleo no liquidificador.",
+         "Misture o açúcar e a farinha; junte o fermento por último.",
+         "Asse em forno médio por 40 minutos."]
+
+
+def synthetic_photo() -> bytes:
+    from PIL import Image, ImageDraw, ImageFont
+    try:
+        font = ImageFont.load_default(size=64)
+    except TypeError:  # Pillow antigo: fonte bitmap sem tamanho
+        font = ImageFont.load_default()
+    page = Image.new("L", (2600, 3400), 238)
+    draw = ImageDraw.Draw(page)
+    for i, line in enumerate(LINES * 2):
+        draw.text((220, 260 + i * 120), line, fill=25, font=font)
+    photo = Image.new("L", (3024, 4032), 120)  # Mesa em volta da página
+    photo.paste(page.rotate(2.5, expand=True, fillcolor=120), (120, 120))
+    buffer = io.BytesIO()
+    photo.rotate(90, expand=True).convert("RGB").save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def _timed(fn, repeat: int) -> Tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(images: List[bytes], repeat: int):
+    from PIL import Image
+    print(f"{'imagem':<8} {'etapa':<28} {'pixels':>11} {'tempo (ms)':>11}")
+    cache_dir = tempfile.mkdtemp(prefix="bench_ocr_")
+    try:
+        for n, data in enumerate(images, 1):
+            raw = Image.open(io.BytesIO(data))
+            print(f"{n:<8} {'original':<28} {raw.width * raw.height:>11,}")
+            seconds, prepared = _timed(
+                lambda: ocr_service.preprocess_image(Image.open(io.BytesIO(data))), repeat)
+            print(f"{'':<8} {'pré-processamento':<28} {prepared.width * prepared.height:>11,} {seconds * 1000:>11.1f}")
+            if not ocr_service.HAS_TESSERACT:
+                continue
+            raw_ocr = OcrSettings(target_dpi=None, binarize=False)
+            seconds, _ = _timed(lambda: ocr_service.recognize_bytes(data, raw_ocr), repeat)
+            print(f"{'':<8} {'OCR imagem crua':<28} {'':>11} {seconds * 1000:>11.1f}")
+            seconds, _ = _timed(lambda: ocr_service.recognize_bytes(data, OcrSettings()), repeat)
+            print(f"{'':<8} {'OCR pré-processado':<28} {'':>11} {seconds * 1000:>11.1f}")
+            ocr = ImageOcr(cache=OcrCache(cache_dir))
+            ocr.bytes_to_text(data)
+            seconds, _ = _timed(lambda: ocr.bytes_to_text(data), repeat)
+            print(f"{'':<8} {'OCR em cache':<28} {'':>11} {seconds * 1000:>11.1f}")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--images", nargs="*", default=[])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    if not ocr_service.HAS_PIL:
+        raise SystemExit("Pillow não instalado: nada a medir.")
+    photos = []
+    for path in args.images:
+        with open(path, "rb") as f:
+            photos.append(f.read())
+    run(photos or [synthetic_photo()], args.repeat)
@@ -1,7 +1,9 @@
 # ARQUIVO: main.py
 import flet as ft
 import traceback
-from src.database.database import init_database
+from src.database.database import close_all_pools, init_database
+from src.database.auth_queries import init_password_hashing
+from src.database.session_queries import SESSION_PREF_KEY, purge_expired_sessions, validate_session
 from src.database.seeder import seed_native_recipes
 from src.core.logger import get_logger
 from src.utils.theme import AppThemes
@@ -34,6 +36,8 @@ def main(page: ft.Page):
         # 1. Banco de Dados
         init_database()
         seed_native_recipes()
+        init_password_hashing()
+        purge_expired_sessions()
 
         # 2. Configurações da Janela
         page.title = "Guia Mestre de Receitas"
@@ -51,7 +55,11 @@ def main(page: ft.Page):
         page.dark_theme = AppThemes.dark_theme
 
         # [IMPORTANTE] Dados de Sessão
-        page.data = {"logged_in_user": None}
+        # O token assinado fica no armazenamento do cliente; reconexões o validam
+        # (lookup por PK + cache) em vez de repetir a verificação bcrypt.
+        prefs = ft.SharedPreferences()
+        page.data = {"logged_in_user": None,
+                     "session_token": None, "prefs": prefs}
 
         # 3. Sistema de Roteamento
         def route_change(e: ft.RouteChangeEvent):
@@ -61,6 +69,13 @@ def main(page: ft.Page):
             try:
                 # Lógica de Roteamento
                 user = page.data.get("logged_in_user")
+                if user is None and page.data.get("session_token"):
+                    user = validate_session(page.data["session_token"])
+                    if user:
+                        logger.info(f"Sessão restaurada: {user.email}")
+                        page.data["logged_in_user"] = user
+                    else:
+                        page.data["session_token"] = None
                 is_auth = user is not None
 
                 if page.route == "/login":
@@ -110,13 +125,29 @@ def main(page: ft.Page):
         page.on_route_change = route_change
         page.on_view_pop = view_pop
 
-        # 4. Boot Inicial
-        logger.info("Forçando navegação inicial para /login")
-        page.go("/login")
+        # 4. Boot Inicial: tenta retomar a sessão salva no cliente
+        async def restore_session():
+            try:
+                page.data["session_token"] = await prefs.get(SESSION_PREF_KEY)
+            except Exception as ex:
+                logger.warning(f"Armazenamento do cliente indisponível: {ex}")
+            if page.data["session_token"]:
+                logger.info("Token de sessão encontrado. Validando...")
+                page.go("/")
+            else:
+                logger.info("Forçando navegação inicial para /login")
+                page.go("/login")
+
+        page.run_task(restore_session)
 
     except Exception as e:
         logger.critical("Falha Fatal no Boot do Main", exc_info=True)
 
 
 if __name__ == "__main__":
-    ft.app(target=main)
+    try:
+        ft.app(target=main)
+    finally:
+        # Fecha as conexões do pool: o último close faz o checkpoint e remove -wal/-shm
+        logger.info("=== ENCERRANDO APLICAÇÃO ===")
+        close_all_pools()
@@ -19,4 +19,8 @@ class ValidationError(AppError):
 
 class AuthenticationError(AppError):
     """Falhas de login, sessão expirada ou credenciais inválidas."""
-    pass
\ No newline at end of file
+    pass
+
+class ServiceBusyError(AppError):
+    """Recurso saturado (fila de trabalho cheia). A UI deve pedir nova tentativa."""
+    pass
@@ -1,18 +1,99 @@
 # ARQUIVO: src/database/auth_queries.py
+import asyncio
+import math
+import os
 import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
 import bcrypt
-from typing import Optional
 from src.core.logger import get_logger
-from src.core.exceptions import DatabaseError, AuthenticationError
-from src.database.database import get_db_connection
+from src.core.exceptions import DatabaseError, AuthenticationError, ServiceBusyError
+from src.database.database import db_connection
+from src.database.settings_queries import get_setting, set_setting
 from src.models.user_model import User
 
 logger = get_logger("src.database.auth")
 
+# Pool de autenticação: bcrypt libera o GIL, então threads escalam até os núcleos
+AUTH_WORKERS = max(2, min(4, os.cpu_count() or 1))
+AUTH_MAX_PENDING = AUTH_WORKERS * 4  # Em execução + na fila; acima disso, recusa
+
+T = TypeVar("T")
+
+# Custo do bcrypt calibrado por máquina (cada +1 dobra o tempo do hash)
+BCRYPT_TARGET_MS = int(os.environ.get("BCRYPT_TARGET_MS", "250"))
+BCRYPT_MIN_COST = 10  # Piso de segurança, mesmo em hardware lento
+BCRYPT_MAX_COST = 16
+_bcrypt_cost = 12  # Padrão do bcrypt.gensalt() até a calibração
+
+
+def get_bcrypt_cost() -> int:
+    return _bcrypt_cost
+
+
+def set_bcrypt_cost(cost: int):
+    """Define o custo usado em novos hashes (e como alvo do rehash no login)."""
+    global _bcrypt_cost
+    if not 4 <= cost <= 31:
+        raise ValueError(f"Custo bcrypt inválido: {cost}")
+    _bcrypt_cost = cost
+
+
+def measure_bcrypt_ms(cost: int, samples: int = 2) -> float:
+    """Melhor tempo (ms) de um hash bcrypt com o custo dado nesta máquina."""
+    salt = bcrypt.gensalt(rounds=cost)
+    best = math.inf
+    for _ in range(samples):
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibracao", salt)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def calibrate_bcrypt_cost(target_ms: int = BCRYPT_TARGET_MS, min_cost: int = BCRYPT_MIN_COST,
+                          max_cost: int = BCRYPT_MAX_COST) -> int:
+    """
+    Maior custo cujo hash fica dentro de `target_ms`. Mede só o custo mínimo e
+    extrapola (o tempo dobra a cada nível), mantendo a calibração rápida.
+    """
+    elapsed = max(measure_bcrypt_ms(min_cost), 0.001)
+    extra = math.floor(math.log2(target_ms / elapsed)) if target_ms > elapsed else 0
+    cost = max(min_cost, min(max_cost, min_cost + extra))
+    logger.info(
+        f"Calibração bcrypt: custo {min_cost} = {elapsed:.1f} ms; alvo {target_ms} ms -> custo {cost}.")
+    return cost
+
+
+def init_password_hashing(target_ms: int = BCRYPT_TARGET_MS, force: bool = False) -> int:
+    """
+    Inicialização: reutiliza o custo salvo para este banco/máquina ou calibra de novo
+    (primeira execução, alvo alterado ou `force`). Retorna o custo em uso.
+    """
+    stored_cost = get_setting("bcrypt_cost")
+    stored_target = get_setting("bcrypt_target_ms")
+    if stored_cost and stored_target == str(target_ms) and not force:
+        set_bcrypt_cost(int(stored_cost))
+    else:
+        set_bcrypt_cost(calibrate_bcrypt_cost(target_ms))
+        set_setting("bcrypt_cost", str(_bcrypt_cost))
+        set_setting("bcrypt_target_ms", str(target_ms))
+    return _bcrypt_cost
+
+
+def _hash_cost(hashed: str) -> Optional[int]:
+    """Custo gravado no hash ($2b$<custo>$...)."""
+    try:
+        return int(hashed.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
 def _hash_password(password: str) -> str:
     logger.debug("Iniciando hash da senha.")
     try:
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=_bcrypt_cost)
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
         return hashed
     except Exception as e:
@@ -28,19 +109,18 @@ def _verify_password(plain: str, hashed: str) -> bool:
 
 def register_user(full_name: str, email: str, password: str) -> Optional[User]:
     logger.info(f"Registro iniciado: {email}")
-    conn = None
     try:
         pwd_hash = _hash_password(password)
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "INSERT INTO users (full_name, email, hashed_password) VALUES (?, ?, ?)",
-            (full_name, email, pwd_hash)
-        )
-        conn.commit()
-        
-        user_id = cursor.lastrowid
+        with db_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES (?, ?, ?)",
+                (full_name, email, pwd_hash)
+            )
+            conn.commit()
+
+            user_id = cursor.lastrowid
         logger.info(f"Usuário registrado com sucesso ID: {user_id}")
         return User(id=user_id, full_name=full_name, email=email)
 
@@ -50,17 +130,14 @@ def register_user(full_name: str, email: str, password: str) -> Optional[User]:
     except sqlite3.Error as e:
         logger.error(f"Erro BD Registro: {e}")
         raise DatabaseError("Erro ao salvar usuário.", e)
-    finally:
-        if conn: conn.close()
 
 def get_user_by_email_and_password(email: str, password: str) -> Optional[User]:
     logger.info(f"Login iniciado: {email}")
-    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE email = ?", (email,))
-        row = cursor.fetchone()
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM users WHERE email = ?", (email,))
+            row = cursor.fetchone()
 
         if not row:
             logger.warning(f"Login falhou: Usuário não encontrado ({email})")
@@ -68,6 +145,8 @@ def get_user_by_email_and_password(email: str, password: str) -> Optional[User]:
 
         if _verify_password(password, row['hashed_password']):
             logger.info(f"Login sucesso: {email}")
+            if _hash_cost(row['hashed_password']) != _bcrypt_cost:
+                _rehash_password(row['id'], password, row['hashed_password'])
             return User(id=row['id'], full_name=row['full_name'], email=row['email'])
         else:
             logger.warning(f"Login falhou: Senha incorreta ({email})")
@@ -75,5 +154,79 @@ def get_user_by_email_and_password(email: str, password: str) -> Optional[User]:
     except Exception as e:
         logger.error(f"Erro Login: {e}")
         return None
-    finally:
-        if conn: conn.close()
\ No newline at end of file
+
+
+def _rehash_password(user_id: int, password: str, old_hash: str):
+    """Atualiza o hash para o custo atual (só possível com a senha em claro, no login)."""
+    try:
+        new_hash = _hash_password(password)
+        with db_connection() as conn:
+            # Condicional: não sobrescreve uma troca de senha concorrente
+            conn.execute("UPDATE users SET hashed_password = ? WHERE id = ? AND hashed_password = ?",
+                         (new_hash, user_id, old_hash))
+            conn.commit()
+        logger.info(
+            f"Hash do usuário {user_id} atualizado: custo {_hash_cost(old_hash)} -> {_bcrypt_cost}.")
+    except Exception as e:
+        # Falha no rehash não impede o login
+        logger.warning(f"Rehash de senha falhou (usuário {user_id}): {e}")
+
+
+# --- API ASSÍNCRONA (não bloqueia o loop de eventos do Flet) ---
+class AuthWorkerPool:
+    """
+    Executa o trabalho de bcrypt (hash/verificação + consulta) em threads.
+    Backpressure: no máximo `max_pending` tarefas aceitas ao mesmo tempo; além
+    disso levanta ServiceBusyError na hora, em vez de enfileirar sem limite.
+    """
+
+    def __init__(self, max_workers: int = AUTH_WORKERS, max_pending: int = AUTH_MAX_PENDING):
+        self.max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="auth")
+            return self._executor
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        if not self._slots.acquire(blocking=False):
+            logger.warning("Pool de autenticação saturado. Requisição recusada.")
+            raise ServiceBusyError(
+                "Muitas tentativas simultâneas. Tente novamente em instantes.")
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        # O slot só volta quando a thread termina (mesmo que quem aguarda seja cancelado)
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+_auth_pool = AuthWorkerPool()
+
+
+async def register_user_async(full_name: str, email: str, password: str) -> Optional[User]:
+    """Versão assíncrona de register_user (ServiceBusyError se o pool estiver cheio)."""
+    return await _auth_pool.run(register_user, full_name, email, password)
+
+
+async def get_user_by_email_and_password_async(email: str, password: str) -> Optional[User]:
+    """Versão assíncrona do login (ServiceBusyError se o pool estiver cheio)."""
+    return await _auth_pool.run(get_user_by_email_and_password, email, password)
+
+
+def shutdown_auth_pool():
+    """Encerra as threads de autenticação (shutdown da aplicação e testes)."""
+    _auth_pool.shutdown()
@@ -1,151 +1,198 @@
 # ARQUIVO: src/database/category_queries.py
 import sqlite3
-from typing import List, Optional, Dict  # <--- [CORREÇÃO] Adicionado Dict
+import threading
+from typing import List, Optional, Dict, Tuple  # <--- [CORREÇÃO] Adicionado Dict
 from src.core.logger import get_logger
 from src.core.exceptions import DatabaseError
-from src.database.database import get_db_connection
+from src.database.database import db_connection, get_db_path
+from src.database.migrations import DEFAULT_CATEGORIES, seed_default_categories
+from src.database.recipe_queries import invalidate_details_cache
 from src.models.recipe_model import Category
 
 logger = get_logger("src.database.category")
 
-DEFAULT_CATEGORIES = [
-    "Café da Manhã", "Almoço", "Jantar", "Sobremesas",
-    "Lanches", "Bebidas", "Fitness", "Low Carb",
-    "Vegano", "Massas", "Carnes", "Peixes"
-]
+CategoryRow = Tuple[int, str, Optional[int], bool]
+
+
+class _CategoryCache:
+    """
+    Cache de processo das listas de categorias, por (banco, usuário).
+    Guarda linhas imutáveis; cada leitura monta modelos novos (a UI pode alterá-los).
+    A geração impede que uma leitura concorrente grave dados anteriores a uma invalidação.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows: Dict[Tuple[str, int], List[CategoryRow]] = {}
+        self._generation = 0
+
+    def get(self, key: Tuple[str, int]) -> Tuple[Optional[List[CategoryRow]], int]:
+        with self._lock:
+            return self._rows.get(key), self._generation
+
+    def put(self, key: Tuple[str, int], rows: List[CategoryRow], generation: int):
+        with self._lock:
+            if generation == self._generation:
+                self._rows[key] = rows
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """Descarta a lista de um usuário ou, sem argumento, de todos."""
+        with self._lock:
+            self._generation += 1
+            if user_id is None:
+                self._rows.clear()
+            else:
+                for key in [k for k in self._rows if k[1] == user_id]:
+                    del self._rows[key]
+
+
+_cache = _CategoryCache()
+
+
+def invalidate_category_cache(user_id: Optional[int] = None):
+    """Chamar após alterar categorias fora de CategoryQueries (ex.: seeder)."""
+    _cache.invalidate(user_id)
 
 
 class CategoryQueries:
     """Gerenciador de dados de Categorias."""
 
     def _get_conn(self):
-        return get_db_connection()
+        """Empresta uma conexão do pool (usar com `with`)."""
+        return db_connection()
 
     def init_default_categories(self):
-        conn = self._get_conn()
-        if not conn:
-            return
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT COUNT(*) FROM categories WHERE user_id IS NULL")
-            if cursor.fetchone()[0] == 0:
-                for cat_name in DEFAULT_CATEGORIES:
-                    cursor.execute(
-                        "INSERT INTO categories (name) VALUES (?)", (cat_name,))
+        """Garante as categorias padrão (já feito pela migração 006 na inicialização)."""
+        with self._get_conn() as conn:
+            try:
+                created = seed_default_categories(conn.cursor())
                 conn.commit()
-        except sqlite3.Error as e:
-            logger.error(f"Erro seed: {e}")
-        finally:
-            conn.close()
+                if created > 0:
+                    invalidate_category_cache()
+            except sqlite3.Error as e:
+                logger.error(f"Erro seed: {e}")
 
     def get_all_categories_for_user(self, user_id: int) -> List[Category]:
-        self.init_default_categories()
-        conn = self._get_conn()
-        try:
-            cursor = conn.cursor()
-            # Traz categorias e flag de favorito
-            sql = """
-                SELECT DISTINCT c.id, c.name, c.user_id,
-                       CASE WHEN fc.user_id IS NOT NULL THEN 1 ELSE 0 END as is_fav
-                FROM categories c
-                LEFT JOIN favorite_categories fc ON c.id = fc.category_id AND fc.user_id = ?
-                WHERE c.user_id IS NULL OR c.user_id = ? OR fc.user_id IS NOT NULL
-                ORDER BY c.name ASC
-            """
-            cursor.execute(sql, (user_id, user_id))
-            return [Category(id=r[0], name=r[1], user_id=r[2], is_favorite=bool(r[3])) for r in cursor.fetchall()]
-        except sqlite3.Error as e:
-            logger.error(f"Erro get cats: {e}")
-            return []
-        finally:
-            conn.close()
+        return [Category(id=r[0], name=r[1], user_id=r[2], is_favorite=r[3])
+                for r in self._category_rows(user_id)]
+
+    def _category_rows(self, user_id: int) -> List[CategoryRow]:
+        key = (get_db_path(), user_id)
+        rows, generation = _cache.get(key)
+        if rows is not None:
+            return rows
+
+        with self._get_conn() as conn:
+            try:
+                cursor = conn.cursor()
+                # Traz categorias e flag de favorito
+                sql = """
+                    SELECT DISTINCT c.id, c.name, c.user_id,
+                           CASE WHEN fc.user_id IS NOT NULL THEN 1 ELSE 0 END as is_fav
+                    FROM categories c
+                    LEFT JOIN favorite_categories fc ON c.id = fc.category_id AND fc.user_id = ?
+                    WHERE c.user_id IS NULL OR c.user_id = ? OR fc.user_id IS NOT NULL
+                    ORDER BY c.name ASC
+                """
+                cursor.execute(sql, (user_id, user_id))
+                rows = [(r[0], r[1], r[2], bool(r[3]))
+                        for r in cursor.fetchall()]
+            except sqlite3.Error as e:
+                logger.error(f"Erro get cats: {e}")
+                return []
+
+        _cache.put(key, rows, generation)
+        return rows
 
     def add_category(self, name: str, user_id: int) -> Optional[Category]:
-        conn = self._get_conn()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO categories (name, user_id) VALUES (?, ?)", (name, user_id))
-            conn.commit()
-            return Category(id=cursor.lastrowid, name=name, user_id=user_id)
-        except:
-            return None
-        finally:
-            conn.close()
+        with self._get_conn() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "INSERT INTO categories (name, user_id) VALUES (?, ?)", (name, user_id))
+                conn.commit()
+                _cache.invalidate(user_id)
+                return Category(id=cursor.lastrowid, name=name, user_id=user_id)
+            except:
+                return None
 
     def delete_category(self, cat_id: int, user_id: int) -> bool:
-        conn = self._get_conn()
-        try:
-            c = conn.execute(
-                "DELETE FROM categories WHERE id=? AND user_id=?", (cat_id, user_id))
-            conn.commit()
-            return c.rowcount > 0
-        except:
-            return False
-        finally:
-            conn.close()
+        with self._get_conn() as conn:
+            try:
+                c = conn.execute(
+                    "DELETE FROM categories WHERE id=? AND user_id=?", (cat_id, user_id))
+                conn.commit()
+                if c.rowcount > 0:
+                    # Outros usuários podem tê-la nas listas (favorita): descarta todas
+                    _cache.invalidate()
+                    # recipes.category_id virou NULL (ON DELETE SET NULL) nas receitas em cache
+                    invalidate_details_cache()
+                return c.rowcount > 0
+            except:
+                return False
 
     # --- LÓGICA DE FAVORITO CASCATA ---
+    # Linhas do próprio usuário (prefixo user_id da PK) cujas receitas são da categoria
+    _IN_CATEGORY = """
+        user_id = ? AND EXISTS (SELECT 1 FROM recipes r
+                                WHERE r.id = {table}.recipe_id AND r.category_id = ?)
+    """
+
     def toggle_favorite_cascade(self, cat_id: int, user_id: int) -> bool:
         """
         Favorita Categoria + Todas as Receitas dela.
+        As receitas herdam o favorito na leitura (migração 007): o custo independe do
+        tamanho da categoria e só toca as linhas de favoritos/exclusões do usuário.
         """
-        conn = self._get_conn()
-        try:
-            cursor = conn.cursor()
-            conn.execute("BEGIN")
-
-            # Verifica estado
-            cursor.execute(
-                "SELECT 1 FROM favorite_categories WHERE user_id=? AND category_id=?", (user_id, cat_id))
-            exists = cursor.fetchone()
-
-            is_fav = False
-            if exists:
-                # Remove da Categoria
-                cursor.execute(
-                    "DELETE FROM favorite_categories WHERE user_id=? AND category_id=?", (user_id, cat_id))
-                # Remove das Receitas
-                cursor.execute("""
-                    DELETE FROM favorite_recipes 
-                    WHERE user_id=? AND recipe_id IN (SELECT id FROM recipes WHERE category_id=?)
-                """, (user_id, cat_id))
-                is_fav = False
-            else:
-                # Adiciona na Categoria
+        with self._get_conn() as conn:
+            try:
+                cursor = conn.cursor()
+                conn.execute("BEGIN")
+
+                # Verifica estado
                 cursor.execute(
-                    "INSERT INTO favorite_categories (user_id, category_id) VALUES (?,?)", (user_id, cat_id))
-                # Adiciona nas Receitas (INSERT OR IGNORE)
-                cursor.execute("""
-                    INSERT OR IGNORE INTO favorite_recipes (user_id, recipe_id)
-                    SELECT ?, id FROM recipes WHERE category_id=?
-                """, (user_id, cat_id))
-                is_fav = True
-
-            conn.commit()
-            return is_fav
-        except sqlite3.Error as e:
-            conn.rollback()
-            logger.error(f"Erro cascade: {e}")
-            return False
-        finally:
-            conn.close()
+                    "SELECT 1 FROM favorite_categories WHERE user_id=? AND category_id=?", (user_id, cat_id))
+                exists = cursor.fetchone()
+
+                # Desmarcações individuais deixam de valer nos dois sentidos
+                cursor.execute("DELETE FROM favorite_recipe_exclusions WHERE " +
+                               self._IN_CATEGORY.format(table="favorite_recipe_exclusions"), (user_id, cat_id))
+                if exists:
+                    # Remove da Categoria
+                    cursor.execute(
+                        "DELETE FROM favorite_categories WHERE user_id=? AND category_id=?", (user_id, cat_id))
+                    # Remove das Receitas (favoritos diretos do usuário nessa categoria)
+                    cursor.execute("DELETE FROM favorite_recipes WHERE " +
+                                   self._IN_CATEGORY.format(table="favorite_recipes"), (user_id, cat_id))
+                    is_fav = False
+                else:
+                    # Adiciona na Categoria (as receitas herdam na leitura)
+                    cursor.execute(
+                        "INSERT INTO favorite_categories (user_id, category_id) VALUES (?,?)", (user_id, cat_id))
+                    is_fav = True
+
+                conn.commit()
+                _cache.invalidate(user_id)
+                return is_fav
+            except sqlite3.Error as e:
+                conn.rollback()
+                logger.error(f"Erro cascade: {e}")
+                return False
 
     def get_user_categories(self, user_id: int) -> List[Dict]:
         """Retorna dicionários para Dropdown."""
-        cats = self.get_all_categories_for_user(user_id)
-        return [{'id': c.id, 'name': c.name} for c in cats]
+        return [{'id': r[0], 'name': r[1]} for r in self._category_rows(user_id)]
 
     def update_category(self, cat_id: int, name: str, user_id: int) -> bool:
-        conn = self._get_conn()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE categories SET name=? WHERE id=? AND user_id=?", (name, cat_id, user_id))
-            conn.commit()
-            return cursor.rowcount > 0
-        except:
-            return False
-        finally:
-            conn.close()
+        with self._get_conn() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "UPDATE categories SET name=? WHERE id=? AND user_id=?", (name, cat_id, user_id))
+                conn.commit()
+                if cursor.rowcount > 0:
+                    # Quem favoritou a categoria também guarda o nome: descarta todas as listas
+                    _cache.invalidate()
+                return cursor.rowcount > 0
+            except:
+                return False
@@ -1,14 +1,24 @@
 # ARQUIVO: src/database/database.py
 import sqlite3
 import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
 from src.core.logger import get_logger
 from src.core.exceptions import DatabaseError
+from src.database.migrations import apply_migrations
 
 logger = get_logger("src.database")
 DB_DIR = "data"
 DB_NAME = "recipes.db"
 DB_PATH = os.path.join(DB_DIR, DB_NAME)
 
+# Pool de Conexões (modo web: várias sessões simultâneas)
+POOL_MAX_SIZE = 8
+POOL_TIMEOUT = 10.0  # Segundos aguardando uma conexão livre
+BUSY_TIMEOUT_MS = 5000
+
 
 def get_db_path():
     if not os.path.exists(DB_DIR):
@@ -16,101 +26,178 @@ def get_db_path():
     return DB_PATH
 
 
+def _configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Aplica Row Factory e PRAGMAs de sessão (uma única vez por conexão)."""
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS};")
+    return conn
+
+
 def get_db_connection():
-    """Retorna uma conexão configurada com Row Factory."""
+    """Retorna uma conexão configurada com Row Factory (não gerenciada pelo pool)."""
     try:
         conn = sqlite3.connect(get_db_path())
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return _configure_connection(conn)
     except sqlite3.Error as e:
         logger.error(f"Falha de conexão SQLite: {e}")
         raise DatabaseError("Não foi possível conectar ao banco de dados.", e)
 
 
+class ConnectionPool:
+    """
+    Pool limitado de conexões SQLite reutilizáveis.
+    - Cada conexão é configurada uma única vez (PRAGMAs) e reaproveitada.
+    - Health check (SELECT 1) antes de entregar uma conexão ociosa.
+    - Consciente de threads: a mesma thread reaproveita a conexão que já possui
+      (chamadas aninhadas não consomem um novo slot nem causam deadlock).
+    """
+
+    def __init__(self, db_path: str, max_size: int = POOL_MAX_SIZE, timeout: float = POOL_TIMEOUT):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._local = threading.local()
+        self._closed = False
+
+    def _create(self) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000)
+            return _configure_connection(conn)
+        except sqlite3.Error as e:
+            logger.error(f"Falha de conexão SQLite (pool): {e}")
+            raise DatabaseError("Não foi possível conectar ao banco de dados.", e)
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def acquire(self) -> sqlite3.Connection:
+        """Empresta uma conexão. Bloqueia até `timeout` se o pool estiver esgotado."""
+        if self._closed:
+            raise DatabaseError("Pool de conexões encerrado.")
+        if not self._slots.acquire(timeout=self.timeout):
+            logger.error(f"Pool esgotado ({self.max_size} conexões em uso).")
+            raise DatabaseError("Banco de dados ocupado. Tente novamente.")
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._create()
+                if self._is_healthy(conn):
+                    return conn
+                logger.warning("Conexão inválida descartada do pool.")
+                self._discard(conn)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn: sqlite3.Connection):
+        """Devolve a conexão ao pool, desfazendo transações esquecidas."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            if self._closed:
+                self._discard(conn)
+            else:
+                self._idle.put(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Conexão descartada na devolução: {e}")
+            self._discard(conn)
+        finally:
+            self._slots.release()
+
+    @staticmethod
+    def _discard(conn: sqlite3.Connection):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Context manager de empréstimo (reentrante por thread)."""
+        owned = getattr(self._local, "conn", None)
+        if owned is not None:
+            self._local.depth += 1
+            try:
+                yield owned
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self.acquire()
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield conn
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            self.release(conn)
+
+    def close(self):
+        """Fecha todas as conexões ociosas e impede novos empréstimos."""
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Retorna o pool associado ao caminho atual do banco (criado sob demanda)."""
+    path = get_db_path()
+    pool = _pools.get(path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(path)
+            if pool is None:
+                pool = ConnectionPool(path)
+                _pools[path] = pool
+    return pool
+
+
+@contextmanager
+def db_connection() -> Iterator[sqlite3.Connection]:
+    """Empresta uma conexão do pool: `with db_connection() as conn: ...`"""
+    with get_pool().connection() as conn:
+        yield conn
+
+
+def close_all_pools():
+    """Encerra todos os pools (shutdown da aplicação e teardown de testes)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
 def init_database():
-    """Inicializa o esquema do banco de dados (Migrations Simplificadas)."""
+    """Inicializa/atualiza o esquema do banco via migrações versionadas (PRAGMA user_version)."""
     logger.info("Iniciando verificação de esquema do Banco de Dados...")
-    conn = None
     try:
-        conn = get_db_connection()
-        # [CRÍTICO] Modo WAL evita travamentos de leitura/escrita simultânea
-        conn.execute("PRAGMA journal_mode=WAL;")
-        cursor = conn.cursor()
-
-        tables = {
-            "users": """
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    full_name TEXT NOT NULL,
-                    email TEXT NOT NULL UNIQUE,
-                    hashed_password TEXT NOT NULL
-                );
-            """,
-            "categories": """
-                CREATE TABLE IF NOT EXISTS categories (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL UNIQUE,
-                    user_id INTEGER,
-                    icon TEXT DEFAULT 'restaurant_menu',
-                    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
-                    UNIQUE(name, user_id)
-                );
-            """,
-            "favorite_categories": """
-                CREATE TABLE IF NOT EXISTS favorite_categories (
-                    user_id INTEGER NOT NULL,
-                    category_id INTEGER NOT NULL,
-                    PRIMARY KEY (user_id, category_id),
-                    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
-                    FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE CASCADE
-                );
-            """,
-            "recipes": """
-                CREATE TABLE IF NOT EXISTS recipes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    category_id INTEGER,
-                    title TEXT NOT NULL,
-                    preparation_time INTEGER,
-                    servings TEXT,
-                    instructions TEXT NOT NULL,
-                    additional_instructions TEXT,
-                    source TEXT,
-                    image_path TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
-                    FOREIGN KEY (category_id) REFERENCES categories(id) ON DELETE SET NULL
-                );
-            """,
-            "favorite_recipes": """
-                CREATE TABLE IF NOT EXISTS favorite_recipes (
-                    user_id INTEGER NOT NULL,
-                    recipe_id INTEGER NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (user_id, recipe_id),
-                    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
-                    FOREIGN KEY (recipe_id) REFERENCES recipes (id) ON DELETE CASCADE
-                );
-            """,
-            "recipe_ingredients": """
-                CREATE TABLE IF NOT EXISTS recipe_ingredients (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    recipe_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    quantity TEXT,
-                    unit TEXT,
-                    FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE
-                );
-            """
-        }
-
-        for table_name, query in tables.items():
-            cursor.execute(query)
-            logger.debug(f"Tabela verificada/criada: {table_name}")
-
-        conn.commit()
+        with db_connection() as conn:
+            # [CRÍTICO] Modo WAL evita travamentos de leitura/escrita simultânea
+            conn.execute("PRAGMA journal_mode=WAL;")
+            apply_migrations(conn)
         logger.info("Banco de dados atualizado e verificado com sucesso.")
 
     except sqlite3.Error as e:
@@ -118,6 +205,3 @@ def init_database():
             f"Erro Crítico Geral no Banco de Dados: {e}", exc_info=True)
         raise DatabaseError(
             "Falha na inicialização do esquema do banco de dados.", e)
-    finally:
-        if conn:
-            conn.close()
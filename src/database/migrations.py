@@ -0,0 +1,439 @@
+# ARQUIVO: src/database/migrations.py
+"""
+Migrações versionadas do esquema SQLite.
+
+A versão aplicada fica em `PRAGMA user_version`. Cada migração numerada roda
+uma única vez, dentro de sua própria transação, e a inicialização é instantânea
+quando o banco já está na versão mais recente.
+"""
+import sqlite3
+from typing import Callable, Dict, List, Tuple
+from src.core.logger import get_logger
+from src.utils.schema_org import servings_count
+
+logger = get_logger("src.database.migrations")
+
+# --- 001: ESQUEMA BASE ---
+BASE_TABLES = {
+    "users": """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            full_name TEXT NOT NULL,
+            email TEXT NOT NULL UNIQUE,
+            hashed_password TEXT NOT NULL
+        );
+    """,
+    "categories": """
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            user_id INTEGER,
+            icon TEXT DEFAULT 'restaurant_menu',
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
+            UNIQUE(name, user_id)
+        );
+    """,
+    "favorite_categories": """
+        CREATE TABLE IF NOT EXISTS favorite_categories (
+            user_id INTEGER NOT NULL,
+            category_id INTEGER NOT NULL,
+            PRIMARY KEY (user_id, category_id),
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
+            FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE CASCADE
+        );
+    """,
+    "recipes": """
+        CREATE TABLE IF NOT EXISTS recipes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            category_id INTEGER,
+            title TEXT NOT NULL,
+            preparation_time INTEGER,
+            servings TEXT,
+            instructions TEXT NOT NULL,
+            additional_instructions TEXT,
+            source TEXT,
+            image_path TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
+            FOREIGN KEY (category_id) REFERENCES categories(id) ON DELETE SET NULL
+        );
+    """,
+    "favorite_recipes": """
+        CREATE TABLE IF NOT EXISTS favorite_recipes (
+            user_id INTEGER NOT NULL,
+            recipe_id INTEGER NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (user_id, recipe_id),
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
+            FOREIGN KEY (recipe_id) REFERENCES recipes (id) ON DELETE CASCADE
+        );
+    """,
+    "recipe_ingredients": """
+        CREATE TABLE IF NOT EXISTS recipe_ingredients (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            recipe_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            quantity TEXT,
+            unit TEXT,
+            FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE
+        );
+    """
+}
+
+
+def _create_base_tables(cursor: sqlite3.Cursor):
+    for table_name, query in BASE_TABLES.items():
+        cursor.execute(query)
+        logger.debug(f"Tabela verificada/criada: {table_name}")
+
+
+# --- 002: ÍNDICE DE BUSCA TEXTUAL (FTS5) ---
+# Uma linha por receita (rowid = recipes.id) com título, preparo, dicas e
+# nomes dos ingredientes concatenados. Mantido em sincronia por triggers.
+FTS_TABLE = "recipes_fts"
+# Normalização PT-BR feita pelo tokenizer na escrita e na consulta:
+# caixa e acentos ignorados ("acucar" encontra "Açúcar", "pao" encontra "Pão").
+FTS_TOKENIZE = "unicode61 remove_diacritics 2"
+
+FTS_TABLE_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, instructions, additional_instructions, ingredients,
+        tokenize = '{FTS_TOKENIZE}'
+    );
+"""
+
+_FTS_INGREDIENTS = "(SELECT group_concat(name, ' ') FROM recipe_ingredients WHERE recipe_id = {rid})"
+
+def _fts_triggers(insert_when: str = "") -> Dict[str, str]:
+    """
+    Triggers de sincronização do FTS.
+    `insert_when` condiciona os triggers de INSERT (pausa da importação em lote, migração 004).
+    """
+    when = insert_when
+    return {
+        "recipes_fts_ai": f"""
+            CREATE TRIGGER IF NOT EXISTS recipes_fts_ai AFTER INSERT ON recipes {when}BEGIN
+                INSERT INTO {FTS_TABLE} (rowid, title, instructions, additional_instructions, ingredients)
+                VALUES (new.id, new.title, new.instructions, new.additional_instructions,
+                        {_FTS_INGREDIENTS.format(rid="new.id")});
+            END;
+        """,
+        "recipes_fts_au": f"""
+            CREATE TRIGGER IF NOT EXISTS recipes_fts_au
+            AFTER UPDATE OF title, instructions, additional_instructions ON recipes BEGIN
+                UPDATE {FTS_TABLE}
+                SET title = new.title, instructions = new.instructions,
+                    additional_instructions = new.additional_instructions
+                WHERE rowid = new.id;
+            END;
+        """,
+        "recipes_fts_ad": f"""
+            CREATE TRIGGER IF NOT EXISTS recipes_fts_ad AFTER DELETE ON recipes BEGIN
+                DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+            END;
+        """,
+        "recipe_ingredients_fts_ai": f"""
+            CREATE TRIGGER IF NOT EXISTS recipe_ingredients_fts_ai AFTER INSERT ON recipe_ingredients {when}BEGIN
+                UPDATE {FTS_TABLE} SET ingredients = {_FTS_INGREDIENTS.format(rid="new.recipe_id")}
+                WHERE rowid = new.recipe_id;
+            END;
+        """,
+        "recipe_ingredients_fts_au": f"""
+            CREATE TRIGGER IF NOT EXISTS recipe_ingredients_fts_au AFTER UPDATE OF name, recipe_id ON recipe_ingredients BEGIN
+                UPDATE {FTS_TABLE} SET ingredients = {_FTS_INGREDIENTS.format(rid="old.recipe_id")}
+                WHERE rowid = old.recipe_id;
+                UPDATE {FTS_TABLE} SET ingredients = {_FTS_INGREDIENTS.format(rid="new.recipe_id")}
+                WHERE rowid = new.recipe_id;
+            END;
+        """,
+        "recipe_ingredients_fts_ad": f"""
+            CREATE TRIGGER IF NOT EXISTS recipe_ingredients_fts_ad AFTER DELETE ON recipe_ingredients BEGIN
+                UPDATE {FTS_TABLE} SET ingredients = {_FTS_INGREDIENTS.format(rid="old.recipe_id")}
+                WHERE rowid = old.recipe_id;
+            END;
+        """,
+    }
+
+
+FTS_TRIGGERS = _fts_triggers()
+
+# Indexa linhas de `recipes` no FTS (backfill; aceita filtro WHERE concatenado)
+FTS_INDEX_ROWS_SQL = f"""
+    INSERT INTO {FTS_TABLE} (rowid, title, instructions, additional_instructions, ingredients)
+    SELECT r.id, r.title, r.instructions, r.additional_instructions,
+           {_FTS_INGREDIENTS.format(rid="r.id")}
+    FROM recipes r
+"""
+
+
+def _ensure_search_index(cursor: sqlite3.Cursor):
+    """Cria o índice FTS5 + triggers e indexa receitas pré-existentes."""
+    cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,))
+    row = cursor.fetchone()
+    is_new = row is None
+
+    # Índice criado com outro tokenizer (ex.: sem remove_diacritics): reconstrói
+    if row and FTS_TOKENIZE not in row[0]:
+        logger.info("Tokenizer do índice de busca desatualizado. Reconstruindo...")
+        cursor.execute(f"DROP TABLE {FTS_TABLE}")
+        is_new = True
+
+    cursor.execute(FTS_TABLE_SQL)
+    for trigger_name, query in FTS_TRIGGERS.items():
+        cursor.execute(query)
+        logger.debug(f"Trigger verificado/criado: {trigger_name}")
+
+    if is_new:
+        cursor.execute(FTS_INDEX_ROWS_SQL)
+        logger.info(f"Índice de busca criado: {cursor.rowcount} receitas indexadas.")
+
+
+# --- 003: ÍNDICES SECUNDÁRIOS ---
+SECONDARY_INDEXES = {
+    "idx_recipes_user_created": "CREATE INDEX IF NOT EXISTS idx_recipes_user_created ON recipes (user_id, created_at)",
+    "idx_recipes_category": "CREATE INDEX IF NOT EXISTS idx_recipes_category ON recipes (category_id)",
+    "idx_recipes_title": "CREATE INDEX IF NOT EXISTS idx_recipes_title ON recipes (title)",
+    "idx_recipe_ingredients_recipe": "CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_recipe ON recipe_ingredients (recipe_id)",
+    "idx_favorite_recipes_recipe": "CREATE INDEX IF NOT EXISTS idx_favorite_recipes_recipe ON favorite_recipes (recipe_id)",
+    "idx_categories_user": "CREATE INDEX IF NOT EXISTS idx_categories_user ON categories (user_id)",
+}
+
+
+def _create_secondary_indexes(cursor: sqlite3.Cursor):
+    for index_name, query in SECONDARY_INDEXES.items():
+        cursor.execute(query)
+        logger.debug(f"Índice verificado/criado: {index_name}")
+
+
+# --- 004: PAUSA DA SINCRONIZAÇÃO FTS (IMPORTAÇÃO EM LOTE) ---
+# Enquanto houver uma linha nesta tabela, os triggers de INSERT não atualizam o FTS;
+# quem pausou reindexa as receitas inseridas antes do COMMIT. Como a linha só existe
+# dentro da transação de escrita, outras conexões nunca enxergam a pausa.
+FTS_PAUSE_TABLE = "search_index_pause"
+
+
+def _add_search_index_pause(cursor: sqlite3.Cursor):
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {FTS_PAUSE_TABLE} (
+            id INTEGER PRIMARY KEY CHECK (id = 1)
+        );
+    """)
+    triggers = _fts_triggers(
+        insert_when=f"WHEN NOT EXISTS (SELECT 1 FROM {FTS_PAUSE_TABLE}) ")
+    for trigger_name in ("recipes_fts_ai", "recipe_ingredients_fts_ai"):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+        cursor.execute(triggers[trigger_name])
+        logger.debug(f"Trigger recriado com pausa: {trigger_name}")
+
+
+# --- 005: CONTROLE DO SEED INCREMENTAL ---
+# Hash de conteúdo de cada receita nativa já semeada. SET NULL (e não CASCADE):
+# uma receita nativa apagada pelo usuário não deve ser recriada no próximo seed.
+def _create_native_seed_table(cursor: sqlite3.Cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS native_recipe_seeds (
+            content_hash TEXT PRIMARY KEY,
+            recipe_id INTEGER,
+            seeded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (recipe_id) REFERENCES recipes (id) ON DELETE SET NULL
+        ) WITHOUT ROWID;
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_native_recipe_seeds_recipe ON native_recipe_seeds (recipe_id)")
+
+
+# --- 006: CATEGORIAS PADRÃO (antes semeadas a cada leitura da lista) ---
+DEFAULT_CATEGORIES = [
+    "Café da Manhã", "Almoço", "Jantar", "Sobremesas",
+    "Lanches", "Bebidas", "Fitness", "Low Carb",
+    "Vegano", "Massas", "Carnes", "Peixes"
+]
+
+
+def seed_default_categories(cursor: sqlite3.Cursor) -> int:
+    """Insere as categorias de sistema ausentes (idempotente). Retorna quantas criou."""
+    cursor.executemany("INSERT OR IGNORE INTO categories (name) VALUES (?)",
+                       [(name,) for name in DEFAULT_CATEGORIES])
+    return cursor.rowcount
+
+
+# --- 007: FAVORITO DE CATEGORIA RESOLVIDO NA LEITURA ---
+# Uma receita é favorita se foi favoritada diretamente OU se sua categoria é favorita
+# e ela não foi desmarcada individualmente (exclusão). Favoritar uma categoria vira
+# uma única linha em favorite_categories, em vez de uma linha por receita.
+def _resolve_category_favorites_on_read(cursor: sqlite3.Cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS favorite_recipe_exclusions (
+            user_id INTEGER NOT NULL,
+            recipe_id INTEGER NOT NULL,
+            PRIMARY KEY (user_id, recipe_id),
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
+            FOREIGN KEY (recipe_id) REFERENCES recipes (id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+    """)
+    # Preserva o estado atual: receitas de categorias favoritas sem linha em
+    # favorite_recipes tinham sido desmarcadas (ou chegaram depois da cascata).
+    cursor.execute("""
+        INSERT OR IGNORE INTO favorite_recipe_exclusions (user_id, recipe_id)
+        SELECT fc.user_id, r.id
+        FROM favorite_categories fc
+        JOIN recipes r ON r.category_id = fc.category_id
+        WHERE NOT EXISTS (SELECT 1 FROM favorite_recipes fr
+                          WHERE fr.user_id = fc.user_id AND fr.recipe_id = r.id)
+    """)
+    # Linhas geradas pela cascata agora são implícitas
+    cursor.execute("""
+        DELETE FROM favorite_recipes
+        WHERE EXISTS (SELECT 1 FROM recipes r
+                      JOIN favorite_categories fc ON fc.category_id = r.category_id
+                      WHERE r.id = favorite_recipes.recipe_id
+                        AND fc.user_id = favorite_recipes.user_id)
+    """)
+    logger.info(f"Favoritos por categoria compactados: {cursor.rowcount} linhas removidas.")
+
+
+# --- 008: CONFIGURAÇÕES PERSISTIDAS (chave/valor) ---
+def _create_app_settings(cursor: sqlite3.Cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS app_settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID;
+    """)
+
+
+# --- 009: SESSÕES PERSISTENTES ---
+# Guarda apenas o SHA-256 do id da sessão (o token assinado fica com o cliente).
+def _create_sessions(cursor: sqlite3.Cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sessions (
+            token_hash TEXT PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions (expires_at)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sessions_user ON sessions (user_id)")
+
+
+# --- 010: PORÇÕES NUMÉRICAS + ÍNDICES DOS FILTROS ---
+# servings continua sendo o texto exibido; servings_count (derivado dele) atende ao
+# filtro numérico. preparation_time passa a ser indexado para o filtro de tempo máximo.
+def _add_numeric_filters(cursor: sqlite3.Cursor):
+    cursor.execute("ALTER TABLE recipes ADD COLUMN servings_count INTEGER")
+    rows = cursor.execute(
+        "SELECT id, servings FROM recipes WHERE servings IS NOT NULL AND servings != ''").fetchall()
+    updates = [(count, rid) for rid, count in ((rid, servings_count(text)) for rid, text in rows) if count]
+    cursor.executemany("UPDATE recipes SET servings_count = ? WHERE id = ?", updates)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_recipes_prep_time ON recipes (preparation_time)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_recipes_servings_count ON recipes (servings_count)")
+    logger.info(f"Porções numéricas preenchidas em {len(updates)} receitas.")
+
+
+# --- 011: LISTAGEM "MINHAS RECEITAS" ORDENADA POR ÍNDICE ---
+# A página do usuário une receitas próprias, favoritas diretas e das categorias
+# favoritas (ver RecipeQueries.get_user_recipes_page), cada fonte lida já na ordem
+# (created_at, id). favorite_recipes guarda a data de criação da receita
+# (imutável), preenchida por trigger, para ser percorrida nessa ordem.
+def _order_user_listing_by_index(cursor: sqlite3.Cursor):
+    cursor.execute(
+        "ALTER TABLE favorite_recipes ADD COLUMN recipe_created_at DATETIME")
+    cursor.execute("""
+        UPDATE favorite_recipes SET recipe_created_at =
+            (SELECT created_at FROM recipes WHERE id = favorite_recipes.recipe_id)
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS favorite_recipes_created_ai AFTER INSERT ON favorite_recipes BEGIN
+            UPDATE favorite_recipes
+            SET recipe_created_at = (SELECT created_at FROM recipes WHERE id = new.recipe_id)
+            WHERE user_id = new.user_id AND recipe_id = new.recipe_id;
+        END;
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_favorite_recipes_user_created "
+        "ON favorite_recipes (user_id, recipe_created_at, recipe_id)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_recipes_category_created ON recipes (category_id, created_at)")
+
+
+# --- 012: IDENTIDADE ESTÁVEL DO SEED NATIVO ---
+# O hash muda a cada correção no JSON; a chave (id explícito ou título + fonte)
+# permite atualizar a receita já semeada em vez de inserir outra cópia.
+# O preenchimento replica seeder._seed_key; chaves repetidas ficam NULL (OR IGNORE).
+def _add_native_seed_key(cursor: sqlite3.Cursor):
+    cursor.execute("ALTER TABLE native_recipe_seeds ADD COLUMN seed_key TEXT")
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_native_recipe_seeds_key ON native_recipe_seeds (seed_key)")
+    cursor.execute("""
+        UPDATE OR IGNORE native_recipe_seeds SET seed_key =
+            (SELECT 'title:' || r.title || char(31) || COALESCE(r.source, '')
+             FROM recipes r WHERE r.id = native_recipe_seeds.recipe_id)
+        WHERE recipe_id IS NOT NULL
+    """)
+
+
+# --- REGISTRO DE MIGRAÇÕES (ordem crescente, nunca renumerar) ---
+Migration = Tuple[int, str, Callable[[sqlite3.Cursor], None]]
+
+MIGRATIONS: List[Migration] = [
+    (1, "Esquema base", _create_base_tables),
+    (2, "Índice de busca FTS5", _ensure_search_index),
+    (3, "Índices secundários", _create_secondary_indexes),
+    (4, "Pausa da sincronização FTS para importação em lote", _add_search_index_pause),
+    (5, "Controle do seed incremental de receitas nativas", _create_native_seed_table),
+    (6, "Categorias padrão do sistema", seed_default_categories),
+    (7, "Favoritos de categoria resolvidos na leitura", _resolve_category_favorites_on_read),
+    (8, "Configurações persistidas", _create_app_settings),
+    (9, "Sessões persistentes", _create_sessions),
+    (10, "Porções numéricas e índices dos filtros", _add_numeric_filters),
+    (11, "Listagem do usuário ordenada por índice", _order_user_listing_by_index),
+    (12, "Chave estável do seed de receitas nativas", _add_native_seed_key),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(conn: sqlite3.Connection, migrations: List[Migration] = MIGRATIONS) -> int:
+    """
+    Aplica as migrações pendentes. Retorna quantas foram aplicadas.
+    Uma falha desfaz apenas a migração corrente e é propagada (fail-fast).
+    """
+    current = get_schema_version(conn)
+    target = migrations[-1][0] if migrations else current
+    if current >= target:
+        logger.debug(f"Esquema já na versão {current}. Nada a migrar.")
+        return 0
+
+    applied = 0
+    cursor = conn.cursor()
+    for version, description, migrate in migrations:
+        if version <= current:
+            continue
+        logger.info(f"Aplicando migração {version:03d}: {description}")
+        conn.execute("BEGIN")
+        try:
+            migrate(cursor)
+            # user_version é gravado no cabeçalho dentro da mesma transação
+            cursor.execute(f"PRAGMA user_version = {int(version)}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logger.critical(f"Migração {version:03d} falhou. Revertida.", exc_info=True)
+            raise
+        applied += 1
+    logger.info(f"Esquema migrado da versão {current} para {target}.")
+    return applied
@@ -1,178 +1,664 @@
 # ARQUIVO: src/database/recipe_queries.py
+import base64
+import difflib
+import json
 import sqlite3
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Callable, Iterable, Optional, Sequence, Tuple, Union
 from src.core.logger import get_logger
-from src.database.database import get_db_connection
+from src.core.exceptions import ValidationError
+from src.database.database import db_connection, get_db_path
+from src.database.migrations import FTS_INDEX_ROWS_SQL, FTS_PAUSE_TABLE
 from src.models.recipe import RecipeCreate
+from src.utils.ingredient_parser import normalize_ingredients
 
 logger = get_logger("src.database.recipe")
 
+# Pesos BM25 por coluna do índice FTS (título > ingredientes > preparo > dicas)
+FTS_RANK_WEIGHTS = (10.0, 1.0, 0.5, 2.0)
+_BM25 = f"bm25(recipes_fts, {', '.join(str(w) for w in FTS_RANK_WEIGHTS)})"
+
+# Colunas devolvidas pela busca para as telas de listagem (cards)
+SEARCH_LIST_COLUMNS = "r.id, r.title, r.preparation_time, r.image_path"
+
+# Favorito efetivo: direto, ou herdado da categoria favorita sem exclusão individual.
+# Três lookups por chave primária; parâmetros: (uid, uid, uid).
+_FAVORITE_JOINS = """
+    LEFT JOIN favorite_recipes fr ON fr.user_id = ? AND fr.recipe_id = r.id
+    LEFT JOIN favorite_categories fc ON fc.user_id = ? AND fc.category_id = r.category_id
+    LEFT JOIN favorite_recipe_exclusions fx ON fx.user_id = ? AND fx.recipe_id = r.id
+"""
+_IS_FAVORITE = "(fr.user_id IS NOT NULL OR (fc.user_id IS NOT NULL AND fx.user_id IS NULL))"
+
+# Tamanho padrão de página das listagens (primeira tela renderizada)
+PAGE_SIZE = 40
+
+# Ids por consulta no carregamento em lote (abaixo do limite de variáveis do SQLite)
+DETAILS_CHUNK_SIZE = 500
+
+# Receitas por transação na importação em lote
+BULK_CHUNK_SIZE = 500
+
+# Receitas completas mantidas em memória (tela de detalhes, pré-carregamento)
+DETAILS_CACHE_SIZE = 256
+
+# Gancho por bloco da importação em lote: (cursor, [(índice, id criado)])
+BulkChunkHook = Callable[[sqlite3.Cursor, List[Tuple[int, int]]], None]
+
+
+def _build_match_query(term: str) -> str:
+    """
+    Converte o termo digitado em uma expressão FTS5 segura.
+    Cada palavra vira um prefixo entre aspas ("bol"*), combinadas com AND implícito.
+    """
+    tokens = [w.replace('"', '""') for w in term.split()]
+    return " ".join(f'"{t}"*' for t in tokens if t)
+
+
+def _encode_cursor(values: Sequence) -> str:
+    """Serializa a chave de ordenação da última linha em um token opaco."""
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(token: str, size: int) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except ValueError as e:
+        raise ValidationError("Cursor de paginação inválido.", e)
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationError("Cursor de paginação inválido.")
+    return values
+
+
+def _check_page_limit(limit: int):
+    if limit < 1:
+        raise ValidationError(f"Tamanho de página inválido: {limit}.")
+
+
+def _split_page(rows: List[Dict], limit: int, columns: Sequence[str]) -> Tuple[List[Dict], Optional[str]]:
+    """Corta a linha extra (limit + 1) e gera o cursor a partir da última linha da página."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, _encode_cursor([rows[-1][col] for col in columns])
+
+
+def _copy_details(rec: Dict) -> Dict:
+    return {**rec, 'ingredients': [dict(i) for i in rec['ingredients']]}
+
+
+class _RecipeDetailsCache:
+    """
+    Cache de processo das receitas completas, por (banco, id), com descarte LRU.
+    Entrega cópias (a UI pode alterá-las). Mesma regra de geração do cache de
+    categorias: uma leitura concorrente não grava dados anteriores a uma invalidação.
+    """
+
+    def __init__(self, max_items: int = DETAILS_CACHE_SIZE):
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[Tuple[str, int], Dict]" = OrderedDict()
+        self._generation = 0
+
+    def get_many(self, db_path: str, ids: List[int]) -> Tuple[Dict[int, Dict], int]:
+        found = {}
+        with self._lock:
+            for rid in ids:
+                rec = self._items.get((db_path, rid))
+                if rec is not None:
+                    self._items.move_to_end((db_path, rid))
+                    found[rid] = _copy_details(rec)
+            return found, self._generation
+
+    def put_many(self, db_path: str, recipes: Dict[int, Dict], generation: int):
+        with self._lock:
+            if generation != self._generation:
+                return
+            for rid, rec in recipes.items():
+                self._items[(db_path, rid)] = _copy_details(rec)
+                self._items.move_to_end((db_path, rid))
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def invalidate(self, rid: Optional[int] = None):
+        """Descarta uma receita (em todos os bancos) ou, sem argumento, todas."""
+        with self._lock:
+            self._generation += 1
+            if rid is None:
+                self._items.clear()
+            else:
+                for key in [k for k in self._items if k[1] == rid]:
+                    del self._items[key]
+
+
+_details_cache = _RecipeDetailsCache()
+
+
+def invalidate_details_cache(rid: Optional[int] = None):
+    """Chamar após alterar receitas fora de RecipeQueries."""
+    _details_cache.invalidate(rid)
+
 
 class RecipeQueries:
     def _get_conn(self):
-        return get_db_connection()
+        """Empresta uma conexão do pool (usar com `with`)."""
+        return db_connection()
+
+    def _fetch_page(self, conn: sqlite3.Connection, sql: str, params: list,
+                    keys: List[Tuple[str, str]], descending: bool,
+                    limit: int, after: Optional[str]) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Paginação por chave (keyset): `keys` são pares (coluna no resultado, expressão SQL)
+        que formam uma ordenação total. O custo de cada página é O(limit), em qualquer profundidade.
+        """
+        _check_page_limit(limit)
+        params = list(params)
+        exprs = ", ".join(expr for _, expr in keys)
+        if after:
+            values = _decode_cursor(after, len(keys))
+            op = "<" if descending else ">"
+            sql += f" AND ({exprs}) {op} ({', '.join('?' * len(keys))})"
+            params.extend(values)
 
-    def _close_conn(self, conn):
-        if conn:
-            conn.close()
+        direction = "DESC" if descending else "ASC"
+        sql += " ORDER BY " + \
+            ", ".join(f"{expr} {direction}" for _, expr in keys) + " LIMIT ?"
+        params.append(limit + 1)
+
+        rows = [dict(row) for row in conn.execute(sql, params).fetchall()]
+        return _split_page(rows, limit, [col for col, _ in keys])
 
     # --- BUSCA AVANÇADA (ATUALIZADA) ---
+    def _search_filters(self, term: str, max_time: int, servings: str,
+                        category_id: int, uid: Optional[int] = None) -> Tuple[str, list, bool]:
+        """
+        Monta FROM/WHERE da busca. Retorna (sql, params, usa_fts).
+        Com `uid`, inclui os LEFT JOINs de favoritos (lookups pelas PKs, ver _FAVORITE_JOINS).
+        """
+        params = []
+        match = _build_match_query(term) if term else ""
+        sql = " FROM recipes r"
+
+        # [FTS5] Busca textual via índice invertido (título, preparo, dicas, ingredientes)
+        if match:
+            sql += " JOIN recipes_fts ON recipes_fts.rowid = r.id"
+
+        if uid is not None:
+            sql += _FAVORITE_JOINS
+            params.extend([uid, uid, uid])
+
+        if match:
+            sql += " WHERE recipes_fts MATCH ?"
+            params.append(match)
+        else:
+            sql += " WHERE 1=1"
+
+        if max_time > 0:
+            sql += " AND r.preparation_time <= ?"
+            params.append(max_time)
+
+        # Número puro: coluna numérica (indexada); texto livre: LIKE no texto original
+        if servings.isdigit():
+            sql += " AND r.servings_count = ?"
+            params.append(int(servings))
+        elif servings:
+            sql += " AND r.servings LIKE ?"
+            params.append(f"%{servings}%")
+
+        # [NOVO] Filtro por Categoria
+        if category_id > 0:
+            sql += " AND r.category_id = ?"
+            params.append(category_id)
+
+        return sql, params, bool(match)
+
+    def _search_select(self, uses_fts: bool) -> str:
+        """Projeção enxuta para cards (sem instruções/textos longos)."""
+        sql = f"SELECT {SEARCH_LIST_COLUMNS}, {_IS_FAVORITE} AS is_favorite"
+        if uses_fts:
+            sql += f", {_BM25} AS search_rank"
+        return sql
+
+    def _build_search_sql(self, uid: int, term: str = "", max_time: int = 0,
+                          servings: str = "", category_id: int = 0) -> Tuple[str, list]:
+        where, params, uses_fts = self._search_filters(
+            term, max_time, servings, category_id, uid=uid)
+        sql = self._search_select(False) + where
+        if uses_fts:
+            sql += f" ORDER BY {_BM25}, r.title ASC"
+        else:
+            sql += " ORDER BY r.title ASC"
+        return sql, params
+
     def search_advanced(self, uid: int, term: str = "", max_time: int = 0,
                         servings: str = "", category_id: int = 0) -> List[Dict]:
-        """Busca com suporte a filtro por Categoria."""
-        conn = self._get_conn()
-        try:
-            params = [uid]
-            sql = """
-                SELECT DISTINCT r.*, 
-                       (SELECT COUNT(*) FROM favorite_recipes WHERE recipe_id=r.id AND user_id=?) as is_favorite
-                FROM recipes r 
-                WHERE 1=1
-            """
-
-            if term:
-                sql += " AND (r.title LIKE ? OR r.instructions LIKE ?)"
-                t = f"%{term}%"
-                params.extend([t, t])
-
-            if max_time > 0:
-                sql += " AND r.preparation_time <= ?"
-                params.append(max_time)
-
-            if servings:
-                sql += " AND r.servings LIKE ?"
-                params.append(f"%{servings}%")
-
-            # [NOVO] Filtro por Categoria
-            if category_id > 0:
-                sql += " AND r.category_id = ?"
-                params.append(category_id)
+        """Busca com suporte a filtro por Categoria e ranking BM25 (FTS5) no termo."""
+        with self._get_conn() as conn:
+            try:
+                sql, params = self._build_search_sql(
+                    uid, term, max_time, servings, category_id)
+                cur = conn.cursor()
+                cur.execute(sql, params)
+                return [dict(row) for row in cur.fetchall()]
+            except Exception as e:
+                logger.error(f"Erro search_advanced: {e}")
+                return []
 
-            sql += " ORDER BY r.title ASC"
+    def search_page(self, uid: int, term: str = "", max_time: int = 0,
+                    servings: str = "", category_id: int = 0,
+                    limit: int = PAGE_SIZE, after: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Versão paginada de search_advanced. Retorna (receitas, cursor da próxima página).
+        Ordenação por (título, id), ou (rank BM25, título, id) quando há termo.
+        """
+        _check_page_limit(limit)
+        with self._get_conn() as conn:
+            try:
+                where, params, uses_fts = self._search_filters(
+                    term, max_time, servings, category_id, uid=uid)
+                keys = [("title", "r.title"), ("id", "r.id")]
+                if uses_fts:
+                    keys.insert(0, ("search_rank", _BM25))
 
-            cur = conn.cursor()
-            cur.execute(sql, params)
-            return [dict(row) for row in cur.fetchall()]
-        except Exception as e:
-            logger.error(f"Erro search_advanced: {e}")
-            return []
-        finally:
-            conn.close()
+                rows, next_cursor = self._fetch_page(
+                    conn, self._search_select(uses_fts) + where, params,
+                    keys, descending=False, limit=limit, after=after)
+                for row in rows:
+                    row.pop("search_rank", None)
+                return rows, next_cursor
+            except Exception as e:
+                logger.error(f"Erro search_page: {e}")
+                return [], None
+
+    def count_search(self, uid: int, term: str = "", max_time: int = 0,
+                     servings: str = "", category_id: int = 0) -> int:
+        """Total de resultados da busca (para o contador da UI)."""
+        with self._get_conn() as conn:
+            try:
+                where, params, _ = self._search_filters(
+                    term, max_time, servings, category_id)
+                return conn.execute("SELECT COUNT(*)" + where, params).fetchone()[0]
+            except Exception as e:
+                logger.error(f"Erro count_search: {e}")
+                return 0
 
     # --- MÉTODOS CRUD PADRÃO ---
 
     def create_recipe(self, data: RecipeCreate, user_id: int) -> bool:
-        conn = self._get_conn()
+        with self._get_conn() as conn:
+            try:
+                cur = conn.cursor()
+                conn.execute("BEGIN")
+                cur.execute("""
+                    INSERT INTO recipes (user_id, category_id, title, preparation_time, servings, servings_count, instructions, additional_instructions, source, image_path) 
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (user_id, data.category_id, data.title, data.preparation_time, data.servings, data.servings_count, data.instructions, data.additional_instructions, data.source, data.image_path))
+                rid = cur.lastrowid
+                if data.ingredients:
+                    ings = [(rid, i.name, i.quantity, i.unit)
+                            for i in data.ingredients]
+                    cur.executemany(
+                        "INSERT INTO recipe_ingredients (recipe_id, name, quantity, unit) VALUES (?, ?, ?, ?)", ings)
+                conn.commit()
+                return True
+            except:
+                conn.rollback()
+                return False
+
+    # --- IMPORTAÇÃO EM LOTE ---
+    def create_recipes_bulk(self, recipes: Iterable[Union[RecipeCreate, Dict]], user_id: int,
+                            chunk_size: int = BULK_CHUNK_SIZE,
+                            on_chunk: Optional[BulkChunkHook] = None) -> Tuple[List[int], List[Tuple[int, str]]]:
+        """
+        Importa receitas em fluxo (aceita gerador), uma transação por bloco de `chunk_size`,
+        com executemany para receitas e ingredientes.
+        Itens inválidos não derrubam o lote: retorna (ids criados, [(índice, erro)]).
+        Em itens dict, ingredientes podem ser linhas cruas ("2 xícaras de farinha")
+        e as unidades são canonizadas (ver normalize_ingredients).
+        `on_chunk(cursor, [(índice, id)])` roda dentro da transação de cada bloco,
+        para gravações complementares atômicas com as receitas.
+        """
+        created: List[int] = []
+        failures: List[Tuple[int, str]] = []
+        chunk: List[Tuple[int, RecipeCreate]] = []
+
+        with self._get_conn() as conn:
+            for index, item in enumerate(recipes):
+                try:
+                    if isinstance(item, RecipeCreate):
+                        data = item
+                    else:
+                        # Linhas cruas / unidades variadas viram quantidade+unidade canônica
+                        data = RecipeCreate(**{**item, "ingredients": normalize_ingredients(
+                            item.get("ingredients") or [])})
+                except (ValueError, TypeError) as e:
+                    failures.append((index, str(e)))
+                    continue
+                chunk.append((index, data))
+                if len(chunk) >= chunk_size:
+                    self._insert_bulk_chunk(
+                        conn, chunk, user_id, created, failures, on_chunk)
+                    chunk = []
+            if chunk:
+                self._insert_bulk_chunk(
+                    conn, chunk, user_id, created, failures, on_chunk)
+
+        logger.info(
+            f"Importação em lote: {len(created)} criadas, {len(failures)} falhas.")
+        return created, failures
+
+    def _insert_bulk_chunk(self, conn: sqlite3.Connection, chunk: List[Tuple[int, RecipeCreate]],
+                           user_id: int, created: List[int], failures: List[Tuple[int, str]],
+                           on_chunk: Optional[BulkChunkHook] = None):
+        """
+        Tenta o bloco inteiro via executemany; se algum item violar o banco, desfaz
+        só o bloco (SAVEPOINT) e refaz item a item, registrando as falhas.
+        A sincronização linha a linha do FTS fica pausada e o bloco é indexado
+        de uma vez antes do COMMIT.
+        """
+        cur = conn.cursor()
+        conn.execute("BEGIN IMMEDIATE")
         try:
-            cur = conn.cursor()
-            conn.execute("BEGIN")
-            cur.execute("""
-                INSERT INTO recipes (user_id, category_id, title, preparation_time, servings, instructions, additional_instructions, source, image_path) 
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (user_id, data.category_id, data.title, data.preparation_time, data.servings, data.instructions, data.additional_instructions, data.source, data.image_path))
-            rid = cur.lastrowid
-            if data.ingredients:
-                ings = [(rid, i.name, i.quantity, i.unit)
-                        for i in data.ingredients]
-                cur.executemany(
-                    "INSERT INTO recipe_ingredients (recipe_id, name, quantity, unit) VALUES (?, ?, ?, ?)", ings)
+            cur.execute(f"INSERT INTO {FTS_PAUSE_TABLE} (id) VALUES (1)")
+            cur.execute("SAVEPOINT bulk_chunk")
+            try:
+                ids = self._insert_recipe_rows(
+                    cur, [data for _, data in chunk], user_id)
+                cur.execute("RELEASE bulk_chunk")
+                inserted = [(index, rid)
+                            for (index, _), rid in zip(chunk, ids)]
+            except sqlite3.Error as e:
+                cur.execute("ROLLBACK TO bulk_chunk")
+                cur.execute("RELEASE bulk_chunk")
+                logger.warning(
+                    f"Bloco com item inválido ({e}). Reprocessando item a item.")
+                inserted = []
+                for index, data in chunk:
+                    cur.execute("SAVEPOINT bulk_item")
+                    try:
+                        rid = self._insert_recipe_rows(cur, [data], user_id)[0]
+                        cur.execute("RELEASE bulk_item")
+                        inserted.append((index, rid))
+                    except sqlite3.Error as item_error:
+                        cur.execute("ROLLBACK TO bulk_item")
+                        cur.execute("RELEASE bulk_item")
+                        failures.append((index, str(item_error)))
+
+            if inserted:
+                if on_chunk:
+                    on_chunk(cur, inserted)
+                # Ids reservados em sequência sob o lock de escrita: o intervalo é só deste bloco
+                cur.execute(FTS_INDEX_ROWS_SQL + " WHERE r.id BETWEEN ? AND ?",
+                            (inserted[0][1], inserted[-1][1]))
+            cur.execute(f"DELETE FROM {FTS_PAUSE_TABLE}")
             conn.commit()
-            return True
-        except:
+            created.extend(rid for _, rid in inserted)
+        except Exception:
             conn.rollback()
-            return False
-        finally:
-            conn.close()
+            raise
+
+    def _insert_recipe_rows(self, cur: sqlite3.Cursor, items: List[RecipeCreate], user_id: int) -> List[int]:
+        """
+        Insere receitas + ingredientes com executemany. Os ids são reservados a partir
+        de sqlite_sequence (seguro: a transação já detém o lock de escrita).
+        """
+        cur.execute(
+            "SELECT COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'recipes'), 0)")
+        base = cur.fetchone()[0]
+        ids = list(range(base + 1, base + 1 + len(items)))
+
+        cur.executemany("""
+            INSERT INTO recipes (id, user_id, category_id, title, preparation_time, servings, servings_count, instructions, additional_instructions, source, image_path)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(rid, user_id, d.category_id, d.title, d.preparation_time, d.servings, d.servings_count, d.instructions,
+               d.additional_instructions, d.source, d.image_path) for rid, d in zip(ids, items)])
+
+        ings = [(rid, i.name, i.quantity, i.unit)
+                for rid, d in zip(ids, items) for i in d.ingredients]
+        if ings:
+            cur.executemany(
+                "INSERT INTO recipe_ingredients (recipe_id, name, quantity, unit) VALUES (?, ?, ?, ?)", ings)
+        return ids
 
     def update_recipe(self, rid: int, data: RecipeCreate, uid: int) -> bool:
-        conn = self._get_conn()
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT 1 FROM recipes WHERE id=? AND user_id=?", (rid, uid))
-            if not cur.fetchone():
+        with self._get_conn() as conn:
+            try:
+                cur = conn.cursor()
+                cur.execute(
+                    "SELECT 1 FROM recipes WHERE id=? AND user_id=?", (rid, uid))
+                if not cur.fetchone():
+                    return False
+                conn.execute("BEGIN")
+                cur.execute("""
+                    UPDATE recipes SET category_id=?, title=?, preparation_time=?, servings=?, servings_count=?, instructions=?, additional_instructions=?, source=?, image_path=?, updated_at=CURRENT_TIMESTAMP
+                    WHERE id=?
+                """, (data.category_id, data.title, data.preparation_time, data.servings, data.servings_count, data.instructions, data.additional_instructions, data.source, data.image_path, rid))
+                self._sync_ingredients(cur, rid, data.ingredients)
+                conn.commit()
+                _details_cache.invalidate(rid)
+                return True
+            except:
+                conn.rollback()
                 return False
-            conn.execute("BEGIN")
-            cur.execute("""
-                UPDATE recipes SET category_id=?, title=?, preparation_time=?, servings=?, instructions=?, additional_instructions=?, source=?, image_path=?, updated_at=CURRENT_TIMESTAMP
-                WHERE id=?
-            """, (data.category_id, data.title, data.preparation_time, data.servings, data.instructions, data.additional_instructions, data.source, data.image_path, rid))
-            cur.execute(
-                "DELETE FROM recipe_ingredients WHERE recipe_id=?", (rid,))
-            if data.ingredients:
-                ings = [(rid, i.name, i.quantity, i.unit)
-                        for i in data.ingredients]
-                cur.executemany(
-                    "INSERT INTO recipe_ingredients (recipe_id, name, quantity, unit) VALUES (?, ?, ?, ?)", ings)
-            conn.commit()
-            return True
-        except:
-            conn.rollback()
-            return False
-        finally:
-            conn.close()
+
+    def _sync_ingredients(self, cur: sqlite3.Cursor, rid: int, ingredients: list) -> Tuple[int, int, int]:
+        """
+        Aplica apenas a diferença entre os ingredientes salvos e os submetidos.
+        Linhas iguais são casadas por conteúdo (maior subsequência comum) e mantêm o id;
+        em cada trecho alterado, as linhas restantes são pareadas por posição (UPDATE,
+        id estável) e as sobras viram INSERT/DELETE. Como a ordem de exibição segue o
+        id, um acréscimo antes de linhas mantidas desloca (UPDATE) as seguintes.
+        Retorna (inseridos, atualizados, removidos).
+        """
+        cur.execute(
+            "SELECT id, name, quantity, unit FROM recipe_ingredients WHERE recipe_id=? ORDER BY id", (rid,))
+        stored = [(r[0], (r[1], r[2], r[3])) for r in cur.fetchall()]
+        wanted = [(i.name, i.quantity, i.unit) for i in ingredients]
+        old_values = [values for _, values in stored]
+
+        if old_values == wanted:
+            return 0, 0, 0
+
+        updates, inserts, deletes = [], [], []
+
+        def positional(old: List[Tuple[int, tuple]], new: List[tuple]):
+            updates.extend(values + (row_id,)
+                           for (row_id, before), values in zip(old, new) if before != values)
+            inserts.extend((rid,) + values for values in new[len(old):])
+            deletes.extend((row_id,) for row_id, _ in old[len(new):])
+
+        matcher = difflib.SequenceMatcher(None, old_values, wanted, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            if j2 - j1 > i2 - i1 and i2 < len(stored):
+                # Linhas novas antes de linhas mantidas: só há id livre no final
+                positional(stored[i1:], wanted[j1:])
+                break
+            positional(stored[i1:i2], wanted[j1:j2])
+
+        if updates:
+            cur.executemany(
+                "UPDATE recipe_ingredients SET name=?, quantity=?, unit=? WHERE id=?", updates)
+        if inserts:
+            cur.executemany(
+                "INSERT INTO recipe_ingredients (recipe_id, name, quantity, unit) VALUES (?, ?, ?, ?)", inserts)
+        if deletes:
+            cur.executemany(
+                "DELETE FROM recipe_ingredients WHERE id=?", deletes)
+
+        logger.debug(
+            f"Ingredientes da receita {rid}: +{len(inserts)} ~{len(updates)} -{len(deletes)}")
+        return len(inserts), len(updates), len(deletes)
 
     def get_recipe_details(self, rid: int) -> Optional[Dict]:
-        conn = self._get_conn()
-        try:
-            cur = conn.cursor()
-            cur.execute("SELECT * FROM recipes WHERE id=?", (rid,))
-            row = cur.fetchone()
-            if not row:
-                return None
-            rec = dict(row)
-            cur.execute(
-                "SELECT name, quantity, unit FROM recipe_ingredients WHERE recipe_id=?", (rid,))
-            rec['ingredients'] = [dict(r) for r in cur.fetchall()]
-            return rec
-        finally:
-            conn.close()
+        return self.get_recipes_details([rid]).get(rid)
+
+    def get_recipes_details(self, ids: Iterable[int]) -> Dict[int, Dict]:
+        """
+        Carrega várias receitas completas (com ingredientes) em lote.
+        Receitas em cache não vão ao banco; as demais saem em duas consultas por
+        bloco de ids (receitas + ingredientes), agrupadas em uma passada.
+        Retorna {id: receita} na ordem pedida; ids inexistentes são omitidos.
+        """
+        unique_ids = list(dict.fromkeys(int(i) for i in ids))
+        if not unique_ids:
+            return {}
+
+        db_path = get_db_path()
+        cached, generation = _details_cache.get_many(db_path, unique_ids)
+        missing = [rid for rid in unique_ids if rid not in cached]
+        loaded: Dict[int, Dict] = {}
+        if missing:
+            with self._get_conn() as conn:
+                cur = conn.cursor()
+                for start in range(0, len(missing), DETAILS_CHUNK_SIZE):
+                    chunk = missing[start:start + DETAILS_CHUNK_SIZE]
+                    marks = ", ".join("?" * len(chunk))
+
+                    cur.execute(
+                        f"SELECT * FROM recipes WHERE id IN ({marks})", chunk)
+                    for row in cur.fetchall():
+                        rec = dict(row)
+                        rec['ingredients'] = []
+                        loaded[rec['id']] = rec
+
+                    cur.execute(f"""
+                        SELECT recipe_id, name, quantity, unit FROM recipe_ingredients
+                        WHERE recipe_id IN ({marks}) ORDER BY recipe_id, id
+                    """, chunk)
+                    for row in cur.fetchall():
+                        loaded[row['recipe_id']]['ingredients'].append(
+                            {'name': row['name'], 'quantity': row['quantity'], 'unit': row['unit']})
+            _details_cache.put_many(db_path, loaded, generation)
+
+        return {rid: cached.get(rid) or loaded[rid]
+                for rid in unique_ids if rid in cached or rid in loaded}
 
     def get_user_recipes(self, user_id: int) -> List[Dict]:
-        conn = self._get_conn()
-        try:
+        with self._get_conn() as conn:
             cur = conn.cursor()
-            sql = """
-                SELECT DISTINCT r.*, CASE WHEN fr.user_id IS NOT NULL THEN 1 ELSE 0 END as is_favorite
-                FROM recipes r
-                LEFT JOIN favorite_recipes fr ON r.id = fr.recipe_id AND fr.user_id = ?
-                WHERE r.user_id = ? OR fr.user_id IS NOT NULL
-                ORDER BY r.created_at DESC
-            """
-            cur.execute(sql, (user_id, user_id))
+            sql = f"SELECT r.*, {_IS_FAVORITE} AS is_favorite" + \
+                self._USER_RECIPES_FROM + " ORDER BY r.created_at DESC"
+            cur.execute(sql, (user_id, user_id, user_id, user_id))
             return [dict(row) for row in cur.fetchall()]
-        finally:
-            conn.close()
+
+    _USER_RECIPES_FROM = f"""
+        FROM recipes r
+        {_FAVORITE_JOINS}
+        WHERE (r.user_id = ? OR {_IS_FAVORITE})
+    """
+
+    _USER_RECIPES_COLUMNS = ("id", "user_id", "category_id", "title", "preparation_time", "servings",
+                             "servings_count", "instructions", "additional_instructions", "source",
+                             "image_path", "created_at", "updated_at")
+
+    def _build_user_recipes_page_sql(self, conn: sqlite3.Connection, user_id: int, limit: int,
+                                     after: Optional[str] = None) -> Tuple[str, list]:
+        """
+        Página de get_user_recipes como UNION ALL de ramos disjuntos, cada um lido
+        já na ordem (created_at, id) DESC pelo seu índice:
+        - próprias (idx_recipes_user_created);
+        - favoritas diretas de outros autores (idx_favorite_recipes_user_created);
+        - uma por categoria favorita: receitas de outros autores sem favorito
+          direto nem exclusão (idx_recipes_category_created).
+        O ORDER BY externo vira um MERGE dos ramos e o LIMIT interrompe a leitura
+        após limit + 1 linhas: sem ordenar o conjunto visível inteiro.
+        """
+        bound = _decode_cursor(after, 2) if after else None
+
+        def keyset(created: str, rid: str) -> Tuple[str, list]:
+            if bound is None:
+                return "", []
+            return f" AND ({created}, {rid}) < (?, ?)", list(bound)
+
+        own_cols = ", ".join(f"r.{c} AS {c}" for c in self._USER_RECIPES_COLUMNS)
+        fav_cols = ", ".join({"id": "fr.recipe_id", "created_at": "fr.recipe_created_at"}.get(c, f"r.{c}")
+                             for c in self._USER_RECIPES_COLUMNS)
+
+        where, extra = keyset("r.created_at", "r.id")
+        branches = [f"SELECT {own_cols}, {_IS_FAVORITE} AS is_favorite FROM recipes r {_FAVORITE_JOINS}"
+                    f" WHERE r.user_id = ?{where}"]
+        params = [user_id, user_id, user_id, user_id] + extra
+
+        where, extra = keyset("fr.recipe_created_at", "fr.recipe_id")
+        branches.append(f"SELECT {fav_cols}, 1 FROM favorite_recipes fr JOIN recipes r ON r.id = fr.recipe_id"
+                        f" WHERE fr.user_id = ? AND r.user_id != ?{where}")
+        params += [user_id, user_id] + extra
+
+        category_ids = [row[0] for row in conn.execute(
+            "SELECT category_id FROM favorite_categories WHERE user_id = ?", (user_id,))]
+        where, extra = keyset("r.created_at", "r.id")
+        for category_id in category_ids:
+            branches.append(
+                f"SELECT {own_cols}, 1 FROM recipes r"
+                " LEFT JOIN favorite_recipes fr ON fr.user_id = ? AND fr.recipe_id = r.id"
+                " LEFT JOIN favorite_recipe_exclusions fx ON fx.user_id = ? AND fx.recipe_id = r.id"
+                f" WHERE r.category_id = ? AND r.user_id != ?"
+                f" AND fr.user_id IS NULL AND fx.user_id IS NULL{where}")
+            params += [user_id, user_id, category_id, user_id] + extra
+
+        sql = " UNION ALL ".join(branches) + " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+        return sql, params
+
+    def get_user_recipes_page(self, user_id: int, limit: int = PAGE_SIZE,
+                              after: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Versão paginada de get_user_recipes (mais recentes primeiro, chave (created_at, id))."""
+        _check_page_limit(limit)
+        with self._get_conn() as conn:
+            sql, params = self._build_user_recipes_page_sql(conn, user_id, limit, after)
+            rows = [dict(row) for row in conn.execute(sql, params).fetchall()]
+        return _split_page(rows, limit, ["created_at", "id"])
+
+    def count_user_recipes(self, user_id: int) -> int:
+        with self._get_conn() as conn:
+            sql = "SELECT COUNT(*)" + self._USER_RECIPES_FROM
+            return conn.execute(sql, [user_id] * 4).fetchone()[0]
 
     def delete_recipe(self, recipe_id: int, user_id: int) -> bool:
-        conn = self._get_conn()
-        try:
+        with self._get_conn() as conn:
             cur = conn.cursor()
             cur.execute(
                 "DELETE FROM recipes WHERE id=? AND user_id=?", (recipe_id, user_id))
             conn.commit()
+            _details_cache.invalidate(recipe_id)
             return cur.rowcount > 0
-        finally:
-            conn.close()
 
     def toggle_favorite(self, rid: int, uid: int) -> bool:
-        conn = self._get_conn()
-        try:
+        """
+        Inverte o favorito efetivo da receita. Dentro de uma categoria favorita,
+        desmarcar grava uma exclusão e remarcar apenas a remove.
+        """
+        with self._get_conn() as conn:
             cur = conn.cursor()
-            cur.execute(
-                "SELECT 1 FROM favorite_recipes WHERE user_id=? AND recipe_id=?", (uid, rid))
-            if cur.fetchone():
+            cur.execute("""
+                SELECT EXISTS (SELECT 1 FROM favorite_recipes WHERE user_id = ? AND recipe_id = ?),
+                       EXISTS (SELECT 1 FROM recipes r
+                               JOIN favorite_categories fc ON fc.category_id = r.category_id
+                               WHERE r.id = ? AND fc.user_id = ?),
+                       EXISTS (SELECT 1 FROM favorite_recipe_exclusions WHERE user_id = ? AND recipe_id = ?)
+            """, (uid, rid, rid, uid, uid, rid))
+            direct, by_category, excluded = cur.fetchone()
+
+            if direct or (by_category and not excluded):
                 cur.execute(
                     "DELETE FROM favorite_recipes WHERE user_id=? AND recipe_id=?", (uid, rid))
+                if by_category:
+                    cur.execute(
+                        "INSERT OR IGNORE INTO favorite_recipe_exclusions (user_id, recipe_id) VALUES (?,?)", (uid, rid))
                 res = False
             else:
                 cur.execute(
-                    "INSERT INTO favorite_recipes (user_id, recipe_id) VALUES (?,?)", (uid, rid))
+                    "DELETE FROM favorite_recipe_exclusions WHERE user_id=? AND recipe_id=?", (uid, rid))
+                if not by_category:
+                    cur.execute(
+                        "INSERT INTO favorite_recipes (user_id, recipe_id) VALUES (?,?)", (uid, rid))
                 res = True
             conn.commit()
             return res
-        finally:
-            conn.close()
 
     # Mantido para compatibilidade, mas o Discovery deve usar search_advanced
     def search_recipes_by_name(self, term: str, uid: int) -> List[Dict]:
@@ -1,12 +1,21 @@
 # ARQUIVO: src/database/seeder.py
-import sqlite3
+import hashlib
 import json
 import os
+from typing import Dict, IO, Iterable, Iterator, List, Optional, Set, Tuple
 from src.core.logger import get_logger
-from src.database.database import DB_PATH
+from src.database.category_queries import invalidate_category_cache
+from src.database.database import db_connection
+from src.database.recipe_queries import RecipeQueries
+from src.models.recipe import RecipeCreate
+from src.utils.ingredient_parser import normalize_ingredients
 
 logger = get_logger("src.database.seeder")
 
+SYSTEM_USER_ID = 1  # Admin/Sistema: dono das receitas nativas
+SEED_CHUNK_SIZE = 200  # Receitas por transação
+READ_BLOCK_SIZE = 64 * 1024  # Bytes lidos por vez do JSON
+
 # Banco de Imagens Fictícias (URLs Estáveis do Unsplash)
 # Usamos URLs diretos para garantir que funcionem sempre
 IMAGE_MAP = {
@@ -36,76 +45,246 @@ def _get_image_for_title(title: str) -> str:
 def seed_native_recipes():
     """
     Popula o banco de dados com receitas nativas a partir de um JSON.
+    Incremental: insere receitas novas e atualiza as nativas corrigidas no JSON.
     Injeta imagens automaticamente se não existirem.
     """
     json_path = os.path.join("src", "assets", "native_recipes.json")
-    
+
     if not os.path.exists(json_path):
         logger.warning(f"Arquivo de seed não encontrado: {json_path}")
         return
 
-    conn = sqlite3.connect(DB_PATH)
+    with db_connection() as conn:
+        _seed_from_file(conn, json_path)
+
+
+def iter_json_array(f: IO[str], block_size: int = READ_BLOCK_SIZE) -> Iterator[dict]:
+    """
+    Lê um array JSON de nível superior elemento a elemento, sem carregar o arquivo
+    inteiro. Mantém em memória apenas o bloco corrente e o elemento em decodificação.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, started, eof = "", 0, False, False
+
+    while True:
+        if not eof:
+            block = f.read(block_size)
+            eof = not block
+            buf = buf[pos:] + block
+            pos = 0
+
+        while True:
+            while pos < len(buf) and (buf[pos].isspace() or (started and buf[pos] == ",")):
+                pos += 1
+            if pos >= len(buf):
+                break
+            if not started:
+                if buf[pos] != "[":
+                    raise ValueError("O arquivo de seed deve conter um array JSON.")
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                break  # Elemento incompleto: lê o próximo bloco
+            yield item
+            pos = end
+
+        if eof:
+            raise ValueError("Array JSON do seed terminou inesperadamente.")
+
+
+def _content_hash(record: dict) -> str:
+    """Hash estável do conteúdo (independe da ordem das chaves)."""
+    canonical = json.dumps(record, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _seed_key(record: dict) -> Optional[str]:
+    """
+    Identidade estável do registro: `id` explícito no JSON ou título + fonte.
+    Sobrevive a correções de conteúdo (o hash não). Espelhado pela migração 012.
+    """
+    if record.get('id') is not None:
+        return f"id:{record['id']}"
+    if not record.get('title'):
+        return None
+    return f"title:{record['title']}\x1f{record.get('source') or ''}"
+
+
+def _load_category_map(cursor) -> Dict[str, int]:
+    cursor.execute("SELECT id, name FROM categories WHERE user_id IS NULL")
+    return {row[1]: row[0] for row in cursor.fetchall()}
+
+
+def _load_legacy_titles(cursor) -> Dict[str, int]:
+    """Receitas do sistema semeadas antes do controle por hash (adotadas pelo título)."""
+    cursor.execute("""
+        SELECT r.title, r.id FROM recipes r
+        LEFT JOIN native_recipe_seeds s ON s.recipe_id = r.id
+        WHERE r.user_id = ? AND s.recipe_id IS NULL
+    """, (SYSTEM_USER_ID,))
+    return {row[0]: row[1] for row in cursor.fetchall()}
+
+
+def _seed_from_file(conn, json_path: str, chunk_size: int = SEED_CHUNK_SIZE) -> int:
+    """Semeia incrementalmente. Retorna quantas receitas novas foram inseridas."""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return seed_records(conn, iter_json_array(f), chunk_size)
+
+
+def seed_records(conn, records: Iterable[dict], chunk_size: int = SEED_CHUNK_SIZE) -> int:
+    """
+    Semeia registros no formato do native_recipes.json (categoria por nome) como
+    receitas do sistema. Registros cujo hash de conteúdo já foi semeado são ignorados,
+    então reexecutar com a mesma fonte (JSON, PDFs...) não duplica nada.
+    Um registro já semeado com conteúdo alterado (mesma chave, ver _seed_key)
+    atualiza a receita existente; se o usuário a apagou, continua apagada.
+    Retorna quantas receitas novas foram inseridas.
+    """
     cursor = conn.cursor()
 
     try:
-        # Verifica se já existem receitas do sistema (user_id = 1 é o Admin/Sistema)
-        cursor.execute("SELECT COUNT(*) FROM recipes WHERE user_id = 1")
-        count = cursor.fetchone()[0]
-        
-        if count > 0:
-            logger.info("SEEDER: Banco de dados já populado. Pulando seed.")
-            return
-
-        logger.info("SEEDER: Iniciando população de receitas nativas...")
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            recipes = json.load(f)
-
         # Garante que o usuário Admin (ID 1) existe
-        cursor.execute("INSERT OR IGNORE INTO users (id, full_name, email, hashed_password) VALUES (1, 'Admin', 'admin@system.local', 'system_hash')")
-
-        for r in recipes:
-            # 1. Resolve Categoria
-            cursor.execute("SELECT id FROM categories WHERE name = ? AND user_id IS NULL", (r['category'],))
-            cat_row = cursor.fetchone()
-            if cat_row:
-                cat_id = cat_row[0]
-            else:
-                cursor.execute("INSERT INTO categories (name, user_id, icon) VALUES (?, NULL, 'restaurant')", (r['category'],))
+        cursor.execute("INSERT OR IGNORE INTO users (id, full_name, email, hashed_password) VALUES (?, 'Admin', 'admin@system.local', 'system_hash')",
+                       (SYSTEM_USER_ID,))
+        conn.commit()
+
+        categories = _load_category_map(cursor)
+        cursor.execute("SELECT content_hash, recipe_id, seed_key FROM native_recipe_seeds")
+        seeded: Set[str] = set()
+        hash_keys: Dict[str, Optional[str]] = {}
+        by_key: Dict[str, Tuple[str, Optional[int]]] = {}  # chave -> (hash, receita)
+        for content_hash, recipe_id, key in cursor.fetchall():
+            seeded.add(content_hash)
+            hash_keys[content_hash] = key
+            if key is not None:
+                by_key[key] = (content_hash, recipe_id)
+        legacy = _load_legacy_titles(cursor)
+
+        pending: Dict[int, Tuple[str, Optional[str]]] = {}  # índice no lote -> (hash, chave)
+        adopted: List[Tuple[str, int, Optional[str]]] = []
+        rebound: List[Tuple[str, str]] = []  # (chave, hash) de seeds ainda sem chave
+        retagged: List[Tuple[str, str]] = []  # (hash novo, hash antigo) de receitas apagadas
+        changed: List[Tuple[int, str, dict]] = []  # (receita, hash antigo, registro)
+        seen_keys: Set[str] = set()
+
+        def resolve_category(name: str) -> int:
+            cat_id = categories.get(name)
+            if cat_id is None:
+                cursor.execute(
+                    "INSERT INTO categories (name, user_id, icon) VALUES (?, NULL, 'restaurant')", (name,))
                 cat_id = cursor.lastrowid
+                conn.commit()
+                invalidate_category_cache()
+                categories[name] = cat_id
+            return cat_id
 
-            # 2. Define Imagem (Se não tiver no JSON, usa a lógica automática)
-            image_url = r.get('image_path')
-            if not image_url:
-                image_url = _get_image_for_title(r['title'])
-
-            # 3. Insere Receita
-            cursor.execute("""
-                INSERT INTO recipes (user_id, category_id, title, preparation_time, servings, instructions, image_path)
-                VALUES (1, ?, ?, ?, ?, ?, ?)
-            """, (
-                cat_id, 
-                r['title'], 
-                r.get('preparation_time'), 
-                r.get('servings'), 
-                r.get('instructions'),
-                image_url # <--- Imagem Injetada
-            ))
-            
-            recipe_id = cursor.lastrowid
-
-            # 4. Insere Ingredientes
-            for ing in r.get('ingredients', []):
-                cursor.execute("""
-                    INSERT INTO recipe_ingredients (recipe_id, name, quantity, unit)
-                    VALUES (?, ?, ?, ?)
-                """, (recipe_id, ing['name'], ing.get('quantity'), ing.get('unit')))
+        def to_recipe(r: dict) -> dict:
+            title = r.get('title') or ""
+            return {
+                # Itens sem categoria/título são reportados pela validação do lote
+                "category_id": resolve_category(r['category']) if r.get('category') else None,
+                "title": title,
+                "preparation_time": r.get('preparation_time'),
+                "servings": r.get('servings'),
+                "instructions": r.get('instructions'),
+                "additional_instructions": r.get('additional_instructions'),
+                "source": r.get('source'),
+                # Se não tiver no JSON, usa a lógica automática
+                "image_path": r.get('image_path') or _get_image_for_title(title),
+                "ingredients": r.get('ingredients', []),
+            }
 
+        def new_recipes() -> Iterator[dict]:
+            index = 0
+            for r in records:
+                content_hash = _content_hash(r)
+                key = _seed_key(r)
+                if key in seen_keys:
+                    logger.warning(
+                        f"SEEDER: Chave repetida '{key}' no seed; use um 'id' explícito. Controlada só pelo hash.")
+                    key = None
+                elif key is not None:
+                    seen_keys.add(key)
+
+                if content_hash in seeded:
+                    if key is not None and hash_keys.get(content_hash) != key and key not in by_key:
+                        rebound.append((key, content_hash))
+                    continue
+                seeded.add(content_hash)
+
+                if key in by_key:
+                    old_hash, recipe_id = by_key[key]
+                    if recipe_id is None:
+                        retagged.append((content_hash, old_hash))
+                    else:
+                        changed.append((recipe_id, old_hash, r))
+                    continue
+
+                legacy_id = legacy.pop(r.get('title'), None)
+                if legacy_id is not None:
+                    adopted.append((content_hash, legacy_id, key))
+                    continue
+
+                pending[index] = (content_hash, key)
+                index += 1
+                yield to_recipe(r)
+
+        def record_hashes(cur, inserted: List[Tuple[int, int]]):
+            cur.executemany("INSERT INTO native_recipe_seeds (content_hash, seed_key, recipe_id) VALUES (?, ?, ?)",
+                            [pending.pop(index) + (rid,) for index, rid in inserted])
+
+        queries = RecipeQueries()
+        created, failures = queries.create_recipes_bulk(
+            new_recipes(), SYSTEM_USER_ID, chunk_size=chunk_size, on_chunk=record_hashes)
+
+        if adopted:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO native_recipe_seeds (content_hash, recipe_id, seed_key) VALUES (?, ?, ?)", adopted)
+        if rebound:
+            cursor.executemany(
+                "UPDATE OR IGNORE native_recipe_seeds SET seed_key = ? WHERE content_hash = ?", rebound)
+        if retagged:
+            cursor.executemany(
+                "UPDATE native_recipe_seeds SET content_hash = ? WHERE content_hash = ?", retagged)
         conn.commit()
-        logger.info(f"SEEDER: Sucesso! {len(recipes)} receitas nativas importadas com imagens.")
+
+        # Correções no JSON: atualiza no lugar (ingredientes por diferença) e só
+        # então grava o hash novo; uma falha no meio é refeita no próximo seed.
+        updated = 0
+        for recipe_id, old_hash, r in changed:
+            try:
+                item = to_recipe(r)
+                data = RecipeCreate(**{**item, "ingredients": normalize_ingredients(item["ingredients"])})
+            except (ValueError, TypeError) as e:
+                logger.warning(f"SEEDER: Correção da receita nativa {recipe_id} ignorada: {e}")
+                continue
+            if not queries.update_recipe(recipe_id, data, SYSTEM_USER_ID):
+                logger.warning(f"SEEDER: Falha ao atualizar a receita nativa {recipe_id}.")
+                continue
+            cursor.execute("UPDATE native_recipe_seeds SET content_hash = ? WHERE content_hash = ?",
+                           (_content_hash(r), old_hash))
+            conn.commit()
+            updated += 1
+
+        for index, error in failures:
+            logger.warning(f"SEEDER: Receita nativa #{index} ignorada: {error}")
+        if updated:
+            logger.info(f"SEEDER: {updated} receitas nativas atualizadas.")
+        if created:
+            logger.info(
+                f"SEEDER: Sucesso! {len(created)} receitas nativas importadas com imagens.")
+        elif not updated:
+            logger.info("SEEDER: Banco de dados já populado. Nada a semear.")
+        return len(created)
 
     except Exception as e:
         conn.rollback()
         logger.error(f"SEEDER: Falha crítica ao popular banco: {e}")
-    finally:
-        conn.close()
\ No newline at end of file
+        return 0
@@ -0,0 +1,184 @@
+# ARQUIVO: src/database/session_queries.py
+"""
+Sessões persistentes: evitam repetir a verificação bcrypt em reconexões/novas abas.
+
+Token entregue ao cliente: "<id da sessão>.<HMAC-SHA256 do id>". A assinatura é
+conferida em tempo constante antes de qualquer acesso ao banco (tokens forjados
+custam só um HMAC); o banco guarda apenas o SHA-256 do id, consultado pela PK.
+Sessões válidas ficam num LRU em memória com TTL curto.
+"""
+import base64
+import hashlib
+import hmac
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from src.core.logger import get_logger
+from src.database.database import db_connection, get_db_path
+from src.database.settings_queries import setdefault_setting
+from src.models.user_model import User
+
+logger = get_logger("src.database.session")
+
+SESSION_PREF_KEY = "session_token"  # Chave no armazenamento do cliente
+SESSION_TTL = 30 * 24 * 3600  # Validade da sessão (segundos)
+SESSION_CACHE_SIZE = 1024
+SESSION_CACHE_TTL = 300  # Revalida no banco a cada 5 min (revogações de outros processos)
+
+
+class _SessionCache:
+    """LRU com TTL: token_hash -> (usuário, expira_em)."""
+
+    def __init__(self, max_size: int = SESSION_CACHE_SIZE):
+        self.max_size = max_size
+        self._items: "OrderedDict[str, Tuple[User, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[User]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if item[1] <= time.time():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def put(self, key: str, user: User, expires_at: float):
+        with self._lock:
+            self._items[key] = (user, expires_at)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def discard(self, key: str):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_cache = _SessionCache()
+_secrets: Dict[str, bytes] = {}
+
+
+def _secret() -> bytes:
+    """Chave HMAC por banco, gerada na primeira utilização e guardada em app_settings."""
+    path = get_db_path()
+    key = _secrets.get(path)
+    if key is None:
+        stored = setdefault_setting("session_secret", secrets.token_hex(32))
+        if not stored:
+            raise RuntimeError("Chave de sessão indisponível.")
+        key = _secrets[path] = bytes.fromhex(stored)
+    return key
+
+
+def _sign(session_id: str) -> str:
+    digest = hmac.new(_secret(), session_id.encode("ascii"), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def _token_hash(session_id: str) -> str:
+    return hashlib.sha256(session_id.encode("ascii")).hexdigest()
+
+
+def _split_token(token: Optional[str]) -> Optional[str]:
+    """Retorna o id da sessão se a assinatura confere (comparação em tempo constante)."""
+    if not token or not isinstance(token, str) or token.count(".") != 1:
+        return None
+    session_id, signature = token.split(".")
+    try:
+        expected = _sign(session_id)
+    except (UnicodeEncodeError, RuntimeError):
+        return None
+    if not hmac.compare_digest(signature.encode("ascii", "replace"), expected.encode("ascii")):
+        return None
+    return session_id
+
+
+def create_session(user: User, ttl: int = SESSION_TTL) -> Optional[str]:
+    """Emite um token de sessão para o usuário autenticado."""
+    session_id = secrets.token_urlsafe(32)
+    now = time.time()
+    try:
+        token = f"{session_id}.{_sign(session_id)}"
+        with db_connection() as conn:
+            conn.execute("INSERT INTO sessions (token_hash, user_id, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                         (_token_hash(session_id), user.id, now, now + ttl))
+            conn.commit()
+    except (sqlite3.Error, RuntimeError) as e:
+        logger.error(f"Erro ao criar sessão: {e}")
+        return None
+    _cache.put(_token_hash(session_id), user,
+               min(now + SESSION_CACHE_TTL, now + ttl))
+    logger.info(f"Sessão criada para usuário {user.id}.")
+    return token
+
+
+def validate_session(token: Optional[str]) -> Optional[User]:
+    """Usuário dono do token, ou None se inválido/expirado/revogado."""
+    session_id = _split_token(token)
+    if session_id is None:
+        return None
+    key = _token_hash(session_id)
+
+    user = _cache.get(key)
+    if user is not None:
+        return user
+
+    now = time.time()
+    try:
+        with db_connection() as conn:
+            row = conn.execute("""
+                SELECT u.id, u.full_name, u.email, s.expires_at
+                FROM sessions s JOIN users u ON u.id = s.user_id
+                WHERE s.token_hash = ? AND s.expires_at > ?
+            """, (key, now)).fetchone()
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao validar sessão: {e}")
+        return None
+    if row is None:
+        return None
+
+    user = User(id=row[0], full_name=row[1], email=row[2])
+    _cache.put(key, user, min(now + SESSION_CACHE_TTL, row[3]))
+    return user
+
+
+def revoke_session(token: Optional[str]) -> bool:
+    """Encerra a sessão (logout)."""
+    session_id = _split_token(token)
+    if session_id is None:
+        return False
+    key = _token_hash(session_id)
+    _cache.discard(key)
+    try:
+        with db_connection() as conn:
+            cur = conn.execute("DELETE FROM sessions WHERE token_hash = ?", (key,))
+            conn.commit()
+            return cur.rowcount > 0
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao revogar sessão: {e}")
+        return False
+
+
+def purge_expired_sessions() -> int:
+    """Remove sessões vencidas (chamado na inicialização)."""
+    try:
+        with db_connection() as conn:
+            cur = conn.execute(
+                "DELETE FROM sessions WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+            if cur.rowcount:
+                logger.info(f"{cur.rowcount} sessões expiradas removidas.")
+            return cur.rowcount
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao limpar sessões: {e}")
+        return 0
@@ -0,0 +1,49 @@
+# ARQUIVO: src/database/settings_queries.py
+import sqlite3
+from typing import Optional
+from src.core.logger import get_logger
+from src.database.database import db_connection
+
+logger = get_logger("src.database.settings")
+
+
+def get_setting(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Lê uma configuração persistida (tabela app_settings)."""
+    try:
+        with db_connection() as conn:
+            row = conn.execute(
+                "SELECT value FROM app_settings WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao ler configuração '{key}': {e}")
+        return default
+
+
+def set_setting(key: str, value: str) -> bool:
+    """Grava (ou substitui) uma configuração persistida."""
+    try:
+        with db_connection() as conn:
+            conn.execute("""
+                INSERT INTO app_settings (key, value) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+            """, (key, str(value)))
+            conn.commit()
+        return True
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao gravar configuração '{key}': {e}")
+        return False
+
+
+def setdefault_setting(key: str, value: str) -> Optional[str]:
+    """Grava `value` só se a chave não existir; retorna o valor efetivo (atômico)."""
+    try:
+        with db_connection() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO app_settings (key, value) VALUES (?, ?)", (key, str(value)))
+            conn.commit()
+            row = conn.execute(
+                "SELECT value FROM app_settings WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao gravar configuração '{key}': {e}")
+        return None
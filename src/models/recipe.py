@@ -1,7 +1,8 @@
 # ARQUIVO: src/models/recipe.py
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+from src.utils.schema_org import servings_count
 
 # --- 1. Sub-model para Ingredientes ---
 
@@ -23,6 +24,7 @@ class RecipeBase(BaseModel):
     title: str = Field(..., min_length=3, max_length=5000)
     preparation_time: Optional[int] = Field(None, ge=1)
     servings: Optional[str] = Field(None)
+    servings_count: Optional[int] = Field(None, ge=1, description="Porções (numérico, para filtros)")
     instructions: str = Field(..., min_length=1)
 
     # [SPRINT 5] Novos Campos
@@ -32,6 +34,13 @@ class RecipeBase(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @model_validator(mode="after")
+    def _derive_servings_count(self):
+        """Preenche servings_count a partir do texto de porções quando não informado."""
+        if self.servings_count is None and self.servings:
+            self.servings_count = servings_count(self.servings)
+        return self
+
 # --- 3. Model Criação ---
 
 
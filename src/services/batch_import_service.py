@@ -0,0 +1,200 @@
+# ARQUIVO: src/services/batch_import_service.py
+"""
+Importação em lote de receitas a partir de uma lista de URLs (colada ou arquivo,
+inclusive exportação de favoritos do navegador).
+
+Pipeline (asyncio):
+  download concorrente (limite global + por host + intervalo mínimo por host)
+  -> extração do JSON-LD em pool de processos (CPU, fora do loop de eventos)
+  -> gravação em blocos via RecipeQueries.create_recipes_bulk.
+O progresso é entregue item a item por um iterador assíncrono.
+"""
+import asyncio
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.core.logger import get_logger
+from src.database.recipe_queries import RecipeQueries
+from src.services import http_client
+from src.services.scraper_service import RecipeScraper
+
+logger = get_logger("src.services.batch_import")
+
+MAX_CONCURRENCY = 8  # Downloads simultâneos no total
+HOST_CONCURRENCY = 2  # Downloads simultâneos por site
+HOST_MIN_INTERVAL = 0.5  # Segundos entre inícios de requisição no mesmo site
+BULK_FLUSH_SIZE = 25  # Receitas por gravação em lote
+PARSE_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+_URL_PATTERN = re.compile(r"https?://[^\s\"'<>]+", re.IGNORECASE)
+
+
+def parse_url_list(text: str) -> List[str]:
+    """URLs http(s) de um texto livre ou HTML de favoritos, sem repetições, na ordem."""
+    seen = set()
+    urls = []
+    for match in _URL_PATTERN.finditer(text or ""):
+        url = match.group(0).rstrip(".,;)")
+        if url not in seen:
+            seen.add(url)
+            urls.append(url)
+    return urls
+
+
+def read_url_file(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return parse_url_list(f.read())
+
+
+@dataclass
+class ImportProgress:
+    """Evento de progresso: um por URL concluída."""
+    done: int
+    total: int
+    url: str
+    error: Optional[str] = None
+    title: Optional[str] = None
+
+
+@dataclass
+class BatchImportResult:
+    created_ids: List[int] = field(default_factory=list)
+    failures: List[Tuple[str, str]] = field(default_factory=list)  # (url, erro)
+
+
+class _HostGate:
+    """Limite de concorrência + espaçamento mínimo entre requisições de um host."""
+
+    def __init__(self, concurrency: int, min_interval: float):
+        self._slots = asyncio.Semaphore(concurrency)
+        self._lock = asyncio.Lock()
+        self._min_interval = min_interval
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._slots.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            # A espera fica sob o lock e o próximo horário parte da liberação real:
+            # um despertar atrasado não encurta o intervalo para a requisição seguinte.
+            async with self._lock:
+                wait = self._next_start - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_start = loop.time() + self._min_interval
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def __aexit__(self, *exc):
+        self._slots.release()
+
+
+def _to_recipe_dict(data: Dict, category_id: int) -> Dict:
+    """Converte o formato do scraper (strings de formulário) para o de RecipeCreate."""
+    prep = str(data.get("preparation_time") or "")
+    return {
+        "category_id": category_id,
+        "title": data.get("title") or "",
+        "preparation_time": int(prep) if prep.isdigit() and int(prep) > 0 else None,
+        "servings": data.get("servings") or None,
+        "servings_count": data.get("servings_count"),
+        "instructions": data.get("instructions") or "",
+        "additional_instructions": data.get("additional_instructions") or None,
+        "source": data.get("source"),
+        "image_path": data.get("image_path") or None,
+        "ingredients": [i for i in data.get("ingredients", []) if len(i.get("name", "").strip()) >= 2],
+    }
+
+
+class BatchImporter:
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY, host_concurrency: int = HOST_CONCURRENCY,
+                 host_min_interval: float = HOST_MIN_INTERVAL, flush_size: int = BULK_FLUSH_SIZE,
+                 parse_executor: Optional[Executor] = None, db: Optional[RecipeQueries] = None):
+        self.max_concurrency = max_concurrency
+        self.host_concurrency = host_concurrency
+        self.host_min_interval = host_min_interval
+        self.flush_size = flush_size
+        self._parse_executor = parse_executor
+        self.db = db or RecipeQueries()
+
+    def _create_parse_executor(self) -> Tuple[Executor, bool]:
+        if self._parse_executor is not None:
+            return self._parse_executor, False
+        try:
+            return ProcessPoolExecutor(max_workers=PARSE_WORKERS), True
+        except (OSError, NotImplementedError, ImportError) as e:
+            # Plataformas sem multiprocessing (ex.: Android): threads
+            logger.warning(f"Pool de processos indisponível ({e}). Usando threads.")
+            return ThreadPoolExecutor(max_workers=PARSE_WORKERS), True
+
+    async def import_urls(self, urls: List[str], user_id: int, category_id: int,
+                          result: Optional[BatchImportResult] = None) -> AsyncIterator[ImportProgress]:
+        """
+        Importa as URLs e produz um ImportProgress a cada URL concluída.
+        `result` (opcional) acumula ids criados e falhas ao final.
+        """
+        result = result if result is not None else BatchImportResult()
+        total = len(urls)
+        if not total:
+            return
+
+        loop = asyncio.get_running_loop()
+        executor, owns_executor = self._create_parse_executor()
+        global_slots = asyncio.Semaphore(self.max_concurrency)
+        gates: Dict[str, _HostGate] = {}
+        pending: List[Tuple[str, Dict]] = []
+        queue: "asyncio.Queue[Tuple[str, Optional[Dict], Optional[str]]]" = asyncio.Queue()
+
+        async def process(url: str):
+            try:
+                host = urlsplit(url).netloc.lower()
+                gate = gates.setdefault(
+                    host, _HostGate(self.host_concurrency, self.host_min_interval))
+                async with global_slots:
+                    async with gate:
+                        response = await asyncio.to_thread(http_client.fetch, url)
+                error, data = await loop.run_in_executor(
+                    executor, RecipeScraper.parse_html, response.content, url, response.encoding)
+                await queue.put((url, data, error))
+            except Exception as e:
+                await queue.put((url, None, f"Erro de conexão: {e}"))
+
+        async def flush():
+            batch = list(pending)
+            pending.clear()
+            created, failures = await asyncio.to_thread(
+                self.db.create_recipes_bulk,
+                [_to_recipe_dict(data, category_id) for _, data in batch], user_id)
+            result.created_ids.extend(created)
+            for index, error in failures:
+                result.failures.append((batch[index][0], error))
+
+        tasks = [asyncio.create_task(process(url)) for url in urls]
+        try:
+            for done in range(1, total + 1):
+                url, data, error = await queue.get()
+                if error:
+                    result.failures.append((url, error))
+                else:
+                    pending.append((url, data))
+                    if len(pending) >= self.flush_size:
+                        await flush()
+                yield ImportProgress(done=done, total=total, url=url, error=error,
+                                     title=data.get("title") if data else None)
+            if pending:
+                await flush()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if owns_executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(
+            f"Importação em lote: {len(result.created_ids)} receitas, {len(result.failures)} falhas.")
@@ -0,0 +1,279 @@
+# ARQUIVO: src/services/http_client.py
+"""
+Cliente HTTP compartilhado pelos serviços de importação.
+
+- Uma única requests.Session com pool de conexões (keep-alive entre importações).
+- Cache em disco que respeita Cache-Control/Expires (resposta fresca: nenhuma
+  requisição) e ETag/Last-Modified (resposta velha: GET condicional, 304 reaproveita
+  o corpo salvo). Tamanho total limitado, com descarte LRU.
+"""
+import email.utils
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.core.logger import get_logger
+
+logger = get_logger("src.services.http")
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+HTTP_TIMEOUT = 10
+HTTP_POOL_SIZE = 16  # Conexões mantidas por host
+HTTP_CACHE_DIR = os.path.join("data", "http_cache")
+HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class HttpResponse:
+    """Resposta final entregue aos serviços (rede ou cache)."""
+    url: str
+    status_code: int
+    content: bytes
+    encoding: Optional[str]
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False  # Corpo veio do disco (fresco ou revalidado com 304)
+    revalidated: bool = False  # Houve GET condicional respondido com 304
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+def _freshness_lifetime(headers: Dict[str, str], now: float) -> Optional[float]:
+    """Segundos de validade segundo Cache-Control/Expires (None se não informado)."""
+    cache_control = headers.get("cache-control", "")
+    if re.search(r"no-cache", cache_control, re.IGNORECASE):
+        return 0.0
+    match = _MAX_AGE.search(cache_control)
+    if match:
+        return float(match.group(1))
+    expires = headers.get("expires")
+    if expires:
+        try:
+            return max(0.0, email.utils.parsedate_to_datetime(expires).timestamp() - now)
+        except (TypeError, ValueError):
+            return 0.0
+    return None
+
+
+def _is_storable(headers: Dict[str, str]) -> bool:
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control or headers.get("vary", "").strip() == "*":
+        return False
+    has_validator = "etag" in headers or "last-modified" in headers
+    return has_validator or bool(_freshness_lifetime(headers, time.time()))
+
+
+class HttpCache:
+    """
+    Cache em disco: <chave>.json (metadados) + <chave>.body (corpo), chave = SHA-256 da URL.
+    O índice LRU fica em memória (reconstruído pelo mtime ao abrir) e o total de bytes
+    nunca passa de `max_bytes`.
+    """
+
+    _KEPT_HEADERS = ("etag", "last-modified", "cache-control", "expires", "content-type", "vary")
+
+    def __init__(self, directory: str = HTTP_CACHE_DIR, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: Optional["OrderedDict[str, int]"] = None  # chave -> bytes
+        self._total = 0
+
+    # --- Índice LRU ---
+    def _load_index(self):
+        if self._index is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".body"):
+                continue
+            key = name[:-5]
+            try:
+                body = os.stat(os.path.join(self.directory, name))
+                meta = os.stat(self._path(key, "json"))
+            except OSError:
+                continue
+            entries.append((body.st_mtime, key, body.st_size + meta.st_size))
+        self._index = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._total = sum(self._index.values())
+
+    def _path(self, key: str, ext: str) -> str:
+        return os.path.join(self.directory, f"{key}.{ext}")
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _remove(self, key: str):
+        self._total -= self._index.pop(key, 0)
+        for ext in ("body", "json"):
+            try:
+                os.remove(self._path(key, ext))
+            except OSError:
+                pass
+
+    # --- API ---
+    def get(self, url: str) -> Optional[Dict]:
+        """Metadados + corpo da entrada, ou None. Marca a entrada como usada (LRU)."""
+        key = self.key_for(url)
+        with self._lock:
+            self._load_index()
+            if key not in self._index:
+                return None
+            try:
+                with open(self._path(key, "json"), "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                with open(self._path(key, "body"), "rb") as f:
+                    meta["content"] = f.read()
+                os.utime(self._path(key, "body"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Entrada de cache corrompida descartada: {e}")
+                self._remove(key)
+                return None
+            self._index.move_to_end(key)
+            return meta
+
+    def put(self, url: str, status_code: int, headers: Dict[str, str], content: bytes,
+            encoding: Optional[str]):
+        """Grava a resposta (se armazenável) e descarta as entradas menos usadas."""
+        if not _is_storable(headers):
+            return
+        key = self.key_for(url)
+        now = time.time()
+        meta = {
+            "url": url,
+            "status_code": status_code,
+            "encoding": encoding,
+            "headers": {k: v for k, v in headers.items() if k in self._KEPT_HEADERS},
+            "stored_at": now,
+            "lifetime": _freshness_lifetime(headers, now) or 0.0,
+        }
+        raw_meta = json.dumps(meta).encode("utf-8")
+        size = len(content) + len(raw_meta)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._load_index()
+            self._remove(key)
+            try:
+                # Corpo primeiro: um .json sem .body nunca é indexado
+                with open(self._path(key, "body"), "wb") as f:
+                    f.write(content)
+                with open(self._path(key, "json"), "wb") as f:
+                    f.write(raw_meta)
+            except OSError as e:
+                logger.warning(f"Falha ao gravar cache HTTP: {e}")
+                self._remove(key)
+                return
+            self._index[key] = size
+            self._total += size
+            while self._total > self.max_bytes and self._index:
+                oldest = next(iter(self._index))
+                self._remove(oldest)
+                logger.debug(f"Cache HTTP: entrada descartada (LRU) {oldest[:12]}")
+
+    def refresh(self, url: str, entry: Dict, headers: Dict[str, str]):
+        """Após um 304: aplica os novos cabeçalhos de validade, mantendo o corpo."""
+        merged = dict(entry["headers"])
+        merged.update({k: v for k, v in headers.items() if k in self._KEPT_HEADERS})
+        self.put(url, entry["status_code"], merged, entry["content"], entry["encoding"])
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._load_index()
+            return self._total
+
+    def clear(self):
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                self._remove(key)
+
+
+class HttpClient:
+    """Sessão HTTP compartilhada + cache de respostas."""
+
+    def __init__(self, cache: Optional[HttpCache] = None, pool_size: int = HTTP_POOL_SIZE):
+        self.cache = cache
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = DEFAULT_USER_AGENT
+
+    @staticmethod
+    def _from_entry(url: str, entry: Dict, revalidated: bool) -> HttpResponse:
+        return HttpResponse(url=url, status_code=entry["status_code"], content=entry["content"],
+                            encoding=entry["encoding"], headers=entry["headers"],
+                            from_cache=True, revalidated=revalidated)
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None,
+              timeout: float = HTTP_TIMEOUT) -> HttpResponse:
+        """
+        GET com cache. Levanta requests.RequestException em falha de rede/status HTTP,
+        como requests.get + raise_for_status.
+        """
+        entry = self.cache.get(url) if self.cache else None
+        if entry and time.time() - entry["stored_at"] < entry["lifetime"]:
+            logger.debug(f"Cache HTTP (fresco): {url}")
+            return self._from_entry(url, entry, revalidated=False)
+
+        request_headers = dict(headers or {})
+        if entry:
+            if "etag" in entry["headers"]:
+                request_headers["If-None-Match"] = entry["headers"]["etag"]
+            if "last-modified" in entry["headers"]:
+                request_headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        response = self.session.get(url, headers=request_headers, timeout=timeout)
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+
+        if response.status_code == 304 and entry:
+            logger.debug(f"Cache HTTP (304 revalidado): {url}")
+            self.cache.refresh(url, entry, response_headers)
+            return self._from_entry(url, entry, revalidated=True)
+
+        response.raise_for_status()
+        encoding = response.encoding or response.apparent_encoding
+        if self.cache and response.status_code == 200:
+            self.cache.put(url, response.status_code, response_headers,
+                           response.content, encoding)
+        return HttpResponse(url=url, status_code=response.status_code, content=response.content,
+                            encoding=encoding, headers=response_headers)
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Cliente do processo (criado sob demanda), compartilhado pelos serviços."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient(HttpCache())
+    return _client
+
+
+def fetch(url: str, headers: Optional[Dict[str, str]] = None,
+          timeout: float = HTTP_TIMEOUT) -> HttpResponse:
+    return get_http_client().fetch(url, headers=headers, timeout=timeout)
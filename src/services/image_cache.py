@@ -0,0 +1,248 @@
+# ARQUIVO: src/services/image_cache.py
+"""
+Cache local das imagens de receita (image_path com URL).
+
+- Cada URL é baixada uma vez; o original fica em disco (chave = SHA-256 da URL).
+- Miniaturas por uso (THUMBNAIL_SIZES: lista 60 px, grade 220 px, destaque 250 px,
+  lado menor) são geradas do original e guardadas à parte: as telas recebem
+  poucos KB por card em vez da imagem inteira, inclusive offline.
+- Originais e miniaturas têm limites de tamanho independentes, com descarte LRU.
+- Downloads em segundo plano (pool de threads), um só por URL mesmo que vários
+  cards peçam a mesma imagem.
+
+Pillow é opcional (importação defensiva): sem ele, a "miniatura" é o próprio
+original em cache (ainda baixado uma vez só e disponível offline).
+"""
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from src.core.logger import get_logger
+from src.services.http_client import HttpClient
+
+logger = get_logger("src.services.image_cache")
+
+HAS_PIL = False
+try:
+    from PIL import Image, ImageOps
+    HAS_PIL = True
+except ImportError:
+    logger.warning("Miniaturas indisponíveis: Pillow não instalado (usando originais).")
+
+IMAGE_CACHE_DIR = os.path.join("data", "image_cache")
+ORIGINALS_MAX_BYTES = 100 * 1024 * 1024
+THUMBNAILS_MAX_BYTES = 30 * 1024 * 1024
+THUMBNAIL_SIZES = {"list": 60, "grid": 220, "hero": 250}  # Lado menor, em px
+THUMBNAIL_QUALITY = 85
+IMAGE_MAX_DOWNLOAD_BYTES = 15 * 1024 * 1024
+IMAGE_WORKERS = 4
+
+
+def is_remote_image(src: Optional[str]) -> bool:
+    return bool(src) and src.startswith(("http://", "https://"))
+
+
+class DiskLru:
+    """Arquivos em `directory` com total limitado a `max_bytes` (descarta os menos usados)."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: Optional["OrderedDict[str, int]"] = None  # nome -> bytes
+        self._total = 0
+
+    def _load_index(self):
+        if self._index is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".tmp"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name, stat.st_size))
+        self._index = OrderedDict((name, size) for _, name, size in sorted(entries))
+        self._total = sum(self._index.values())
+
+    def _remove(self, name: str):
+        self._total -= self._index.pop(name, 0)
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            self._load_index()
+            if name not in self._index:
+                return None
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)
+            except OSError:
+                self._remove(name)
+                return None
+            self._index.move_to_end(name)
+            return data
+
+    def put(self, name: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            self._load_index()
+            self._remove(name)
+            path = os.path.join(self.directory, name)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)  # Escrita atômica
+            except OSError as e:
+                logger.warning(f"Falha ao gravar cache de imagem: {e}")
+                return
+            self._index[name] = len(data)
+            self._total += len(data)
+            while self._total > self.max_bytes and self._index:
+                self._remove(next(iter(self._index)))
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._load_index()
+            return self._total
+
+
+def make_thumbnail(data: bytes, size: int) -> bytes:
+    """JPEG/PNG com o lado menor = `size` (nunca amplia). Exige Pillow."""
+    with Image.open(io.BytesIO(data)) as image:
+        scale = size / min(image.size)
+        if scale < 1.0:
+            image.draft("RGB", (int(image.width * scale), int(image.height * scale)))
+        image = ImageOps.exif_transpose(image)
+        scale = size / min(image.size)
+        if scale < 1.0:
+            image = image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+                                 Image.LANCZOS)
+        out = io.BytesIO()
+        if image.mode in ("RGBA", "LA", "P"):
+            image.save(out, "PNG", optimize=True)
+        else:
+            image.convert("RGB").save(out, "JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        return out.getvalue()
+
+
+class ImageCache:
+
+    def __init__(self, directory: str = IMAGE_CACHE_DIR, client: Optional[HttpClient] = None,
+                 originals_max_bytes: int = ORIGINALS_MAX_BYTES,
+                 thumbnails_max_bytes: int = THUMBNAILS_MAX_BYTES, workers: int = IMAGE_WORKERS):
+        self.originals = DiskLru(os.path.join(directory, "originals"), originals_max_bytes)
+        self.thumbnails = DiskLru(os.path.join(directory, "thumbnails"), thumbnails_max_bytes)
+        # Sem HttpCache: as imagens já ficam guardadas aqui
+        self.client = client or HttpClient(cache=None)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image_cache")
+        self._pending: Dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _thumb_name(key: str, variant: str) -> str:
+        return f"{key}_{THUMBNAIL_SIZES[variant]}"
+
+    def _original(self, url: str) -> Optional[bytes]:
+        key = self.key_for(url)
+        data = self.originals.get(key)
+        if data is not None:
+            return data
+        try:
+            response = self.client.fetch(url)
+        except Exception as e:
+            logger.warning(f"Imagem indisponível ({url}): {e}")
+            return None
+        if len(response.content) > IMAGE_MAX_DOWNLOAD_BYTES:
+            logger.warning(f"Imagem grande demais ignorada: {url}")
+            return None
+        self.originals.put(key, response.content)
+        return response.content
+
+    def _thumbnail(self, url: str, variant: str) -> Optional[bytes]:
+        name = self._thumb_name(self.key_for(url), variant)
+        data = self.thumbnails.get(name)
+        if data is not None:
+            return data
+        original = self._original(url)
+        if original is None or not HAS_PIL:
+            return original
+        try:
+            data = make_thumbnail(original, THUMBNAIL_SIZES[variant])
+        except Exception as e:  # Arquivo que não é imagem, formato não suportado...
+            logger.warning(f"Miniatura não gerada ({url}): {e}")
+            return original
+        self.thumbnails.put(name, data)
+        return data
+
+    # --- API ---
+    def cached(self, url: str, variant: str) -> Optional[bytes]:
+        """Miniatura já pronta em disco (sem rede nem redimensionar); None se não houver."""
+        if not HAS_PIL:
+            return self.originals.get(self.key_for(url))
+        return self.thumbnails.get(self._thumb_name(self.key_for(url), variant))
+
+    def get(self, url: str, variant: str) -> Optional[bytes]:
+        """Miniatura, baixando o original se preciso (bloqueante). None se indisponível."""
+        return self._thumbnail(url, variant)
+
+    def load(self, url: str, variant: str) -> Future:
+        """get() em segundo plano; pedidos simultâneos da mesma imagem compartilham o Future."""
+        job = f"{url}|{variant}"
+        with self._pending_lock:
+            future = self._pending.get(job)
+            if future is None:
+                future = self._executor.submit(self.get, url, variant)
+                self._pending[job] = future
+                future.add_done_callback(lambda _: self._forget(job))
+            return future
+
+    def _forget(self, job: str):
+        with self._pending_lock:
+            self._pending.pop(job, None)
+
+    def load_into(self, url: str, variant: str, callback: Callable[[Optional[bytes]], None]):
+        """Chama `callback(bytes ou None)` quando a miniatura estiver pronta (thread de fundo)."""
+        def done(future: Future):
+            try:
+                callback(future.result())
+            except Exception as e:
+                logger.debug(f"Imagem descartada ({url}): {e}")
+        self.load(url, variant).add_done_callback(done)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.client.close()
+
+
+_cache: Optional[ImageCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """Cache do processo (criado sob demanda), compartilhado pelas telas."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ImageCache()
+    return _cache
@@ -0,0 +1,115 @@
+# ARQUIVO: src/services/jsonld_extractor.py
+"""
+Extração do objeto Schema.org/Recipe do JSON-LD de uma página.
+
+Caminho rápido: varre o documento (str ou bytes) atrás de blocos
+<script type="application/ld+json"> com regex, sem montar a árvore HTML,
+e para no primeiro bloco que contém uma Recipe.
+Caminho lento (BeautifulSoup) só quando a página cita ld+json mas a
+varredura não conseguiu aproveitar nenhum bloco (marcação atípica).
+"""
+import json
+import re
+from typing import Any, Dict, Iterator, Optional, Union
+
+from src.core.logger import get_logger
+
+logger = get_logger("src.services.jsonld")
+
+Document = Union[str, bytes]
+
+_SCRIPT_OPEN = r"<script\b[^>]*?\btype\s*=\s*[\"']?\s*application/ld\+json\b[^>]*>"
+_SCRIPT_CLOSE = r"</script\s*>"
+_OPEN = {str: re.compile(_SCRIPT_OPEN, re.IGNORECASE),
+         bytes: re.compile(_SCRIPT_OPEN.encode(), re.IGNORECASE)}
+_CLOSE = {str: re.compile(_SCRIPT_CLOSE, re.IGNORECASE),
+          bytes: re.compile(_SCRIPT_CLOSE.encode(), re.IGNORECASE)}
+_MARKER = {str: re.compile(r"ld\+json", re.IGNORECASE),
+           bytes: re.compile(rb"ld\+json", re.IGNORECASE)}
+
+# Invólucros legados ao redor do JSON: <!-- -->, //<![CDATA[ //]]>
+_WRAPPERS = re.compile(r"^\s*(?:<!--|(?://\s*)?<!\[CDATA\[)|(?:-->|(?://\s*)?\]\]>)\s*$")
+
+
+def find_recipe(data: Any) -> Optional[Dict]:
+    """Busca profunda pelo objeto Recipe dentro do JSON-LD (pode estar aninhado ou em grafo)."""
+    if isinstance(data, dict):
+        if 'Recipe' in data.get('@type', ''):
+            return data
+        if '@graph' in data:
+            return find_recipe(data['@graph'])
+        return None
+    elif isinstance(data, list):
+        for item in data:
+            res = find_recipe(item)
+            if res:
+                return res
+    return None
+
+
+def iter_jsonld_blocks(document: Document) -> Iterator[Document]:
+    """Conteúdo bruto de cada <script type="application/ld+json">, na ordem, sob demanda."""
+    kind = bytes if isinstance(document, (bytes, bytearray)) else str
+    open_tag, close_tag = _OPEN[kind], _CLOSE[kind]
+    pos = 0
+    while True:
+        start = open_tag.search(document, pos)
+        if not start:
+            return
+        end = close_tag.search(document, start.end())
+        if not end:
+            return
+        yield document[start.end():end.start()]
+        pos = end.end()
+
+
+def _load_block(raw: Document, encoding: Optional[str]) -> Any:
+    text = raw.decode(encoding or "utf-8", errors="replace") if isinstance(raw, (bytes, bytearray)) else raw
+    text = _WRAPPERS.sub("", text.strip())
+    return json.loads(text)
+
+
+def _scan(document: Document, encoding: Optional[str]) -> tuple[Optional[Dict], bool]:
+    """(Recipe encontrada, algum bloco foi decodificado)."""
+    decoded_any = False
+    for raw in iter_jsonld_blocks(document):
+        try:
+            data = _load_block(raw, encoding)
+        except ValueError:
+            continue
+        decoded_any = True
+        recipe = find_recipe(data)
+        if recipe:
+            return recipe, True
+    return None, decoded_any
+
+
+def extract_recipe_soup(document: Document, encoding: Optional[str] = None) -> Optional[Dict]:
+    """Implementação de referência via BeautifulSoup (árvore completa)."""
+    from bs4 import BeautifulSoup
+
+    if isinstance(document, (bytes, bytearray)):
+        document = document.decode(encoding or "utf-8", errors="replace")
+    soup = BeautifulSoup(document, 'html.parser')
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            if not script.string:
+                continue
+            recipe = find_recipe(json.loads(script.string))
+            if recipe:
+                return recipe
+        except ValueError:
+            continue
+    return None
+
+
+def extract_recipe(document: Document, encoding: Optional[str] = None) -> Optional[Dict]:
+    """Objeto Recipe do JSON-LD da página, ou None."""
+    recipe, decoded_any = _scan(document, encoding)
+    if recipe or decoded_any:
+        return recipe
+    kind = bytes if isinstance(document, (bytes, bytearray)) else str
+    if not _MARKER[kind].search(document):
+        return None
+    logger.debug("JSON-LD não aproveitado pela varredura; usando BeautifulSoup.")
+    return extract_recipe_soup(document, encoding)
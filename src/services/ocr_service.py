@@ -0,0 +1,274 @@
+# ARQUIVO: src/services/ocr_service.py
+"""
+OCR de fotos e páginas escaneadas com pré-processamento e cache de resultados.
+
+Pré-processamento (antes do Tesseract):
+  1. Orientação EXIF + tons de cinza; JPEG é decodificado já reduzido (draft).
+  2. Redução para a resolução alvo (OCR_TARGET_DPI): foto de celular de 12+ MP
+     tem muito mais pixels do que o Tesseract precisa.
+  3. Binarização com limiar de Otsu (histograma da imagem).
+  4. Correção de inclinação por perfil de projeção (ângulos até MAX_SKEW_DEGREES).
+  5. Recorte para a região com texto (descarta mesa, dedos, margens).
+
+Cache endereçado por conteúdo: chave = SHA-256 dos bytes da imagem + configuração.
+A mesma página escaneada de novo (mesmo arquivo, qualquer nome) volta na hora.
+
+Bibliotecas opcionais (importações defensivas): Pillow e pytesseract.
+"""
+import hashlib
+import io
+import os
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from src.core.logger import get_logger
+
+logger = get_logger("src.services.ocr")
+
+HAS_PIL = False
+try:
+    from PIL import Image, ImageOps
+    HAS_PIL = True
+except ImportError:
+    logger.warning("Pré-processamento de imagem indisponível: Pillow não instalado.")
+
+HAS_TESSERACT = False
+try:
+    import pytesseract
+    HAS_TESSERACT = True
+except ImportError:
+    logger.warning("OCR indisponível: pytesseract não instalado.")
+
+HAS_OCR = HAS_PIL and HAS_TESSERACT
+
+OCR_CACHE_DIR = os.path.join("data", "ocr_cache")
+OCR_LANG = "por"
+OCR_TARGET_DPI = 200  # Suficiente para texto de livro de receitas (>= 8 pt)
+PAGE_LONG_SIDE_INCHES = 11.0  # Foto enquadrando a página: lado maior ~ Carta/A4
+MAX_SKEW_DEGREES = 5.0
+SKEW_STEP_DEGREES = 0.5
+SKEW_PROBE_SIDE = 800  # Inclinação estimada numa miniatura (custo constante)
+MIN_INK_RATIO = 0.01  # Linha/coluna com menos tinta que isso é fundo
+MAX_INK_RATIO = 0.8  # Linha/coluna com mais tinta que isso é borda escura (mesa, sombra)
+CROP_MARGIN = 0.02  # Margem (fração do lado) mantida em volta do texto
+OCR_PIPELINE_VERSION = 1  # Muda a chave do cache quando o pré-processamento mudar
+
+
+@dataclass(frozen=True)
+class OcrSettings:
+    lang: str = OCR_LANG
+    target_dpi: Optional[int] = OCR_TARGET_DPI  # None: mantém a resolução (ex.: PDF já renderizado)
+    binarize: bool = True
+    deskew: bool = True
+    crop: bool = True
+
+    def signature(self) -> str:
+        return (f"v{OCR_PIPELINE_VERSION}|{self.lang}|{self.target_dpi}|"
+                f"{int(self.binarize)}{int(self.deskew)}{int(self.crop)}")
+
+
+# --- FUNÇÕES PURAS (perfis e histogramas; testáveis sem Pillow) ---
+def target_scale(size: Tuple[int, int], target_dpi: Optional[int]) -> float:
+    """Fator de redução (<= 1) para o lado maior caber em target_dpi * PAGE_LONG_SIDE_INCHES."""
+    if not target_dpi:
+        return 1.0
+    return min(1.0, target_dpi * PAGE_LONG_SIDE_INCHES / max(size))
+
+
+def otsu_threshold(histogram: Sequence[int]) -> int:
+    """Limiar de Otsu de um histograma de 256 tons: maximiza a variância entre classes."""
+    total = sum(histogram)
+    if not total:
+        return 128
+    sum_all = sum(i * count for i, count in enumerate(histogram))
+    sum_back = weight_back = 0
+    best_threshold, best_variance = 0, -1.0
+    for tone, count in enumerate(histogram):
+        weight_back += count
+        if not weight_back:
+            continue
+        weight_fore = total - weight_back
+        if not weight_fore:
+            break
+        sum_back += tone * count
+        mean_back = sum_back / weight_back
+        mean_fore = (sum_all - sum_back) / weight_fore
+        variance = weight_back * weight_fore * (mean_back - mean_fore) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = tone, variance
+    return best_threshold
+
+
+def projection_score(profile: Sequence[float]) -> float:
+    """Nitidez do perfil de linhas: texto alinhado alterna linhas cheias e vazias."""
+    return sum((b - a) ** 2 for a, b in zip(profile, profile[1:]))
+
+
+def ink_span(profile: Sequence[float], min_ink: float = MIN_INK_RATIO * 255) -> Optional[Tuple[int, int]]:
+    """Primeiro e último índice (exclusivo) com tinta acima de min_ink; None se vazio."""
+    inked = [i for i, value in enumerate(profile) if value > min_ink]
+    return (inked[0], inked[-1] + 1) if inked else None
+
+
+def clear_span(profile: Sequence[float], max_ink: float = MAX_INK_RATIO * 255) -> Optional[Tuple[int, int]]:
+    """Maior trecho contínuo (início, fim exclusivo) sem borda escura: a página na foto."""
+    best, start = None, None
+    for i, value in enumerate(list(profile) + [max_ink]):
+        if value < max_ink:
+            start = i if start is None else start
+        elif start is not None:
+            if best is None or i - start > best[1] - best[0]:
+                best = (start, i)
+            start = None
+    return best
+
+
+def text_bounds(rows: Sequence[float], cols: Sequence[float],
+                margin: float = CROP_MARGIN) -> Optional[Tuple[int, int, int, int]]:
+    """Caixa (esquerda, topo, direita, base) da região com texto, com margem."""
+    row_span, col_span = ink_span(rows), ink_span(cols)
+    if not row_span or not col_span:
+        return None
+    pad_y, pad_x = int(len(rows) * margin), int(len(cols) * margin)
+    return (max(0, col_span[0] - pad_x), max(0, row_span[0] - pad_y),
+            min(len(cols), col_span[1] + pad_x), min(len(rows), row_span[1] + pad_y))
+
+
+# --- PRÉ-PROCESSAMENTO (Pillow) ---
+def _ink_profiles(binary: "Image.Image") -> Tuple[List[int], List[int]]:
+    """Tinta média por linha e por coluna (texto preto = 255 após inverter)."""
+    ink = ImageOps.invert(binary)
+    rows = list(ink.resize((1, ink.height), Image.BOX).tobytes())
+    cols = list(ink.resize((ink.width, 1), Image.BOX).tobytes())
+    return rows, cols
+
+
+def binarize(gray: "Image.Image") -> "Image.Image":
+    threshold = otsu_threshold(gray.histogram())
+    return gray.point([0] * (threshold + 1) + [255] * (255 - threshold))
+
+
+def estimate_skew(binary: "Image.Image", max_angle: float = MAX_SKEW_DEGREES,
+                  step: float = SKEW_STEP_DEGREES) -> float:
+    """Ângulo (graus, anti-horário) que deixa as linhas de texto na horizontal."""
+    probe = binary.copy()
+    probe.thumbnail((SKEW_PROBE_SIDE, SKEW_PROBE_SIDE))
+    best_angle, best_score = 0.0, -1.0
+    steps = int(round(2 * max_angle / step))
+    for i in range(steps + 1):
+        angle = -max_angle + i * step
+        rotated = probe.rotate(angle, resample=Image.NEAREST, fillcolor=255)
+        score = projection_score(_ink_profiles(rotated)[0])
+        if score > best_score:
+            best_angle, best_score = angle, score
+    return best_angle
+
+
+def preprocess_image(image: "Image.Image", settings: OcrSettings = OcrSettings()) -> "Image.Image":
+    """Imagem pronta para o Tesseract conforme `settings` (ver docstring do módulo)."""
+    scale = target_scale(image.size, settings.target_dpi)
+    if scale < 1.0:
+        # JPEG: decodifica direto em 1/2, 1/4 ou 1/8 (muito mais rápido que reduzir depois)
+        image.draft("L", (int(image.width * scale), int(image.height * scale)))
+    image = ImageOps.exif_transpose(image).convert("L")
+
+    scale = target_scale(image.size, settings.target_dpi)
+    if scale < 1.0:
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.LANCZOS)
+
+    if not settings.binarize:
+        return image
+    image = binarize(image)
+
+    if settings.deskew:
+        angle = estimate_skew(image)
+        if angle:
+            image = image.rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=255)
+            image = image.point([0] * 128 + [255] * 128)
+
+    if settings.crop:
+        image = _crop_to_text(image)
+    return image
+
+
+def _crop_to_text(binary: "Image.Image") -> "Image.Image":
+    # Primeiro descarta bordas escuras (colunas, depois linhas), depois margens sem texto
+    span = clear_span(_ink_profiles(binary)[1])
+    if span:
+        binary = binary.crop((span[0], 0, span[1], binary.height))
+    span = clear_span(_ink_profiles(binary)[0])
+    if span:
+        binary = binary.crop((0, span[0], binary.width, span[1]))
+    box = text_bounds(*_ink_profiles(binary))
+    return binary.crop(box) if box else binary
+
+
+def recognize_image(image: "Image.Image", settings: OcrSettings = OcrSettings()) -> str:
+    return pytesseract.image_to_string(preprocess_image(image, settings), lang=settings.lang)
+
+
+def recognize_bytes(data: bytes, settings: OcrSettings) -> str:
+    if not HAS_OCR:
+        raise RuntimeError("OCR indisponível: instale pytesseract e Pillow.")
+    with Image.open(io.BytesIO(data)) as image:
+        return recognize_image(image, settings)
+
+
+# --- CACHE ---
+class OcrCache:
+    """Um arquivo de texto por imagem em `directory`, chave = hash do conteúdo + configuração."""
+
+    def __init__(self, directory: str = OCR_CACHE_DIR):
+        self.directory = directory
+
+    @staticmethod
+    def key(data: bytes, settings: OcrSettings) -> str:
+        digest = hashlib.sha256(data)
+        digest.update(settings.signature().encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.txt")
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key: str, text: str):
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)  # Escrita atômica
+        except OSError as e:
+            logger.warning(f"Falha ao gravar cache de OCR: {e}")
+
+
+class ImageOcr:
+    """OCR de arquivos de imagem com cache; `recognize` injetável (testes, outros motores)."""
+
+    def __init__(self, settings: OcrSettings = OcrSettings(), cache: Optional[OcrCache] = None,
+                 recognize: Callable[[bytes, OcrSettings], str] = recognize_bytes):
+        self.settings = settings
+        self.cache = cache or OcrCache()
+        self._recognize = recognize
+
+    def bytes_to_text(self, data: bytes) -> str:
+        key = OcrCache.key(data, self.settings)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"OCR em cache: {key[:12]}")
+            return cached
+        text = self._recognize(data, self.settings).strip()
+        self.cache.put(key, text)
+        return text
+
+    def image_to_text(self, image_path: str) -> str:
+        with open(image_path, "rb") as f:
+            return self.bytes_to_text(f.read())
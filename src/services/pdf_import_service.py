@@ -0,0 +1,351 @@
+# ARQUIVO: src/services/pdf_import_service.py
+"""
+Importação da biblioteca de PDFs de receitas (pasta receitas/).
+
+Pipeline:
+  1. Cada PDF é identificado pelo SHA-256 do arquivo; páginas já processadas
+     (mesmo hash + configuração) vêm do cache em disco -> reexecuções incrementais.
+  2. Páginas pendentes são divididas em tarefas e processadas em pool de processos:
+     camada de texto embutida quando existe (sem OCR); senão rasteriza e faz OCR.
+  3. O texto é segmentado em receitas candidatas (título / ingredientes / preparo)
+     e gravado via seeder (hash de conteúdo: reimportar não duplica).
+
+Bibliotecas opcionais (importações defensivas, como no IntelligenceService):
+PyMuPDF (texto + rasterização), pypdf (só texto), pytesseract + Pillow (OCR, ver ocr_service).
+"""
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.logger import get_logger
+from src.services.ocr_service import HAS_OCR, OcrSettings, recognize_image
+from src.utils.schema_org import parse_duration_minutes
+
+logger = get_logger("src.services.pdf_import")
+
+HAS_PDF_RENDER = False
+try:
+    import fitz  # PyMuPDF
+    HAS_PDF_RENDER = True
+except ImportError:
+    logger.debug("PyMuPDF não instalado: sem rasterização de PDF.")
+
+HAS_PDF_TEXT = HAS_PDF_RENDER
+if not HAS_PDF_TEXT:
+    try:
+        import pypdf
+        HAS_PDF_TEXT = True
+    except ImportError:
+        logger.warning("Leitura de PDF indisponível: instale PyMuPDF ou pypdf.")
+
+if HAS_OCR:
+    from PIL import Image
+
+PDF_LIBRARY_DIR = "receitas"
+PDF_CACHE_DIR = os.path.join("data", "pdf_cache")
+PDF_CATEGORY = "Livros de Receitas"
+OCR_DPI = 300
+OCR_LANG = "por"
+MIN_TEXT_LAYER_CHARS = 40  # Menos que isso na camada de texto: página escaneada
+PAGES_PER_TASK = 4  # Páginas por tarefa do pool (amortiza abrir o PDF no worker)
+PIPELINE_VERSION = 2  # Muda a chave do cache quando a extração mudar
+
+# Resultado de extract_pages: (página, texto, método: "text" | "ocr" | "empty")
+PageExtraction = Tuple[int, str, str]
+
+
+@dataclass
+class PageText:
+    pdf_path: str
+    page: int  # 1-based
+    text: str
+    method: str  # "text", "ocr", "empty" ou "cache:<método>"
+
+
+# --- EXTRAÇÃO (roda nos workers: funções de módulo, serializáveis) ---
+def pdf_page_count(path: str) -> int:
+    if HAS_PDF_RENDER:
+        with fitz.open(path) as doc:
+            return doc.page_count
+    if HAS_PDF_TEXT:
+        return len(pypdf.PdfReader(path).pages)
+    raise RuntimeError("Nenhuma biblioteca de PDF disponível (PyMuPDF ou pypdf).")
+
+
+def _ocr_page(page, dpi: int, lang: str) -> str:
+    pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+    image = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+    # Página já renderizada no DPI certo: só binariza, endireita e recorta
+    return recognize_image(image, OcrSettings(lang=lang, target_dpi=None))
+
+
+def extract_pages(path: str, pages: List[int], dpi: int = OCR_DPI,
+                  lang: str = OCR_LANG) -> List[PageExtraction]:
+    """Texto das páginas (1-based): camada de texto se houver, senão OCR."""
+    results: List[PageExtraction] = []
+    if HAS_PDF_RENDER:
+        with fitz.open(path) as doc:
+            for number in pages:
+                page = doc.load_page(number - 1)
+                text = page.get_text()
+                if len(text.strip()) >= MIN_TEXT_LAYER_CHARS:
+                    results.append((number, text, "text"))
+                elif HAS_OCR:
+                    results.append((number, _ocr_page(page, dpi, lang), "ocr"))
+                else:
+                    results.append((number, text, "empty"))
+        return results
+
+    reader = pypdf.PdfReader(path)
+    for number in pages:
+        text = reader.pages[number - 1].extract_text() or ""
+        method = "text" if len(text.strip()) >= MIN_TEXT_LAYER_CHARS else "empty"
+        results.append((number, text, method))
+    return results
+
+
+def file_sha256(path: str, block_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# --- CACHE POR PÁGINA ---
+class PageCache:
+    """Um JSON por página em `directory`, chave = hash do PDF + página + configuração."""
+
+    def __init__(self, directory: str = PDF_CACHE_DIR, settings: str = ""):
+        self.directory = directory
+        self.settings = f"v{PIPELINE_VERSION}|{settings}"
+
+    def _path(self, file_hash: str, page: int) -> str:
+        key = hashlib.sha256(f"{file_hash}|{page}|{self.settings}".encode()).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, file_hash: str, page: int) -> Optional[Tuple[str, str]]:
+        try:
+            with open(self._path(file_hash, page), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            return entry["text"], entry["method"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, file_hash: str, page: int, text: str, method: str):
+        # "empty" não é guardado: instalar o OCR depois deve reprocessar a página
+        if method == "empty":
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(file_hash, page)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"text": text, "method": method}, f, ensure_ascii=False)
+            os.replace(tmp, path)  # Escrita atômica
+        except OSError as e:
+            logger.warning(f"Falha ao gravar cache de página: {e}")
+
+
+# --- PIPELINE ---
+class PdfTextPipeline:
+
+    def __init__(self, cache: Optional[PageCache] = None, workers: Optional[int] = None,
+                 executor: Optional[Executor] = None, dpi: int = OCR_DPI, lang: str = OCR_LANG,
+                 page_count: Callable[[str], int] = pdf_page_count,
+                 extract: Callable[..., List[PageExtraction]] = extract_pages):
+        self.cache = cache or PageCache(settings=f"{dpi}|{lang}")
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = executor
+        self.dpi = dpi
+        self.lang = lang
+        self._page_count = page_count
+        self._extract = extract
+
+    def _create_executor(self) -> Tuple[Executor, bool]:
+        if self._executor is not None:
+            return self._executor, False
+        try:
+            return ProcessPoolExecutor(max_workers=self.workers), True
+        except (OSError, NotImplementedError, ImportError) as e:
+            logger.warning(f"Pool de processos indisponível ({e}). Usando threads.")
+            return ThreadPoolExecutor(max_workers=self.workers), True
+
+    def extract_library(self, paths: Iterable[str]) -> Dict[str, List[PageText]]:
+        """Texto de todas as páginas, por PDF, na ordem. Só o que não está em cache é processado."""
+        documents: Dict[str, Dict[int, PageText]] = {}
+        tasks: List[Tuple[str, str, List[int]]] = []
+
+        for path in paths:
+            try:
+                file_hash = file_sha256(path)
+                total = self._page_count(path)
+            except Exception as e:
+                logger.error(f"PDF ignorado ({path}): {e}")
+                continue
+            pages = documents.setdefault(path, {})
+            missing = []
+            for number in range(1, total + 1):
+                cached = self.cache.get(file_hash, number)
+                if cached:
+                    pages[number] = PageText(path, number, cached[0], f"cache:{cached[1]}")
+                else:
+                    missing.append(number)
+            for start in range(0, len(missing), PAGES_PER_TASK):
+                tasks.append((path, file_hash, missing[start:start + PAGES_PER_TASK]))
+
+        if tasks:
+            logger.info(f"PDF: {sum(len(t[2]) for t in tasks)} páginas a extrair em {len(tasks)} tarefas.")
+            executor, owns_executor = self._create_executor()
+            try:
+                futures = {executor.submit(self._extract, path, pages, self.dpi, self.lang): (path, file_hash)
+                           for path, file_hash, pages in tasks}
+                for future in as_completed(futures):
+                    path, file_hash = futures[future]
+                    try:
+                        extracted = future.result()
+                    except Exception as e:
+                        logger.error(f"Falha ao extrair páginas de {path}: {e}")
+                        continue
+                    for number, text, method in extracted:
+                        self.cache.put(file_hash, number, text, method)
+                        documents[path][number] = PageText(path, number, text, method)
+            finally:
+                if owns_executor:
+                    executor.shutdown()
+
+        return {path: [pages[n] for n in sorted(pages)] for path, pages in documents.items()}
+
+
+# --- SEGMENTAÇÃO EM RECEITAS ---
+_FOLD = str.maketrans("áàâãäéèêëíìîïóòôõöúùûüç", "aaaaaeeeeiiiiooooouuuuc")
+_INGREDIENTS_HEADER = re.compile(
+    r"^(?:ingredientes?|ingredients)(?:\s+(?:d[aoe]s?|for the|for)\s+[^:(]{1,40})?[^a-z]*(?:\(.*\))?\s*:?\s*$")
+_STEPS_HEADER = re.compile(
+    r"^(?:modo de (?:preparo|fazer)|preparo|preparacao|como fazer|instrucoes|instructions|method|directions)\b\s*:?")
+_YIELD_LINE = re.compile(r"^(?:rendimento|rende|serve|porcoes|porcao|yield|serves)\b\s*:?\s*(.*)$")
+_TIME_LINE = re.compile(r"^(?:tempo(?: de preparo| total)?|prep time|total time)\b\s*:?\s*(.*)$")
+_BULLET = re.compile(r"^[\s\-–•*·▪●○✓]+")
+MAX_TITLE_CHARS = 80
+
+
+def _fold(line: str) -> str:
+    return line.lower().translate(_FOLD).strip()
+
+
+def split_recipes(pages: List[PageText], source_name: str) -> List[dict]:
+    """
+    Receitas candidatas no formato do native_recipes.json. Uma receita é reconhecida
+    pelo cabeçalho de ingredientes; o título é a linha anterior (ignorando rendimento
+    e tempo), e o preparo vai até o título da próxima receita.
+    """
+    lines: List[Tuple[int, str]] = [
+        (page.page, line.strip()) for page in pages for line in page.text.splitlines() if line.strip()]
+    folded = [_fold(text) for _, text in lines]
+    headers: List[int] = []
+    for i, f in enumerate(folded):
+        if not _INGREDIENTS_HEADER.match(f):
+            continue
+        # Sem preparo desde o último cabeçalho: subseção ("Ingredientes do recheio")
+        if headers and not any(_STEPS_HEADER.match(folded[j]) for j in range(headers[-1] + 1, i)):
+            continue
+        headers.append(i)
+
+    # Início de cada receita = linha do título (ou o próprio cabeçalho, se não houver título)
+    starts, titles, extras = [], [], []
+    for n, h in enumerate(headers):
+        meta: Dict[str, str] = {}
+        title_index = None
+        i = h - 1
+        while i > (headers[n - 1] if n else -1):
+            yield_match = _YIELD_LINE.match(folded[i])
+            time_match = _TIME_LINE.match(folded[i])
+            if yield_match:
+                meta.setdefault("servings", lines[i][1][yield_match.start(1):].strip() or lines[i][1])
+            elif time_match:
+                meta.setdefault("time", lines[i][1][time_match.start(1):].strip())
+            elif len(lines[i][1]) <= MAX_TITLE_CHARS:
+                title_index = i
+                break
+            else:
+                break
+            i -= 1
+        starts.append(title_index if title_index is not None else h)
+        titles.append(lines[title_index][1] if title_index is not None else "")
+        extras.append(meta)
+
+    records = []
+    for n, h in enumerate(headers):
+        end = starts[n + 1] if n + 1 < len(headers) else len(lines)
+        steps = next((i for i in range(h + 1, end) if _STEPS_HEADER.match(folded[i])), None)
+        if steps is None or not titles[n]:
+            continue
+        ingredients = [_BULLET.sub("", text) for (_, text), f in zip(lines[h + 1:steps], folded[h + 1:steps])
+                       if not _INGREDIENTS_HEADER.match(f)]
+        instructions = [text for _, text in lines[steps + 1:end]]
+        # Linha do cabeçalho de preparo pode trazer texto: "Modo de preparo: bata tudo"
+        inline = lines[steps][1][_STEPS_HEADER.match(folded[steps]).end():].strip()
+        if inline:
+            instructions.insert(0, inline)
+        if not ingredients or not instructions:
+            continue
+
+        meta = extras[n]
+        records.append({
+            "title": titles[n].title() if titles[n].isupper() else titles[n],
+            "category": PDF_CATEGORY,
+            "preparation_time": parse_duration_minutes(meta.get("time")),
+            "servings": meta.get("servings"),
+            "instructions": "\n".join(instructions),
+            "source": f"{source_name}, p. {lines[starts[n]][0]}",
+            "ingredients": [i for i in ingredients if len(i) >= 2],
+        })
+    return records
+
+
+def find_pdfs(directory: str = PDF_LIBRARY_DIR) -> List[str]:
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.lower().endswith(".pdf"))
+
+
+def import_pdf_library(directory: str = PDF_LIBRARY_DIR,
+                       pipeline: Optional[PdfTextPipeline] = None) -> Tuple[int, int]:
+    """Extrai, segmenta e semeia as receitas dos PDFs. Retorna (candidatas, novas gravadas)."""
+    from src.database.database import db_connection
+    from src.database.seeder import seed_records
+
+    pipeline = pipeline or PdfTextPipeline()
+    documents = pipeline.extract_library(find_pdfs(directory))
+    records = []
+    for path, pages in documents.items():
+        found = split_recipes(pages, os.path.splitext(os.path.basename(path))[0])
+        logger.info(f"PDF {os.path.basename(path)}: {len(pages)} páginas, {len(found)} receitas candidatas.")
+        records.extend(found)
+
+    with db_connection() as conn:
+        created = seed_records(conn, records)
+    return len(records), created
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from src.database.database import init_database
+
+    parser = argparse.ArgumentParser(description="Importa as receitas dos PDFs da biblioteca.")
+    parser.add_argument("directory", nargs="?", default=PDF_LIBRARY_DIR)
+    parser.add_argument("--workers", type=int, default=None, help="Processos (padrão: núcleos)")
+    parser.add_argument("--dpi", type=int, default=OCR_DPI)
+    parser.add_argument("--lang", default=OCR_LANG)
+    args = parser.parse_args()
+
+    init_database()
+    found, created = import_pdf_library(
+        args.directory, PdfTextPipeline(workers=args.workers, dpi=args.dpi, lang=args.lang))
+    print(f"{found} receitas candidatas, {created} novas gravadas.")
@@ -0,0 +1,107 @@
+# ARQUIVO: src/services/prefetch_service.py
+"""
+Pré-carregamento em segundo plano dos primeiros resultados de uma busca.
+
+Depois de cada busca do Discovery, uma thread de baixa prioridade aquece o
+cache de detalhes (uma consulta em lote) e as miniaturas das N primeiras
+receitas, uma imagem por vez: o carregamento dos cards visíveis, que usa o
+mesmo pool do cache de imagens, nunca fica atrás de uma fila de pré-carga.
+Uma nova busca cancela o trabalho pendente da anterior.
+"""
+import os
+import queue
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from src.core.logger import get_logger
+from src.database.recipe_queries import RecipeQueries
+from src.services.image_cache import ImageCache, get_image_cache, is_remote_image
+
+logger = get_logger("src.services.prefetch")
+
+PREFETCH_COUNT = 12  # Resultados aquecidos por busca (~primeira dobra da grade)
+PREFETCH_VARIANTS = ("grid", "hero")  # Card e imagem de destaque da tela de detalhes
+PREFETCH_NICE = 10  # Prioridade do worker no Linux (nice por thread)
+
+
+class Prefetcher:
+
+    def __init__(self, load_details: Callable[[List[int]], Dict[int, Dict]],
+                 images: Optional[ImageCache] = None, count: int = PREFETCH_COUNT,
+                 variants: Sequence[str] = PREFETCH_VARIANTS):
+        self._load_details = load_details
+        self._images = images
+        self.count = count
+        self.variants = tuple(variants)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def images(self) -> ImageCache:
+        return self._images or get_image_cache()
+
+    def prefetch(self, recipes: Iterable[Dict]):
+        """Agenda os primeiros `count` resultados; descarta o que restava da busca anterior."""
+        batch = [r for _, r in zip(range(self.count), recipes)]
+        with self._lock:
+            self._generation += 1
+            self._queue.put((self._generation, batch))
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="prefetch", daemon=True)
+                self._worker.start()
+
+    def cancel(self):
+        with self._lock:
+            self._generation += 1
+
+    def _stale(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def _run(self):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), PREFETCH_NICE)
+        except (AttributeError, OSError):
+            pass  # Fora do Linux a thread só roda com a prioridade normal
+        while True:
+            generation, batch = self._queue.get()
+            try:
+                if not self._stale(generation):
+                    self._warm(generation, batch)
+            except Exception as e:
+                logger.warning(f"Pré-carregamento interrompido: {e}")
+            finally:
+                self._queue.task_done()
+
+    def wait_idle(self):
+        """Bloqueia até o worker esvaziar a fila (testes, encerramento)."""
+        self._queue.join()
+
+    def _warm(self, generation: int, batch: List[Dict]):
+        ids = [r['id'] for r in batch if r.get('id') is not None]
+        if ids:
+            self._load_details(ids)
+        for recipe in batch:
+            url = recipe.get('image_path')
+            if not is_remote_image(url):
+                continue
+            for variant in self.variants:
+                if self._stale(generation):
+                    logger.debug("Pré-carregamento cancelado por nova busca.")
+                    return
+                self.images.load(url, variant).result()
+
+
+_prefetcher: Optional[Prefetcher] = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_prefetcher() -> Prefetcher:
+    """Prefetcher do processo (criado sob demanda), compartilhado entre as telas."""
+    global _prefetcher
+    if _prefetcher is None:
+        with _prefetcher_lock:
+            if _prefetcher is None:
+                _prefetcher = Prefetcher(RecipeQueries().get_recipes_details)
+    return _prefetcher
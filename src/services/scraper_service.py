@@ -1,10 +1,10 @@
 # ARQUIVO: src/services/scraper_service.py
-import requests
-import json
-import re
-from bs4 import BeautifulSoup
 from typing import Optional, Dict, Any
 from src.core.logger import get_logger
+from src.services import http_client
+from src.services.jsonld_extractor import Document, extract_recipe
+from src.utils.ingredient_parser import parse_ingredients
+from src.utils.schema_org import parse_yield, recipe_total_minutes
 
 logger = get_logger("src.services.scraper")
 
@@ -29,74 +29,36 @@ class RecipeScraper:
                 return "URL inválida. Comece com http:// ou https://", None
 
             logger.info(f"Iniciando scraping tático de: {url}")
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Estratégia Principal: Buscar JSON-LD (Padrão Ouro)
-            scripts = soup.find_all('script', type='application/ld+json')
-            target_data = None
-
-            for script in scripts:
-                try:
-                    if not script.string:
-                        continue
-                    data = json.loads(script.string)
-
-                    # Normaliza para lista para processar igual
-                    if isinstance(data, dict):
-                        data = [data]
-
-                    # Busca recursiva por @type: Recipe
-                    target_data = RecipeScraper._find_recipe_in_json(data)
-                    if target_data:
-                        break
-                except:
-                    continue
-
-            if not target_data:
-                return "Não foi possível extrair dados estruturados deste site.", None
-
-            return None, RecipeScraper._parse_schema(target_data, url)
+            response = http_client.fetch(url, headers=headers)
+            return RecipeScraper.parse_html(response.content, url, response.encoding)
 
         except Exception as e:
             logger.error(f"Erro ao importar receita: {e}")
             return f"Erro de conexão: {str(e)}", None
 
     @staticmethod
-    def _find_recipe_in_json(data: Any) -> Optional[Dict]:
-        """Busca profunda pelo objeto Recipe dentro do JSON-LD (pode estar aninhado ou em grafo)."""
-        if isinstance(data, dict):
-            if 'Recipe' in data.get('@type', ''):
-                return data
-            if '@graph' in data:
-                return RecipeScraper._find_recipe_in_json(data['@graph'])
-            return None
-        elif isinstance(data, list):
-            for item in data:
-                res = RecipeScraper._find_recipe_in_json(item)
-                if res:
-                    return res
-        return None
+    def parse_html(html: Document, url: str,
+                   encoding: Optional[str] = None) -> tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Extrai a receita de um HTML já baixado, str ou bytes crus (sem rede: pode rodar
+        em pool de processos).
+        Retorna: (Mensagem de Erro, Dicionário de Dados)
+        """
+        # Estratégia Principal: Buscar JSON-LD (Padrão Ouro)
+        target_data = extract_recipe(html, encoding)
+
+        if not target_data:
+            return "Não foi possível extrair dados estruturados deste site.", None
+
+        return None, RecipeScraper._parse_schema(target_data, url)
 
     @staticmethod
     def _parse_schema(data: Dict, url: str) -> Dict[str, Any]:
         """Normaliza os dados brutos do site para o formato do App."""
         try:
-            # 1. Tempo (ISO 8601 PT40M -> 40)
-            prep_time = 0
-            # Tenta pegar totalTime, se não, soma prep + cook
-            time_iso = data.get('totalTime') or data.get(
-                'prepTime') or data.get('cookTime')
-            if time_iso:
-                # Regex simples para extrair minutos totais
-                regex = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?')
-                match = regex.match(time_iso)
-                if match:
-                    h = int(match.group(1) or 0)
-                    m = int(match.group(2) or 0)
-                    prep_time = (h * 60) + m
+            # 1. Tempo e rendimento (ISO 8601 / recipeYield -> números)
+            prep_time = recipe_total_minutes(data)
+            recipe_yield = parse_yield(data.get('recipeYield'))
 
             # 2. Imagem
             image = ""
@@ -108,17 +70,9 @@ class RecipeScraper:
             elif isinstance(img_data, str):
                 image = img_data
 
-            # 3. Ingredientes
-            ingredients = []
-            raw_ings = data.get('recipeIngredient', [])
-            for ing_str in raw_ings:
-                # Limpeza básica
-                clean_str = ing_str.replace('&nbsp;', ' ').strip()
-                ingredients.append({
-                    "name": clean_str,  # O parser complexo de qtd/unidade ficaria para a v2
-                    "quantity": "",
-                    "unit": ""
-                })
+            # 3. Ingredientes (quantidade / unidade / nome, em lote)
+            raw_ings = [i for i in data.get('recipeIngredient', []) if isinstance(i, str)]
+            ingredients = [p.as_dict() for p in parse_ingredients(raw_ings)]
 
             # 4. Instruções
             instructions = []
@@ -135,7 +89,8 @@ class RecipeScraper:
             return {
                 "title": data.get('name', 'Receita Importada').strip(),
                 "preparation_time": str(prep_time) if prep_time else "",
-                "servings": str(data.get('recipeYield', '')).replace('servings', '').replace('porções', '').strip(),
+                "servings": recipe_yield.text or "",
+                "servings_count": recipe_yield.count,
                 "instructions": "\n".join(instructions),
                 "image_path": image,
                 "source": url,
@@ -0,0 +1,325 @@
+# ARQUIVO: src/services/voice_service.py
+"""
+Ditado por voz offline e contínuo, com reconhecedor plugável.
+
+- Fonte de áudio (AudioSource): microfone (sounddevice) ou arquivo WAV (testes,
+  gravações). Entrega blocos PCM 16 bits mono.
+- Reconhecedor (StreamingRecognizer): recebe os blocos e devolve transcrições
+  parciais (texto provisório da fala em curso) e finais (frase concluída).
+  Backend offline: Vosk. Para testes: TranscriptFileRecognizer (segmenta a fala
+  do WAV por energia e usa o texto de um arquivo ao lado).
+- DictationSession: captura + reconhecimento numa thread de fundo; a UI consome
+  as transcrições com `async for` sem bloquear, até chamar stop().
+
+Bibliotecas opcionais (importações defensivas): vosk (modelo em VOICE_MODEL_DIR)
+e sounddevice (microfone).
+"""
+import array
+import asyncio
+import json
+import math
+import os
+import sys
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Iterator, List, Optional
+
+from src.core.logger import get_logger
+
+logger = get_logger("src.services.voice")
+
+HAS_VOSK = False
+try:
+    import vosk
+    vosk.SetLogLevel(-1)
+    HAS_VOSK = True
+except ImportError:
+    logger.warning("Reconhecimento offline indisponível: vosk não instalado.")
+
+HAS_MIC = False
+try:
+    import sounddevice
+    HAS_MIC = True
+except (ImportError, OSError):  # OSError: PortAudio ausente no sistema
+    logger.warning("Microfone indisponível: sounddevice/PortAudio não instalado.")
+
+VOICE_MODEL_DIR = os.environ.get("VOSK_MODEL_PATH", os.path.join("data", "vosk-model-small-pt"))
+SAMPLE_RATE = 16000
+CHUNK_MS = 100  # Tamanho do bloco: latência das parciais x overhead por bloco
+SPEECH_RMS = 500  # Energia (RMS, PCM 16 bits) acima da qual o bloco é fala
+END_SILENCE_MS = 500  # Silêncio que encerra uma frase
+
+
+@dataclass
+class Transcript:
+    text: str
+    final: bool  # False: parcial (pode mudar); True: frase concluída
+
+
+# --- FONTES DE ÁUDIO ---
+class AudioSource(ABC):
+    sample_rate: int = SAMPLE_RATE
+
+    @abstractmethod
+    def chunks(self) -> Iterator[bytes]:
+        """Blocos PCM 16 bits mono, até o fim do áudio (ou close())."""
+
+    def close(self):
+        pass
+
+
+class WavFileSource(AudioSource):
+    """Lê um WAV PCM 16 bits (mono ou estéreo -> mono). `realtime` simula o microfone."""
+
+    def __init__(self, path: str, chunk_ms: int = CHUNK_MS, realtime: bool = False):
+        self.path = path
+        self.chunk_ms = chunk_ms
+        self.realtime = realtime
+        with wave.open(path, "rb") as wav:
+            if wav.getsampwidth() != 2:
+                raise ValueError(f"WAV precisa ser PCM 16 bits: {path}")
+            self.sample_rate = wav.getframerate()
+
+    def chunks(self) -> Iterator[bytes]:
+        with wave.open(self.path, "rb") as wav:
+            channels = wav.getnchannels()
+            frames = max(1, self.sample_rate * self.chunk_ms // 1000)
+            while True:
+                data = wav.readframes(frames)
+                if not data:
+                    return
+                if channels > 1:
+                    data = _downmix(data, channels)
+                if self.realtime:
+                    time.sleep(self.chunk_ms / 1000)
+                yield data
+
+
+class MicrophoneSource(AudioSource):
+    def __init__(self, sample_rate: int = SAMPLE_RATE, chunk_ms: int = CHUNK_MS):
+        self.sample_rate = sample_rate
+        self.frames = sample_rate * chunk_ms // 1000
+        self._closed = threading.Event()
+
+    def chunks(self) -> Iterator[bytes]:
+        with sounddevice.RawInputStream(samplerate=self.sample_rate, blocksize=self.frames,
+                                        dtype="int16", channels=1) as stream:
+            while not self._closed.is_set():
+                data, overflowed = stream.read(self.frames)
+                if overflowed:
+                    logger.debug("Microfone: blocos de áudio perdidos (overflow).")
+                yield bytes(data)
+
+    def close(self):
+        self._closed.set()
+
+
+def _samples(data: bytes) -> array.array:
+    samples = array.array("h")
+    samples.frombytes(data[:len(data) - len(data) % 2])
+    if sys.byteorder == "big":  # WAV é little-endian
+        samples.byteswap()
+    return samples
+
+
+def _downmix(data: bytes, channels: int) -> bytes:
+    samples = _samples(data)
+    mono = array.array("h", (sum(samples[i:i + channels]) // channels
+                             for i in range(0, len(samples), channels)))
+    if sys.byteorder == "big":
+        mono.byteswap()
+    return mono.tobytes()
+
+
+def chunk_rms(data: bytes) -> float:
+    samples = _samples(data)
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+# --- RECONHECEDORES ---
+class StreamingRecognizer(ABC):
+
+    @abstractmethod
+    def reset(self, sample_rate: int):
+        """Prepara uma nova sessão de ditado."""
+
+    @abstractmethod
+    def feed(self, chunk: bytes) -> List[Transcript]:
+        """Processa um bloco; devolve parciais e/ou finais (ou nada)."""
+
+    @abstractmethod
+    def finish(self) -> List[Transcript]:
+        """Fim do áudio: devolve a frase pendente, se houver."""
+
+
+@lru_cache(maxsize=2)
+def _load_vosk_model(path: str) -> "vosk.Model":
+    logger.info(f"Carregando modelo de voz: {path}")
+    return vosk.Model(path)
+
+
+class VoskRecognizer(StreamingRecognizer):
+    """
+    Reconhecimento offline (Kaldi/Vosk); o modelo é carregado uma vez por processo.
+    A carga (dezenas a centenas de MB) acontece no primeiro reset(), já na thread
+    do ditado: criar o reconhecedor no loop da UI é instantâneo.
+    """
+
+    def __init__(self, model_path: str = VOICE_MODEL_DIR):
+        self.model_path = model_path
+        self._recognizer = None
+        self._last_partial = ""
+
+    def reset(self, sample_rate: int):
+        self._recognizer = vosk.KaldiRecognizer(_load_vosk_model(self.model_path), sample_rate)
+        self._last_partial = ""
+
+    def _final(self, raw: str) -> List[Transcript]:
+        self._last_partial = ""
+        text = json.loads(raw).get("text", "")
+        return [Transcript(text, True)] if text else []
+
+    def feed(self, chunk: bytes) -> List[Transcript]:
+        if self._recognizer.AcceptWaveform(chunk):
+            return self._final(self._recognizer.Result())
+        partial = json.loads(self._recognizer.PartialResult()).get("partial", "")
+        if partial and partial != self._last_partial:
+            self._last_partial = partial
+            return [Transcript(partial, False)]
+        return []
+
+    def finish(self) -> List[Transcript]:
+        return self._final(self._recognizer.FinalResult())
+
+
+class TranscriptFileRecognizer(StreamingRecognizer):
+    """
+    Reconhecedor falso e determinístico para testes: detecta frases no áudio por
+    energia e devolve, em ordem, as frases conhecidas (uma por linha no .txt ao lado
+    do WAV). As parciais revelam uma palavra a mais por bloco de fala.
+    """
+
+    def __init__(self, phrases: List[str], speech_rms: float = SPEECH_RMS,
+                 end_silence_ms: int = END_SILENCE_MS):
+        self.phrases = phrases
+        self.speech_rms = speech_rms
+        self.end_silence_ms = end_silence_ms
+        self.reset(SAMPLE_RATE)
+
+    @classmethod
+    def for_wav(cls, wav_path: str, **kwargs) -> "TranscriptFileRecognizer":
+        with open(os.path.splitext(wav_path)[0] + ".txt", "r", encoding="utf-8") as f:
+            return cls([line.strip() for line in f if line.strip()], **kwargs)
+
+    def reset(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self._index = 0
+        self._speech_chunks = 0
+        self._silence_ms = 0.0
+
+    def _end_phrase(self) -> List[Transcript]:
+        self._speech_chunks = 0
+        if self._index >= len(self.phrases):
+            return []
+        self._index += 1
+        return [Transcript(self.phrases[self._index - 1], True)]
+
+    def feed(self, chunk: bytes) -> List[Transcript]:
+        if chunk_rms(chunk) >= self.speech_rms:
+            self._speech_chunks += 1
+            self._silence_ms = 0.0
+            if self._index >= len(self.phrases):
+                return []
+            words = self.phrases[self._index].split()
+            return [Transcript(" ".join(words[:min(self._speech_chunks, len(words))]), False)]
+        if not self._speech_chunks:
+            return []
+        self._silence_ms += len(chunk) / 2 * 1000 / self.sample_rate
+        return self._end_phrase() if self._silence_ms >= self.end_silence_ms else []
+
+    def finish(self) -> List[Transcript]:
+        return self._end_phrase() if self._speech_chunks else []
+
+
+# --- SESSÃO DE DITADO ---
+_DONE = object()
+
+
+class DictationSession:
+    """Captura e reconhecimento em thread de fundo; ditado contínuo até stop()."""
+
+    def __init__(self, source: AudioSource, recognizer: StreamingRecognizer):
+        self.source = source
+        self.recognizer = recognizer
+        self._stop = threading.Event()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def stop(self):
+        self._stop.set()
+        self.source.close()
+
+    def run(self, emit: Callable[[Transcript], None]):
+        """Corpo do worker (bloqueante): chama `emit` a cada transcrição."""
+        self.recognizer.reset(self.source.sample_rate)
+        try:
+            for chunk in self.source.chunks():
+                if self._stop.is_set():
+                    break
+                for transcript in self.recognizer.feed(chunk):
+                    emit(transcript)
+            for transcript in self.recognizer.finish():
+                emit(transcript)
+        finally:
+            self.source.close()
+
+    async def stream(self) -> AsyncIterator[Transcript]:
+        """Transcrições na ordem em que chegam, sem bloquear o loop da UI."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        errors: List[Exception] = []
+
+        def worker():
+            try:
+                self.run(lambda t: loop.call_soon_threadsafe(queue.put_nowait, t))
+            except Exception as e:
+                logger.error(f"Falha no ditado: {e}")
+                errors.append(e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+
+        threading.Thread(target=worker, name="dictation", daemon=True).start()
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            self.stop()
+        if errors:
+            raise errors[0]
+
+
+def voice_unavailable_reason(model_path: str = VOICE_MODEL_DIR) -> Optional[str]:
+    """Motivo para o ditado não funcionar neste dispositivo (None se está tudo pronto)."""
+    if not HAS_VOSK:
+        return "Reconhecimento de voz indisponível (vosk não instalado)."
+    if not os.path.isdir(model_path):
+        return f"Modelo de voz não encontrado em {model_path}."
+    if not HAS_MIC:
+        return "Microfone indisponível neste dispositivo."
+    return None
+
+
+def open_dictation(model_path: str = VOICE_MODEL_DIR) -> DictationSession:
+    """Sessão com microfone + Vosk. Verifique voice_unavailable_reason() antes."""
+    return DictationSession(MicrophoneSource(), VoskRecognizer(model_path))
@@ -0,0 +1,231 @@
+# ARQUIVO: src/utils/ingredient_parser.py
+"""
+Parser de linhas de ingrediente (PT/EN): "1 1/2 xícara (chá) de farinha de trigo"
+-> quantidade "1 1/2", unidade "xícara", nome "farinha de trigo".
+
+Suporta frações (1/2, ½, 1 e 1/2, 1 e meia), decimais com vírgula, faixas (2-3, 2 a 3),
+números por extenso (meia, uma, two), "a gosto"/"to taste" e sinônimos de
+unidade (tabela UNIT_SYNONYMS -> nome canônico). Padrões pré-compilados no
+carregamento do módulo; parse_ingredients processa lotes grandes reaproveitando
+linhas repetidas.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+# --- TABELA DE UNIDADES (canônico -> sinônimos, sem acento e em minúsculas) ---
+UNIT_SYNONYMS: Dict[str, List[str]] = {
+    "xícara": ["xicara", "xicaras", "xicara (cha)", "xicaras (cha)", "xicara de cha", "xicaras de cha",
+               "xic", "xic.", "cup", "cups", "c."],
+    "colher de sopa": ["colher de sopa", "colheres de sopa", "colher (sopa)", "colheres (sopa)",
+                       "colher sopa", "colheres sopa", "c. sopa", "c. de sopa", "cs", "csp",
+                       "tablespoon", "tablespoons", "tbsp", "tbsp.", "tbs"],
+    "colher de chá": ["colher de cha", "colheres de cha", "colher (cha)", "colheres (cha)",
+                      "colher cha", "colheres cha", "c. cha", "c. de cha", "cc",
+                      "teaspoon", "teaspoons", "tsp", "tsp."],
+    "colher de sobremesa": ["colher de sobremesa", "colheres de sobremesa", "colher (sobremesa)",
+                            "colheres (sobremesa)", "colher sobremesa", "colheres sobremesa"],
+    "colher de café": ["colher de cafe", "colheres de cafe", "colher (cafe)", "colheres (cafe)",
+                       "colher cafe", "colheres cafe"],
+    "colher": ["colher", "colheres", "spoon", "spoons"],
+    "copo": ["copo", "copos", "copo americano", "copos americanos", "glass", "glasses"],
+    "g": ["g", "g.", "gr", "gr.", "grama", "gramas", "gram", "grams"],
+    "kg": ["kg", "kg.", "quilo", "quilos", "kilo", "kilos", "kilogram", "kilograms", "quilograma", "quilogramas"],
+    "mg": ["mg", "miligrama", "miligramas", "milligram", "milligrams"],
+    "ml": ["ml", "ml.", "mililitro", "mililitros", "milliliter", "milliliters", "millilitre", "millilitres"],
+    "l": ["l", "l.", "litro", "litros", "liter", "liters", "litre", "litres"],
+    "oz": ["oz", "oz.", "ounce", "ounces"],
+    "lb": ["lb", "lb.", "lbs", "lbs.", "pound", "pounds"],
+    "pitada": ["pitada", "pitadas", "pinch", "pinches"],
+    "dente": ["dente", "dentes", "clove", "cloves"],
+    "lata": ["lata", "latas", "can", "cans", "tin", "tins"],
+    "pacote": ["pacote", "pacotes", "package", "packages", "pack", "packs", "pct"],
+    "caixa": ["caixa", "caixas", "caixinha", "caixinhas", "box", "boxes"],
+    "envelope": ["envelope", "envelopes", "sache", "saches", "sachet", "sachets"],
+    "tablete": ["tablete", "tabletes"],
+    "unidade": ["unidade", "unidades", "un", "un.", "und", "und.", "unid", "unid.", "unit", "units"],
+    "fatia": ["fatia", "fatias", "slice", "slices"],
+    "rodela": ["rodela", "rodelas"],
+    "pedaço": ["pedaco", "pedacos", "piece", "pieces"],
+    "maço": ["maco", "macos", "bunch", "bunches"],
+    "ramo": ["ramo", "ramos", "raminho", "raminhos", "sprig", "sprigs"],
+    "folha": ["folha", "folhas", "leaf", "leaves"],
+    "talo": ["talo", "talos", "stalk", "stalks"],
+    "fio": ["fio", "fios", "drizzle"],
+    "punhado": ["punhado", "punhados", "handful", "handfuls"],
+    "gota": ["gota", "gotas", "drop", "drops"],
+    "cubo": ["cubo", "cubos", "cube", "cubes"],
+    "xícara de café": ["xicara de cafe", "xicaras de cafe", "xicara (cafe)", "xicaras (cafe)"],
+}
+
+TO_TASTE = "a gosto"
+
+_FOLD = str.maketrans("áàâãäéèêëíìîïóòôõöúùûüç", "aaaaaeeeeiiiiooooouuuuc")
+_UNICODE_FRACTIONS = {
+    "½": "1/2", "⅓": "1/3", "⅔": "2/3", "¼": "1/4", "¾": "3/4", "⅕": "1/5", "⅖": "2/5",
+    "⅗": "3/5", "⅘": "4/5", "⅙": "1/6", "⅚": "5/6", "⅛": "1/8", "⅜": "3/8", "⅝": "5/8", "⅞": "7/8",
+}
+_WORD_NUMBERS = {
+    "meia": "1/2", "meio": "1/2", "half": "1/2", "um": "1", "uma": "1", "one": "1",
+    "dois": "2", "duas": "2", "two": "2", "tres": "3", "three": "3", "quatro": "4", "four": "4",
+    "cinco": "5", "five": "5", "seis": "6", "six": "6", "dez": "10", "ten": "10",
+    "duzia": "12", "dozen": "12",
+    "três": "3", "dúzia": "12",  # Formas acentuadas (texto de ditado/OCR)
+}
+
+# Chave sem acento -> canônico (consulta O(1) após o regex localizar a unidade)
+_UNIT_LOOKUP: Dict[str, str] = {}
+for _canonical, _synonyms in UNIT_SYNONYMS.items():
+    for _synonym in _synonyms + [_canonical.translate(_FOLD)]:
+        _UNIT_LOOKUP[_synonym] = _canonical
+
+_AMOUNT = (r"\d+\s+(?:e|and)\s+(?:meia|meio|half)\b|"  # "1 e meia" -> "1 1/2"
+           r"\d+\s+(?:e\s+|and\s+)?\d+\s*/\s*\d+|\d+\s*/\s*\d+|\d+(?:[.,]\d+)?")
+_WORDS = "|".join(sorted(_WORD_NUMBERS, key=len, reverse=True))
+_QUANTITY = re.compile(
+    rf"(?P<low>{_AMOUNT}|(?:{_WORDS})\b)"
+    rf"(?:\s*(?:-|–|\ba\b|\bate\b|\bou\b|\bto\b|\bor\b)\s*(?P<high>{_AMOUNT}))?\s*",
+    re.IGNORECASE)
+_UNIT = re.compile(
+    r"(?P<unit>" + "|".join(re.escape(s) for s in sorted(_UNIT_LOOKUP, key=len, reverse=True)) + r")"
+    r"(?:\(e?s\))?(?=[\s,;:)(]|$)\s*",
+    re.IGNORECASE)
+_LEADING_NOTE = re.compile(r"^\(([^)]*)\)\s*")
+_CONNECTOR = re.compile(r"^(?:de|do|da|dos|das|of)\s+", re.IGNORECASE)
+_TO_TASTE = re.compile(
+    r"[\s,(]*\b(?:a\s+gosto|à\s+gosto|quanto\s+baste|q\.?\s?b\.?|to\s+taste|as\s+needed)\)?[\s.]*$",
+    re.IGNORECASE)
+_BULLET = re.compile(r"^[\s\-–•*·]+")
+_UNICODE_FRACTION = re.compile(r"(\d)?\s*([" + "".join(_UNICODE_FRACTIONS) + r"])")
+_SPACES = re.compile(r"\s+")
+_SLASH = re.compile(r"\s*/\s*")
+_MIXED_SPLIT = re.compile(r"\s+(?:e\s+|and\s+)?")
+_SPOKEN_HALF = re.compile(r"\b(?:meia|meio|half)\b", re.IGNORECASE)
+# Ditado: vírgula, "próximo" ou " e " seguido de nova quantidade (não "1 e 1/2", "e meia")
+_SPOKEN_WHOLE = "|".join(w for w in sorted(_WORD_NUMBERS, key=len, reverse=True)
+                         if _WORD_NUMBERS[w] != "1/2")
+_SPOKEN_SEPARATOR = re.compile(
+    rf"\s*[,;]\s*|\s+(?:pr[oó]ximo|next)\s+|\s+(?:e|and)\s+(?=(?:\d+(?![\d/])|(?:{_SPOKEN_WHOLE})\b))",
+    re.IGNORECASE)
+
+
+class ParsedIngredient(NamedTuple):
+    name: str
+    quantity: str  # Texto normalizado: "2", "1 1/2", "0.5", "2-3", "a gosto" ou ""
+    unit: str  # Nome canônico da tabela, ou "" se não houver
+    amount: Optional[float] = None  # Valor numérico (menor valor da faixa)
+    amount_max: Optional[float] = None  # Maior valor da faixa (None se não for faixa)
+
+    def as_dict(self) -> Dict[str, str]:
+        """Formato de IngredientSchema/telas."""
+        return {"name": self.name, "quantity": self.quantity, "unit": self.unit}
+
+
+def _fold(text: str) -> str:
+    return text.lower().translate(_FOLD)
+
+
+def _amount(raw: str) -> tuple[str, float]:
+    """Texto normalizado + valor de uma quantidade ("1 e 1/2", "1 e meia" -> "1 1/2", 1.5)."""
+    raw = _SLASH.sub("/", _SPOKEN_HALF.sub("1/2", _WORD_NUMBERS.get(_fold(raw), raw)))
+    parts = _MIXED_SPLIT.split(raw.strip(), maxsplit=1) if "/" in raw else [raw]
+    value, texts = 0.0, []
+    for part in parts:
+        part = part.replace(" ", "")
+        if "/" in part:
+            num, den = part.split("/")
+            value += int(num) / int(den) if int(den) else 0.0
+        else:
+            part = part.replace(",", ".")
+            value += float(part)
+        texts.append(part)
+    return " ".join(texts), value
+
+
+def _clean_line(line: str) -> str:
+    line = unicodedata.normalize("NFC", line).replace(" ", " ").replace("&nbsp;", " ").replace("⁄", "/")
+    line = _UNICODE_FRACTION.sub(
+        lambda m: (m.group(1) + " " if m.group(1) else " ") + _UNICODE_FRACTIONS[m.group(2)], line)
+    return _SPACES.sub(" ", _BULLET.sub("", line)).strip()
+
+
+@lru_cache(maxsize=8192)
+def parse_ingredient(line: str) -> ParsedIngredient:
+    """Separa quantidade, unidade e nome de uma linha de ingrediente."""
+    text = _clean_line(line or "")
+    quantity, unit, amount, amount_max = "", "", None, None
+
+    match = _QUANTITY.match(text)
+    if match:
+        quantity, amount = _amount(match.group("low"))
+        if match.group("high"):
+            high_text, amount_max = _amount(match.group("high"))
+            quantity = f"{quantity}-{high_text}"
+        text = text[match.end():]
+
+    # Notas entre parênteses antes/depois da unidade: "1 (400 g) lata", "200 g (1 xícara) de"
+    text = _LEADING_NOTE.sub("", text)
+    folded = _fold(text)
+    unit_match = _UNIT.match(folded)
+    if unit_match and (match or folded.startswith(("colher", "xicara", "pitada", "punhado"))):
+        unit = _UNIT_LOOKUP[unit_match.group("unit").lower()]
+        text = text[unit_match.end():]
+
+    text = _LEADING_NOTE.sub("", text)
+    text = _CONNECTOR.sub("", text)
+
+    to_taste = _TO_TASTE.search(text)
+    if to_taste:
+        text = text[:to_taste.start()]
+        if not quantity:
+            quantity = TO_TASTE
+
+    name = text.strip(" ,;:-.")
+    if not name:  # Linha só com "a gosto", unidade etc.: preserva o texto original
+        name = _clean_line(line or "")
+    return ParsedIngredient(name, quantity, unit, amount, amount_max)
+
+
+def parse_ingredients(lines: Iterable[str]) -> List[ParsedIngredient]:
+    """Versão em lote (milhares de linhas por chamada; linhas repetidas são resolvidas uma vez)."""
+    parse = parse_ingredient
+    return [parse(line) for line in lines]
+
+
+def split_spoken_list(text: str) -> List[str]:
+    """Separa um ditado em itens: "duas xícaras de farinha e três ovos" -> 2 itens."""
+    return [part.strip(" .") for part in _SPOKEN_SEPARATOR.split(text or "") if part.strip(" .")]
+
+
+def normalize_unit(unit: Optional[str]) -> str:
+    """Nome canônico de uma unidade conhecida; desconhecidas voltam só sem espaços extras."""
+    if not unit:
+        return ""
+    cleaned = _SPACES.sub(" ", unit).strip()
+    return _UNIT_LOOKUP.get(_fold(cleaned), cleaned)
+
+
+def normalize_ingredients(items: Iterable[Union[str, Dict]]) -> List[Dict]:
+    """
+    Padroniza ingredientes de fontes variadas (importação, seed, lote):
+    strings e dicts sem quantidade/unidade passam pelo parser; nos demais,
+    só a unidade é canonizada ("colheres sopa" -> "colher de sopa").
+    """
+    result = []
+    for item in items:
+        if isinstance(item, str):
+            result.append(parse_ingredient(item).as_dict())
+            continue
+        if not isinstance(item, dict):
+            result.append(item)
+            continue
+        quantity, unit = item.get("quantity"), item.get("unit")
+        if not quantity and not unit and item.get("name"):
+            parsed = parse_ingredient(item["name"]).as_dict()
+            result.append({**item, **parsed})
+        elif unit and _fold(unit.strip()) in (TO_TASTE, "q.b."):
+            result.append({**item, "quantity": TO_TASTE, "unit": ""})
+        else:
+            result.append({**item, "unit": normalize_unit(unit)})
+    return result
@@ -0,0 +1,104 @@
+# ARQUIVO: src/utils/schema_org.py
+"""
+Normalizadores de campos Schema.org/Recipe (JSON-LD dos sites) para valores numéricos.
+
+- Durações ISO-8601 (P1DT2H30M15S, PT0.5H...) ou texto livre ("1 h 20 min") -> minutos.
+- recipeYield em qualquer formato (número, texto, lista, QuantitativeValue) ->
+  (quantidade de porções, texto para exibição).
+Regexes pré-compiladas no carregamento do módulo.
+"""
+import math
+import re
+from typing import Any, Dict, NamedTuple, Optional
+
+_NUM = r"(\d+(?:[.,]\d+)?)"
+_ISO_DURATION = re.compile(
+    rf"^P(?!$)(?:{_NUM}Y)?(?:{_NUM}M)?(?:{_NUM}W)?(?:{_NUM}D)?"
+    rf"(?:T(?=\d)(?:{_NUM}H)?(?:{_NUM}M)?(?:{_NUM}S)?)?$",
+    re.IGNORECASE)
+# Minutos por unidade, na ordem dos grupos de _ISO_DURATION (ano e mês aproximados)
+_ISO_UNIT_MINUTES = (525600, 43200, 10080, 1440, 60, 1, 1 / 60)
+
+_LOOSE_DURATION = re.compile(
+    rf"{_NUM}\s*(d(?:ia|ay)?s?|h(?:r|rs|ora|oras|our|ours)?|m(?:in|ins|inuto|inutos|inute|inutes)?|s(?:eg|ec)?)\b",
+    re.IGNORECASE)
+_LOOSE_UNIT_MINUTES = {"d": 1440, "h": 60, "m": 1, "s": 1 / 60}
+
+_PLAIN_NUMBER = re.compile(rf"^\s*{_NUM}\s*$")
+_FIRST_INT = re.compile(r"\d+")
+_YIELD_WORDS = re.compile(
+    r"\b(?:servings?|serves|portions?|people|persons?|porç(?:ão|ões)|porcoes|pessoas?|rende|rendimento)\b:?",
+    re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+
+class RecipeYield(NamedTuple):
+    count: Optional[int]  # Porções (None se não houver número)
+    text: Optional[str]  # Texto para exibição ("4", "1 bolo", "24 cookies")
+
+
+def _to_float(raw: Optional[str]) -> float:
+    return float(raw.replace(",", ".")) if raw else 0.0
+
+
+def _positive_minutes(total: float) -> Optional[int]:
+    return math.ceil(total - 1e-9) if total > 0 else None
+
+
+def parse_duration_minutes(value: Any) -> Optional[int]:
+    """Minutos (arredondados para cima) de uma duração; None se ausente, zero ou ilegível."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return _positive_minutes(float(value))
+    if isinstance(value, (list, tuple)):
+        return next((m for m in map(parse_duration_minutes, value) if m), None)
+    if isinstance(value, dict):
+        return parse_duration_minutes(value.get("value") or value.get("@value"))
+
+    text = str(value).strip()
+    match = _ISO_DURATION.match(text)
+    if match:
+        return _positive_minutes(sum(_to_float(g) * unit for g, unit in zip(match.groups(), _ISO_UNIT_MINUTES)))
+    match = _PLAIN_NUMBER.match(text)
+    if match:
+        return _positive_minutes(_to_float(match.group(1)))
+    total = sum(_to_float(num) * _LOOSE_UNIT_MINUTES[unit[0].lower()]
+                for num, unit in _LOOSE_DURATION.findall(text))
+    return _positive_minutes(total)
+
+
+def recipe_total_minutes(data: Dict[str, Any]) -> Optional[int]:
+    """totalTime; na falta dele, a soma de prepTime + cookTime + performTime."""
+    total = parse_duration_minutes(data.get("totalTime"))
+    if total:
+        return total
+    parts = [parse_duration_minutes(data.get(key)) for key in ("prepTime", "cookTime", "performTime")]
+    return sum(p for p in parts if p) or None
+
+
+def parse_yield(value: Any) -> RecipeYield:
+    """Normaliza recipeYield/servings. Listas: número do primeiro item numérico, texto do mais descritivo."""
+    if value is None or isinstance(value, bool):
+        return RecipeYield(None, None)
+    if isinstance(value, (int, float)):
+        count = int(value) if value >= 1 else None
+        return RecipeYield(count, str(count) if count else None)
+    if isinstance(value, dict):
+        return parse_yield(value.get("value") or value.get("@value"))
+    if isinstance(value, (list, tuple)):
+        parsed = [parse_yield(item) for item in value]
+        count = next((p.count for p in parsed if p.count), None)
+        descriptive = [p.text for p in parsed if p.text and not p.text.isdigit()]
+        text = descriptive[0] if descriptive else next((p.text for p in parsed if p.text), None)
+        return RecipeYield(count, text)
+
+    text = _SPACES.sub(" ", _YIELD_WORDS.sub(" ", str(value))).strip(" :-")
+    match = _FIRST_INT.search(text)
+    count = int(match.group(0)) if match and int(match.group(0)) >= 1 else None
+    return RecipeYield(count, text or (str(count) if count else None))
+
+
+def servings_count(text: Optional[str]) -> Optional[int]:
+    """Quantidade de porções de um texto livre ("4 pessoas", "6-8 porções" -> 6)."""
+    return parse_yield(text).count if text else None
@@ -3,6 +3,7 @@ import flet as ft
 from src.database.recipe_queries import RecipeQueries
 from src.database.category_queries import CategoryQueries
 from src.models.user_model import User
+from src.services.prefetch_service import get_prefetcher
 from src.core.logger import get_logger
 
 logger = get_logger("src.viewmodels.discovery")
@@ -13,11 +14,17 @@ class DiscoveryViewModel:
         self.page = page
         self.db = RecipeQueries()
         self.cat_db = CategoryQueries()
+        self.prefetcher = get_prefetcher()
 
         self.user: User = self.page.data.get("logged_in_user")
         self.recipes = []
         self.categories_options = []
 
+        # Paginação (cursor da próxima página + total para o contador)
+        self.next_cursor = None
+        self.total_count = 0
+        self._filters = {}
+
         # Estado dos Filtros
         self.active_category_id = 0
 
@@ -55,6 +62,8 @@ class DiscoveryViewModel:
 
     def search(self, term: str = "", max_time: str = "", servings: str = "", category_val: str = None):
         """Busca blindada."""
+        # A busca anterior deixa de valer já agora, não só quando esta terminar
+        self.prefetcher.cancel()
         try:
             # Conversão segura de tipos
             # Aceita float do slider
@@ -68,18 +77,44 @@ class DiscoveryViewModel:
             logger.info(
                 f"Busca: '{term}', Time<={time_limit}, CatID={self.active_category_id}")
 
-            self.recipes = self.db.search_advanced(
-                uid=self.user.id,
+            self._filters = dict(
                 term=term,
                 max_time=time_limit,
                 servings=servings,
                 category_id=self.active_category_id
             )
-            logger.info(f"Resultados: {len(self.recipes)}")
+            self.recipes, self.next_cursor = self.db.search_page(
+                uid=self.user.id, **self._filters)
+            self.total_count = self.db.count_search(
+                uid=self.user.id, **self._filters)
+            logger.info(
+                f"Resultados: {self.total_count} (página com {len(self.recipes)})")
+            # Aquece detalhes e imagens dos primeiros cards
+            self.prefetcher.prefetch(self.recipes)
 
         except Exception as e:
             logger.error(f"Erro na busca: {e}", exc_info=True)
             self.recipes = []
+            self.next_cursor = None
+            self.total_count = 0
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def load_more(self) -> list:
+        """Carrega a próxima página da busca atual. Retorna apenas os novos itens."""
+        if not self.has_more:
+            return []
+        try:
+            page, self.next_cursor = self.db.search_page(
+                uid=self.user.id, after=self.next_cursor, **self._filters)
+            self.recipes.extend(page)
+            return page
+        except Exception as e:
+            logger.error(f"Erro ao carregar mais resultados: {e}")
+            self.next_cursor = None
+            return []
 
     def navigate_to_details(self, recipe_id: int):
         self.page.data["detail_recipe_id"] = recipe_id
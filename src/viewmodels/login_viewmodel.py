@@ -2,7 +2,8 @@
 import logging
 from typing import Optional
 import flet as ft
-from src.database import auth_queries
+from src.core.exceptions import ServiceBusyError
+from src.database import auth_queries, session_queries
 
 logger = logging.getLogger("src.viewmodels.login")
 
@@ -13,11 +14,25 @@ class LoginViewModel:
         logger.debug("LoginViewModel inicializado.")
         self.email_field: Optional[ft.TextField] = None
         self.password_field: Optional[ft.TextField] = None
+        self.submit_button: Optional[ft.Control] = None
+        self.progress: Optional[ft.Control] = None
+        self.is_busy = False
 
-    def set_controls(self, email, password):
+    def set_controls(self, email, password, submit_button=None, progress=None):
         """Vincula campos da view ao viewmodel."""
         self.email_field = email
         self.password_field = password
+        self.submit_button = submit_button
+        self.progress = progress
+
+    def _set_busy(self, busy: bool):
+        """Indica autenticação em andamento (bcrypt roda fora do loop de eventos)."""
+        self.is_busy = busy
+        if self.submit_button:
+            self.submit_button.disabled = busy
+        if self.progress:
+            self.progress.visible = busy
+        self.page.update()
 
     def _show_snackbar(self, msg, is_error=True):
         """Exibe feedback visual."""
@@ -31,9 +46,11 @@ class LoginViewModel:
         except Exception as e:
             logger.error(f"Erro ao mostrar SnackBar: {e}")
 
-    def on_login_click(self, e):
+    async def on_login_click(self, e):
         """Processa o clique no botão de login."""
         logger.debug("Botão Login clicado.")
+        if self.is_busy:
+            return  # Ignora cliques/Enter repetidos durante a verificação
         try:
             # 1. Limpa erros visuais anteriores
             if self.email_field:
@@ -56,9 +73,13 @@ class LoginViewModel:
                 self.page.update()
                 return
 
-            # 4. Autenticação no Banco
+            # 4. Autenticação no Banco (pool de threads, sem travar a UI)
             logger.debug(f"Consultando banco para: {email}")
-            user = auth_queries.get_user_by_email_and_password(email, password)
+            self._set_busy(True)
+            try:
+                user = await auth_queries.get_user_by_email_and_password_async(email, password)
+            finally:
+                self._set_busy(False)
 
             # 5. Decisão
             if user:
@@ -66,6 +87,7 @@ class LoginViewModel:
 
                 # Salva na sessão
                 self.page.data["logged_in_user"] = user
+                await self._remember_session(user)
 
                 # Feedback
                 self._show_snackbar("Bem-vindo!", is_error=False)
@@ -80,10 +102,25 @@ class LoginViewModel:
                     self.password_field.error_text = "Credenciais inválidas."
                 self.page.update()
 
+        except ServiceBusyError as ex:
+            self._show_snackbar(str(ex))
         except Exception as ex:
             logger.critical(f"Erro no fluxo de login: {ex}", exc_info=True)
             self._show_snackbar("Erro interno no sistema.")
 
+    async def _remember_session(self, user):
+        """Emite o token de sessão e o guarda no cliente (reconexão sem senha)."""
+        token = session_queries.create_session(user)
+        if not token:
+            return
+        self.page.data["session_token"] = token
+        prefs = self.page.data.get("prefs")
+        if prefs:
+            try:
+                await prefs.set(session_queries.SESSION_PREF_KEY, token)
+            except Exception as ex:
+                logger.warning(f"Não foi possível salvar a sessão no cliente: {ex}")
+
     def on_navigate_to_register(self, e):
         logger.debug("Navegando para Registro.")
         self.page.go("/register")
@@ -19,6 +19,10 @@ class RecipeListViewModel:
         self.current_dialog: Optional[ft.AlertDialog] = None
         self.current_mode = "my"
 
+        # Paginação (cursor da próxima página + total da listagem)
+        self.next_cursor: Optional[str] = None
+        self.total_count = 0
+
     def _close_dialog(self, e):
         if self.current_dialog:
             self.current_dialog.open = False
@@ -48,14 +52,32 @@ class RecipeListViewModel:
     def load_recipes(self):
         if not self.user: return
         try:
-            # Na view "Minhas Receitas", usamos sempre get_user_recipes
-            self.recipes = self.db.get_user_recipes(self.user.id)
-            logger.info(f"Lista carregada ({self.current_mode}): {len(self.recipes)} itens.")
+            # Na view "Minhas Receitas", usamos sempre get_user_recipes (paginado)
+            self.recipes, self.next_cursor = self.db.get_user_recipes_page(self.user.id)
+            self.total_count = self.db.count_user_recipes(self.user.id)
+            logger.info(f"Lista carregada ({self.current_mode}): {len(self.recipes)} de {self.total_count} itens.")
             self.page.update()
         except Exception as e:
             logger.error(f"Erro load: {e}")
             self._show_feedback_modal("Erro", "Falha ao carregar lista.", is_error=True)
 
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def get_recipes_count(self) -> int:
+        """Total de receitas da listagem (não apenas as já carregadas)."""
+        return self.total_count
+
+    def load_more(self):
+        if not self.user or not self.has_more: return
+        try:
+            page, self.next_cursor = self.db.get_user_recipes_page(self.user.id, after=self.next_cursor)
+            self.recipes.extend(page)
+        except Exception as e:
+            logger.error(f"Erro load_more: {e}")
+            self.next_cursor = None
+
     def delete_recipe(self, recipe_id: int):
         try:
             if self.db.delete_recipe(recipe_id, self.user.id):
@@ -1,11 +1,15 @@
 # ARQUIVO: src/viewmodels/recipe_viewmodel.py
 import flet as ft
-from typing import List, Optional, Dict, Tuple
+from typing import AsyncIterator, List, Optional, Dict, Tuple
 from src.core.logger import get_logger
 from src.database.recipe_queries import RecipeQueries
 from src.models.recipe import RecipeCreate, IngredientSchema
 from src.models.user_model import User
 from src.services.scraper_service import RecipeScraper
+from src.services.batch_import_service import (
+    BatchImporter, BatchImportResult, ImportProgress, parse_url_list)
+from src.services.voice_service import DictationSession, Transcript, open_dictation, voice_unavailable_reason
+from src.utils.ingredient_parser import parse_ingredient, split_spoken_list
 
 logger = get_logger("src.viewmodels.recipe")
 
@@ -126,3 +130,46 @@ class RecipeViewModel:
             del data['ingredients']
 
         return None, data
+
+    # --- IMPORTAÇÃO EM LOTE ---
+    async def import_batch(self, text: str, category_id: Optional[str],
+                           result: BatchImportResult) -> AsyncIterator[ImportProgress]:
+        """
+        Importa todas as URLs encontradas em `text` (lista colada ou HTML de favoritos)
+        direto no banco, na categoria escolhida. Produz o progresso item a item.
+        """
+        urls = parse_url_list(text)
+        if not urls or not category_id:
+            return
+        async for progress in BatchImporter().import_urls(urls, self.user.id, int(category_id), result):
+            yield progress
+
+    # --- DITADO DE INGREDIENTES ---
+    def open_dictation(self) -> Tuple[Optional[str], Optional[DictationSession]]:
+        """Sessão de ditado offline (microfone + Vosk), ou o motivo de não haver uma."""
+        reason = voice_unavailable_reason()
+        if reason:
+            return reason, None
+        try:
+            return None, open_dictation()
+        except Exception as e:
+            logger.error(f"Erro ao iniciar ditado: {e}")
+            return f"Erro ao iniciar o ditado: {e}", None
+
+    def add_spoken_ingredients(self, text: str) -> int:
+        """Adiciona cada item de uma frase ditada (quantidade e unidade separadas). Retorna quantos."""
+        added = 0
+        for item in split_spoken_list(text):
+            parsed = parse_ingredient(item)
+            if self.add_temp_ingredient(parsed.name, parsed.quantity, parsed.unit) is None:
+                added += 1
+        return added
+
+    async def dictate_ingredients(self, session: DictationSession) -> AsyncIterator[Tuple[Transcript, int]]:
+        """
+        Ditado contínuo: produz cada transcrição (parcial ou final) e quantos
+        ingredientes a frase final adicionou. Termina quando a sessão é parada.
+        """
+        async for transcript in session.stream():
+            added = self.add_spoken_ingredients(transcript.text) if transcript.final else 0
+            yield transcript, added
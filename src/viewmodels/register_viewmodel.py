@@ -2,6 +2,7 @@
 import logging
 from typing import Optional
 import flet as ft
+from src.core.exceptions import ServiceBusyError
 from src.database import auth_queries
 
 logger = logging.getLogger(__name__)
@@ -13,12 +14,25 @@ class RegisterViewModel:
         self.name_field: Optional[ft.TextField] = None
         self.email_field: Optional[ft.TextField] = None
         self.password_field: Optional[ft.TextField] = None
+        self.submit_button: Optional[ft.Control] = None
+        self.progress: Optional[ft.Control] = None
+        self.is_busy = False
 
-    def set_controls(self, name, email, password):
+    def set_controls(self, name, email, password, submit_button=None, progress=None):
         logger.debug("Controles vinculados.")
         self.name_field = name
         self.email_field = email
         self.password_field = password
+        self.submit_button = submit_button
+        self.progress = progress
+
+    def _set_busy(self, busy: bool):
+        self.is_busy = busy
+        if self.submit_button:
+            self.submit_button.disabled = busy
+        if self.progress:
+            self.progress.visible = busy
+        self.page.update()
 
     def _show_overlay_feedback(self, msg: str, is_error: bool = True):
         logger.debug(f"SnackBar: {msg}")
@@ -27,8 +41,10 @@ class RegisterViewModel:
         self.page.snack_bar.open = True
         self.page.update()
 
-    def on_register_click(self, e):
+    async def on_register_click(self, e):
         logger.debug("Click Registrar.")
+        if self.is_busy:
+            return
         try:
             if not self._validate_inputs():
                 logger.warning("Inputs inválidos.")
@@ -39,7 +55,11 @@ class RegisterViewModel:
             password = self.password_field.value
 
             logger.debug(f"Chamando auth_queries para: {email}")
-            user = auth_queries.register_user(name, email, password)
+            self._set_busy(True)
+            try:
+                user = await auth_queries.register_user_async(name, email, password)
+            finally:
+                self._set_busy(False)
 
             if user:
                 logger.info(f"Sucesso: {user.email}")
@@ -53,6 +73,8 @@ class RegisterViewModel:
                 else:
                     self._show_overlay_feedback("E-mail já existe.")
 
+        except ServiceBusyError as ex:
+            self._show_overlay_feedback(str(ex))
         except Exception as ex:
             logger.error(f"Erro View Register: {ex}", exc_info=True)
             self._show_overlay_feedback("Erro interno.")
@@ -0,0 +1,38 @@
+# ARQUIVO: src/views/components/cached_image.py
+import base64
+import flet as ft
+from src.core.logger import get_logger
+from src.services.image_cache import get_image_cache, is_remote_image
+
+logger = get_logger("src.components.cached_image")
+
+# PNG 1x1 transparente: ocupa o lugar até a miniatura chegar do cache/rede
+_PLACEHOLDER = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII=")
+
+
+def CachedImage(src: str, variant: str, **image_kwargs) -> ft.Image:
+    """
+    ft.Image servida pelo cache local de imagens, na miniatura do tamanho da tela
+    ("list", "grid" ou "hero"). Caminhos locais/assets passam direto.
+    """
+    if not is_remote_image(src):
+        return ft.Image(src=src, **image_kwargs)
+
+    cache = get_image_cache()
+    data = cache.cached(src, variant)
+    if data is not None:
+        return ft.Image(src=data, **image_kwargs)
+
+    image = ft.Image(src=_PLACEHOLDER, **image_kwargs)
+
+    def on_ready(result):
+        # Sem cache nem rede: entrega a URL (o Flet mostra error_content se falhar)
+        image.src = result if result is not None else src
+        try:
+            image.update()
+        except RuntimeError:
+            pass  # Ainda não está na página (ou a tela já foi fechada): src vale no próximo update
+
+    cache.load_into(src, variant, on_ready)
+    return image
@@ -1,6 +1,7 @@
 # ARQUIVO: src/views/discovery_view.py
 import flet as ft
 from src.viewmodels.discovery_viewmodel import DiscoveryViewModel
+from src.views.components.cached_image import CachedImage
 from src.core.logger import get_logger
 
 logger = get_logger("src.views.discovery")
@@ -112,10 +113,87 @@ def DiscoveryView(page: ft.Page) -> ft.View:
         padding=15,
     )
 
+    def build_card(r) -> ft.Container:
+        rid = r['id']
+        img = r.get('image_path')
+
+        # Card de Receita
+        card = ft.Container(
+            content=ft.Column([
+                # Imagem
+                ft.Container(
+                    content=CachedImage(img, "grid", fit="cover", expand=True) if img and len(img) > 5
+                    else ft.Icon(ft.Icons.RESTAURANT, size=40, color=ft.Colors.ORANGE_200),
+                    bgcolor=ft.Colors.ORANGE_50,
+                    expand=3,
+                    border_radius=ft.border_radius.only(
+                        top_left=12, top_right=12),
+                    # [CORREÇÃO] Substituído ft.alignment.center por ft.Alignment(0, 0)
+                    alignment=ft.Alignment(0, 0)
+                ),
+                # Texto
+                ft.Container(
+                    content=ft.Column([
+                        ft.Text(r.get('title'), weight="bold",
+                                size=14, max_lines=2, overflow="ellipsis"),
+                        ft.Row([
+                            ft.Row([
+                                ft.Icon(ft.Icons.TIMER_OUTLINED,
+                                        size=14, color="grey"),
+                                ft.Text(
+                                    f"{r.get('preparation_time', '?')} min", size=12, color="grey")
+                            ], spacing=2),
+                            ft.IconButton(
+                                icon=ft.Icons.STAR if r.get(
+                                    'is_favorite') else ft.Icons.STAR_BORDER,
+                                icon_color="amber" if r.get(
+                                    'is_favorite') else "grey",
+                                icon_size=22,
+                                tooltip="Favoritar",
+                                on_click=lambda e, x=rid: [
+                                    vm.toggle_favorite(x), update_results_ui()]
+                            )
+                        ], alignment="spaceBetween", vertical_alignment="center")
+                    ], spacing=5),
+                    padding=10,
+                    expand=2,
+                    bgcolor="white",
+                    border_radius=ft.border_radius.only(
+                        bottom_left=12, bottom_right=12)
+                )
+            ], spacing=0),
+            border_radius=12,
+            shadow=ft.BoxShadow(blur_radius=8, color=ft.Colors.with_opacity(
+                0.1, "black"), offset=ft.Offset(0, 4)),
+            on_click=lambda e, x=rid: vm.navigate_to_details(x),
+            ink=True
+        )
+        return card
+
+    # [PAGINAÇÃO] Renderiza só a página atual; demais sob demanda
+    def load_more(e=None):
+        new_items = vm.load_more()
+        if load_more_cell in results_grid.controls:
+            results_grid.controls.remove(load_more_cell)
+        for r in new_items:
+            results_grid.controls.append(build_card(r))
+        if vm.has_more:
+            results_grid.controls.append(load_more_cell)
+        page.update()
+
+    load_more_cell = ft.Container(
+        content=ft.OutlinedButton(
+            "Carregar mais",
+            icon=ft.Icons.EXPAND_MORE,
+            on_click=load_more,
+            style=ft.ButtonStyle(color=ft.Colors.ORANGE_700)
+        ),
+        alignment=ft.Alignment(0, 0)
+    )
+
     def update_results_ui():
         results_grid.controls.clear()
-        count = len(vm.recipes)
-        results_count_text.value = f"{count} receitas encontradas"
+        results_count_text.value = f"{vm.total_count} receitas encontradas"
 
         if not vm.recipes:
             # EMPTY STATE
@@ -142,61 +220,9 @@ def DiscoveryView(page: ft.Page) -> ft.View:
             )
         else:
             for r in vm.recipes:
-                rid = r['id']
-                img = r.get('image_path')
-
-                # Card de Receita
-                card = ft.Container(
-                    content=ft.Column([
-                        # Imagem
-                        ft.Container(
-                            content=ft.Image(src=img, fit="cover", expand=True) if img and len(img) > 5
-                            else ft.Icon(ft.Icons.RESTAURANT, size=40, color=ft.Colors.ORANGE_200),
-                            bgcolor=ft.Colors.ORANGE_50,
-                            expand=3,
-                            border_radius=ft.border_radius.only(
-                                top_left=12, top_right=12),
-                            # [CORREÇÃO] Substituído ft.alignment.center por ft.Alignment(0, 0)
-                            alignment=ft.Alignment(0, 0)
-                        ),
-                        # Texto
-                        ft.Container(
-                            content=ft.Column([
-                                ft.Text(r.get('title'), weight="bold",
-                                        size=14, max_lines=2, overflow="ellipsis"),
-                                ft.Row([
-                                    ft.Row([
-                                        ft.Icon(ft.Icons.TIMER_OUTLINED,
-                                                size=14, color="grey"),
-                                        ft.Text(
-                                            f"{r.get('preparation_time', '?')} min", size=12, color="grey")
-                                    ], spacing=2),
-                                    ft.IconButton(
-                                        icon=ft.Icons.STAR if r.get(
-                                            'is_favorite') else ft.Icons.STAR_BORDER,
-                                        icon_color="amber" if r.get(
-                                            'is_favorite') else "grey",
-                                        icon_size=22,
-                                        tooltip="Favoritar",
-                                        on_click=lambda e, x=rid: [
-                                            vm.toggle_favorite(x), update_results_ui()]
-                                    )
-                                ], alignment="spaceBetween", vertical_alignment="center")
-                            ], spacing=5),
-                            padding=10,
-                            expand=2,
-                            bgcolor="white",
-                            border_radius=ft.border_radius.only(
-                                bottom_left=12, bottom_right=12)
-                        )
-                    ], spacing=0),
-                    border_radius=12,
-                    shadow=ft.BoxShadow(blur_radius=8, color=ft.Colors.with_opacity(
-                        0.1, "black"), offset=ft.Offset(0, 4)),
-                    on_click=lambda e, x=rid: vm.navigate_to_details(x),
-                    ink=True
-                )
-                results_grid.controls.append(card)
+                results_grid.controls.append(build_card(r))
+            if vm.has_more:
+                results_grid.controls.append(load_more_cell)
 
         page.update()
 
@@ -18,7 +18,9 @@ def LoginView(page: ft.Page) -> ft.View:
     btn_reg = ft.TextButton(
         "Criar conta", on_click=vm.on_navigate_to_register, width=float('inf'))
 
-    vm.set_controls(email_field, pass_field)
+    progress = ft.ProgressRing(width=24, height=24, visible=False)
+
+    vm.set_controls(email_field, pass_field, btn_log, progress)
 
     form = ft.Container(
         content=ft.Column([
@@ -27,7 +29,7 @@ def LoginView(page: ft.Page) -> ft.View:
             ft.Text("Acesso Restrito", size=24, weight="bold"),
             ft.Divider(height=10, color="transparent"),
             email_field, pass_field,
-            btn_log, btn_reg
+            btn_log, progress, btn_reg
         ], spacing=15, horizontal_alignment="center"),
         width=400, padding=30, border_radius=15, bgcolor=ft.Colors.SURFACE,
         shadow=ft.BoxShadow(
@@ -1,8 +1,12 @@
 # ARQUIVO: src/views/recipe_create_view.py
+import asyncio
 import flet as ft
 from src.viewmodels.recipe_viewmodel import RecipeViewModel
-from src.services.intelligence_service import IntelligenceService
+from src.services.batch_import_service import BatchImportResult
 from src.database.category_queries import CategoryQueries
+from src.core.logger import get_logger
+
+logger = get_logger("src.views.recipe_create")
 
 
 def RecipeCreateView(page: ft.Page) -> ft.View:
@@ -111,31 +115,135 @@ def RecipeCreateView(page: ft.Page) -> ft.View:
         dlg.open = True
         page.update()
 
-    def start_voice(e):
-        page.snack_bar = ft.SnackBar(
-            ft.Text("Ouvindo... Fale os ingredientes! 🎤"))
-        page.snack_bar.open = True
+    def show_batch_import_dialog(e):
+        tf_urls = ft.TextField(
+            label="Links (um por linha) ou HTML de favoritos", multiline=True,
+            min_lines=6, max_lines=10, autofocus=True)
+        progress_bar = ft.ProgressBar(value=0, visible=False)
+        status_text = ft.Text("", size=12)
+        btn_start = ft.ElevatedButton("Importar Todos")
+        job = {"task": None}  # Importação em andamento (cancelável)
+
+        async def start(e):
+            if not dd_category.value:
+                status_text.value = "Escolha a categoria no formulário antes de importar."
+                page.update()
+                return
+
+            btn_start.disabled = True
+            tf_urls.disabled = True
+            progress_bar.visible = True
+            page.update()
+
+            result = BatchImportResult()
+            imports = vm.import_batch(tf_urls.value, dd_category.value, result)
+            job["task"] = asyncio.current_task()
+            cancelled, failed = False, False
+            try:
+                async for progress in imports:
+                    progress_bar.value = progress.done / progress.total
+                    status_text.value = f"{progress.done}/{progress.total} - {progress.title or progress.url}"
+                    page.update()
+            except asyncio.CancelledError:
+                cancelled = True
+            except Exception as ex:
+                logger.error(f"Falha na importação em lote: {ex}", exc_info=True)
+                failed = True
+            finally:
+                job["task"] = None
+                await imports.aclose()  # Cancela downloads pendentes
+                btn_start.disabled = False
+                tf_urls.disabled = False
+                progress_bar.visible = False
+
+            dlg.open = False
+            imported = len(result.created_ids)
+            if cancelled:
+                msg, color = f"Importação cancelada ({imported} receitas importadas)", "orange"
+            elif failed:
+                msg, color = f"Falha na importação ({imported} receitas importadas)", "red"
+            elif not result.created_ids and not result.failures:
+                msg, color = "Nenhum link encontrado", "grey"
+            else:
+                msg = f"{imported} receitas importadas"
+                if result.failures:
+                    msg += f", {len(result.failures)} falharam"
+                color = "green" if result.created_ids else "red"
+            page.snack_bar = ft.SnackBar(ft.Text(msg + "."), bgcolor=color)
+            page.snack_bar.open = True
+            page.update()
+
+        def close(e):
+            if job["task"]:
+                job["task"].cancel()  # start() fecha o diálogo e mostra o resumo
+                return
+            dlg.open = False
+            page.update()
+
+        btn_start.on_click = start
+        dlg = ft.AlertDialog(title=ft.Text("Importar Lista de Links"), modal=True,
+                             content=ft.Column([tf_urls, progress_bar, status_text],
+                                               tight=True, width=400),
+                             actions=[ft.TextButton("Cancelar", on_click=close), btn_start],
+                             on_dismiss=close)
+        page.overlay.append(dlg)
+        dlg.open = True
+        page.update()
+
+    # Ditado contínuo: o microfone fica aberto até o usuário tocar de novo no botão
+    voice = {"session": None}
+    btn_voice = ft.IconButton(ft.Icons.MIC, icon_color="blue", tooltip="Ditar ingredientes")
+    txt_dictation = ft.Text("", size=12, italic=True, color=ft.Colors.GREY_600, visible=False)
+
+    async def toggle_voice(e):
+        if voice["session"]:
+            voice["session"].stop()  # O laço abaixo termina depois da última frase
+            return
+
+        err, session = vm.open_dictation()
+        if err:
+            page.snack_bar = ft.SnackBar(ft.Text(err), bgcolor="orange")
+            page.snack_bar.open = True
+            page.update()
+            return
+
+        voice["session"] = session
+        btn_voice.icon, btn_voice.icon_color, btn_voice.tooltip = ft.Icons.STOP, "red", "Parar ditado"
+        txt_dictation.value = "Ouvindo... Dite os ingredientes! 🎤"
+        txt_dictation.visible = True
         page.update()
 
-        text = IntelligenceService.listen_dictation()
-
-        if text.startswith("ERRO"):
-            page.snack_bar = ft.SnackBar(ft.Text(text), bgcolor="orange")
-        elif text:
-            parts = text.replace(" e ", ",").split(",")
-            count = 0
-            for p in parts:
-                if vm.add_temp_ingredient(p.strip(), "", "") is None:
-                    count += 1
-            _render_ingredients()  # Atualiza visualmente
+        total, failed = 0, False
+        try:
+            async for transcript, added in vm.dictate_ingredients(session):
+                if transcript.final:
+                    total += added
+                    txt_dictation.value = f"✓ {transcript.text}"
+                    _render_ingredients()
+                else:
+                    txt_dictation.value = f"{transcript.text}..."
+                    page.update()
+        except Exception as ex:
+            logger.error(f"Falha no ditado: {ex}", exc_info=True)
+            failed = True
+        finally:
+            voice["session"] = None
+            btn_voice.icon, btn_voice.icon_color, btn_voice.tooltip = ft.Icons.MIC, "blue", "Ditar ingredientes"
+            txt_dictation.visible = False
+
+        if failed:
+            page.snack_bar = ft.SnackBar(ft.Text("Falha no ditado."), bgcolor="red")
+        elif total:
             page.snack_bar = ft.SnackBar(
-                ft.Text(f"{count} ingredientes detectados!"), bgcolor="green")
+                ft.Text(f"{total} ingredientes detectados!"), bgcolor="green")
         else:
             page.snack_bar = ft.SnackBar(
                 ft.Text("Não entendi o áudio."), bgcolor="grey")
         page.snack_bar.open = True
         page.update()
 
+    btn_voice.on_click = toggle_voice
+
     def save_action(e):
         success, msg = vm.save_recipe(
             tf_title.value, tf_time.value, tf_servings.value,
@@ -198,7 +306,9 @@ def RecipeCreateView(page: ft.Page) -> ft.View:
                                                   bgcolor=ft.Colors.BLUE_50, color=ft.Colors.BLUE_800,
                                                   style=ft.ButtonStyle(elevation=0)),
                                 ft.IconButton(
-                                    ft.Icons.MIC, icon_color="blue", tooltip="Voz", on_click=start_voice),
+                                    ft.Icons.PLAYLIST_ADD, icon_color="blue", tooltip="Importar Lista",
+                                    on_click=show_batch_import_dialog),
+                                btn_voice,
                             ])
                         ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
 
@@ -210,6 +320,7 @@ def RecipeCreateView(page: ft.Page) -> ft.View:
 
                         ft.Text("Ingredientes", size=18,
                                 weight=ft.FontWeight.BOLD),
+                        txt_dictation,
                         ft.Row([tf_ing_name, tf_ing_qty, tf_ing_unit,
                                 ft.IconButton(ft.Icons.ADD_CIRCLE, icon_color=ft.Colors.GREEN, icon_size=30, on_click=_add_ingredient)]),
 
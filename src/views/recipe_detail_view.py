@@ -3,6 +3,7 @@ import flet as ft
 import traceback
 from src.core.logger import get_logger
 from src.database.recipe_queries import RecipeQueries
+from src.views.components.cached_image import CachedImage
 
 logger = get_logger("src.views.recipe_detail")
 
@@ -48,8 +49,8 @@ def RecipeDetailView(page: ft.Page) -> ft.View:
         # 1. Imagem Hero
         img_src = recipe.get('image_path')
         if img_src and len(img_src) > 5:
-            image_control = ft.Image(
-                src=img_src,
+            image_control = CachedImage(
+                img_src, "hero",
                 width=float('inf'),
                 height=250,
                 # [CORREÇÃO CRÍTICA] Usando string para compatibilidade total
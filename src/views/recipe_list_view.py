@@ -1,6 +1,7 @@
 # ARQUIVO: src/views/recipe_list_view.py
 import flet as ft
 from src.viewmodels.recipe_list_viewmodel import RecipeListViewModel
+from src.views.components.cached_image import CachedImage
 
 
 def RecipeListView(page: ft.Page) -> ft.View:
@@ -43,8 +44,8 @@ def RecipeListView(page: ft.Page) -> ft.View:
 
                 # Miniatura (Imagem ou Ícone)
                 if img_url and len(img_url) > 5:
-                    leading_content = ft.Image(
-                        src=img_url, width=60, height=60, fit="cover", border_radius=8)
+                    leading_content = CachedImage(
+                        img_url, "list", width=60, height=60, fit="cover", border_radius=8)
                 else:
                     leading_content = ft.Container(
                         content=ft.Icon(ft.Icons.RESTAURANT_MENU,
@@ -99,6 +100,19 @@ def RecipeListView(page: ft.Page) -> ft.View:
                         )
                     )
                 )
+
+            # [PAGINAÇÃO] Próxima página sob demanda
+            if vm.has_more:
+                recipes_list.controls.append(
+                    ft.Container(
+                        content=ft.TextButton(
+                            f"Carregar mais ({len(vm.recipes)} de {vm.get_recipes_count()})",
+                            icon=ft.Icons.EXPAND_MORE,
+                            on_click=lambda e: [vm.load_more(), render_recipes()]
+                        ),
+                        alignment=ft.Alignment(0, 0)
+                    )
+                )
         page.update()
 
     # Hook para recarregar lista
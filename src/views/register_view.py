@@ -20,14 +20,16 @@ def RegisterView(page: ft.Page) -> ft.View:
     btn_log = ft.TextButton(
         "Já tenho conta", on_click=vm.on_navigate_to_login, width=float('inf'))
 
-    vm.set_controls(name_field, email_field, pass_field)
+    progress = ft.ProgressRing(width=24, height=24, visible=False)
+
+    vm.set_controls(name_field, email_field, pass_field, btn_reg, progress)
 
     form = ft.Container(
         content=ft.Column([
             ft.Text("Nova Conta", size=24, weight="bold"),
             ft.Divider(height=10, color="transparent"),
             name_field, email_field, pass_field,
-            btn_reg, btn_log
+            btn_reg, progress, btn_log
         ], spacing=15, horizontal_alignment="center"),
         width=400, padding=30, border_radius=15, bgcolor=ft.Colors.SURFACE,
         shadow=ft.BoxShadow(
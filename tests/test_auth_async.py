@@ -0,0 +1,91 @@
+from src.database import auth_queries
+from src.core.exceptions import ServiceBusyError
+import src.database.database as db_module
+import asyncio
+import threading
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestAuthAsync(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Banco de teste isolado."""
+        random_id = str(uuid.uuid4())[:8]
+        cls.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        cls.original_db = db_module.DB_NAME
+        db_module.DB_NAME = cls.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME)
+        db_module.init_database()
+
+    @classmethod
+    def tearDownClass(cls):
+        auth_queries.shutdown_auth_pool()
+        db_module.close_all_pools()
+        db_module.DB_NAME = cls.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    def test_register_and_login_async(self):
+        async def flow():
+            user = await auth_queries.register_user_async(
+                "Usuário Async", "async@email.com", "senha123")
+            ok = await auth_queries.get_user_by_email_and_password_async(
+                "async@email.com", "senha123")
+            bad = await auth_queries.get_user_by_email_and_password_async(
+                "async@email.com", "errada")
+            return user, ok, bad
+
+        user, ok, bad = asyncio.run(flow())
+        self.assertIsNotNone(user)
+        self.assertEqual(ok.id, user.id)
+        self.assertIsNone(bad)
+
+    def test_event_loop_keeps_running_during_hash(self):
+        async def flow():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            task = asyncio.create_task(ticker())
+            await auth_queries.register_user_async(
+                "Usuário Loop", "loop@email.com", "senha123")
+            task.cancel()
+            return ticks
+
+        self.assertGreater(asyncio.run(flow()), 1)
+
+    def test_saturated_pool_rejects_new_work(self):
+        pool = auth_queries.AuthWorkerPool(max_workers=1, max_pending=2)
+        release = threading.Event()
+
+        async def flow():
+            running = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with self.assertRaises(ServiceBusyError):
+                await pool.run(release.wait)
+            release.set()
+            await asyncio.gather(*running)
+            # Slots liberados: volta a aceitar
+            return await pool.run(lambda: "ok")
+
+        self.assertEqual(asyncio.run(flow()), "ok")
+        pool.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+from src.services.batch_import_service import BatchImporter, BatchImportResult, _HostGate, parse_url_list
+from src.services.http_client import HttpClient
+from src.services import http_client
+from src.database.database import db_connection
+import src.database.database as db_module
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import asyncio
+import threading
+import time
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+RECIPE_PAGE = """<html><head><script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "Recipe", "name": "Receita %s",
+ "totalTime": "PT30M", "recipeIngredient": ["2 xícaras de farinha"],
+ "recipeInstructions": "Misture e asse."}
+</script></head><body></body></html>"""
+
+RESPONSE_DELAY = 0.1
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        host = self.headers.get("Host", "").split(":")[0]
+        with server.lock:
+            server.active[host] = server.active.get(host, 0) + 1
+            server.peak[host] = max(server.peak.get(host, 0), server.active[host])
+            server.starts.setdefault(host, []).append(time.monotonic())
+        try:
+            time.sleep(RESPONSE_DELAY)
+            if self.path.startswith("/missing"):
+                self.send_error(404)
+                return
+            if self.path.startswith("/plain"):
+                body = b"<html><body>sem receita</body></html>"
+            else:
+                body = (RECIPE_PAGE % self.path.strip("/")).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active[host] -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBatchImport(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        random_id = str(uuid.uuid4())[:8]
+        cls.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        cls.original_db = db_module.DB_NAME
+        db_module.DB_NAME = cls.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME)
+        db_module.init_database()
+
+        with db_connection() as conn:
+            cls.user_id = conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('Lote', 'lote@test.com', 'h')").lastrowid
+            cls.category_id = conn.execute(
+                "INSERT INTO categories (name, user_id) VALUES ('Importadas', ?)", (cls.user_id,)).lastrowid
+            conn.commit()
+
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        cls.server.lock = threading.Lock()
+        port = cls.server.server_address[1]
+        cls.hosts = (f"http://127.0.0.1:{port}", f"http://localhost:{port}")
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+        cls.original_client = http_client._client
+        http_client._client = HttpClient(cache=None)
+
+    @classmethod
+    def tearDownClass(cls):
+        http_client._client.close()
+        http_client._client = cls.original_client
+        cls.server.shutdown()
+        cls.server.server_close()
+        db_module.close_all_pools()
+        db_module.DB_NAME = cls.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    def setUp(self):
+        self.server.active, self.server.peak, self.server.starts = {}, {}, {}
+        self.executor = ThreadPoolExecutor(max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def _run(self, importer, urls):
+        result = BatchImportResult()
+
+        async def consume():
+            return [p async for p in importer.import_urls(urls, self.user_id, self.category_id, result)]
+
+        return asyncio.run(consume()), result
+
+    def test_parse_url_list_accepts_text_and_bookmarks(self):
+        text = """https://a.com/1
+        <DT><A HREF="https://b.com/bolo" ADD_DATE="1">Bolo</A>
+        veja https://a.com/1, e http://c.com/x."""
+        self.assertEqual(parse_url_list(text),
+                         ["https://a.com/1", "https://b.com/bolo", "http://c.com/x"])
+
+    def test_per_host_limits_are_respected(self):
+        urls = [f"{host}/r{host[7]}{n}" for host in self.hosts for n in range(6)]
+        importer = BatchImporter(max_concurrency=8, host_concurrency=2, host_min_interval=0.0,
+                                 parse_executor=self.executor)
+        progress, result = self._run(importer, urls)
+
+        self.assertEqual(len(progress), 12)
+        self.assertEqual(progress[-1].done, 12)
+        self.assertEqual(len(result.created_ids), 12)
+        self.assertEqual(set(self.server.peak), {"127.0.0.1", "localhost"})
+        self.assertTrue(all(peak <= 2 for peak in self.server.peak.values()))
+        # Os dois hosts correm em paralelo
+        self.assertEqual(max(self.server.peak.values()), 2)
+
+    def test_requests_to_same_host_are_spaced(self):
+        """Mede no relógio do loop, logo após a liberação do portão (sem atraso de threads)."""
+        interval = 0.05
+        gate = _HostGate(concurrency=4, min_interval=interval)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            starts = []
+
+            async def request():
+                async with gate:
+                    starts.append(loop.time())
+                    await asyncio.sleep(RESPONSE_DELAY)
+
+            await asyncio.gather(*(request() for _ in range(4)))
+            return starts
+
+        starts = sorted(asyncio.run(run()))
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        self.assertEqual(len(gaps), 3)
+        self.assertTrue(all(gap >= interval - 1e-3 for gap in gaps), gaps)
+
+    def test_recipes_are_saved_and_failures_reported(self):
+        base = self.hosts[0]
+        urls = [f"{base}/salva{n}" for n in range(3)] + [f"{base}/missing", f"{base}/plain"]
+        importer = BatchImporter(flush_size=2, host_min_interval=0.0,
+                                 parse_executor=self.executor)
+        progress, result = self._run(importer, urls)
+
+        self.assertEqual(len(result.created_ids), 3)
+        self.assertEqual({url for url, _ in result.failures},
+                         {f"{base}/missing", f"{base}/plain"})
+        self.assertEqual(sum(1 for p in progress if p.error), 2)
+
+        with db_connection() as conn:
+            rows = conn.execute(
+                f"SELECT title, category_id, preparation_time FROM recipes WHERE id IN ({','.join('?' * 3)})",
+                result.created_ids).fetchall()
+            ingredients = conn.execute(
+                "SELECT COUNT(*) FROM recipe_ingredients WHERE recipe_id = ?",
+                (result.created_ids[0],)).fetchone()[0]
+        self.assertEqual({r[0] for r in rows}, {f"Receita salva{n}" for n in range(3)})
+        self.assertTrue(all(r[1] == self.category_id for r in rows))
+        self.assertEqual(ingredients, 1)
+
+    def test_default_process_pool_parses(self):
+        importer = BatchImporter(host_min_interval=0.0)
+        _, result = self._run(importer, [f"{self.hosts[1]}/processo"])
+        self.assertEqual(len(result.created_ids), 1, result.failures)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+from src.database.category_queries import CategoryQueries, DEFAULT_CATEGORIES
+from src.database import category_queries
+from src.database.database import db_connection
+import src.database.database as db_module
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestCategoryCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Banco de teste isolado."""
+        random_id = str(uuid.uuid4())[:8]
+        cls.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        cls.original_db = db_module.DB_NAME
+        db_module.DB_NAME = cls.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME)
+        db_module.init_database()
+
+        with db_connection() as conn:
+            cls.user_id = conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('Chef Cache', 'cache@test.com', 'h')").lastrowid
+            cls.other_id = conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('Outro', 'outro@test.com', 'h')").lastrowid
+            conn.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        db_module.close_all_pools()
+        category_queries.invalidate_category_cache()
+        db_module.DB_NAME = cls.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    def setUp(self):
+        self.db = CategoryQueries()
+        self.queries = 0
+        original = self.db._get_conn
+
+        def counting_conn():
+            self.queries += 1
+            return original()
+        self.db._get_conn = counting_conn
+        category_queries.invalidate_category_cache()
+
+    def _names(self, user_id=None):
+        return [c.name for c in self.db.get_all_categories_for_user(user_id or self.user_id)]
+
+    def test_defaults_come_from_migration(self):
+        self.assertTrue(set(DEFAULT_CATEGORIES) <= set(self._names()))
+        self.assertEqual(self.queries, 1)
+
+    def test_repeated_reads_hit_cache(self):
+        first = self.db.get_all_categories_for_user(self.user_id)
+        self.db.get_user_categories(self.user_id)
+        second = self.db.get_all_categories_for_user(self.user_id)
+        self.assertEqual(self.queries, 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first[0], second[0])  # Modelos novos a cada leitura
+
+    def test_add_invalidates_only_that_user(self):
+        self._names(self.other_id)
+        cat = self.db.add_category("Cache Nova", self.user_id)
+        self.assertIn("Cache Nova", self._names())
+
+        reads = self.queries
+        self.assertNotIn("Cache Nova", self._names(self.other_id))
+        self.assertEqual(self.queries, reads)  # Outro usuário segue em cache
+        self.assertTrue(self.db.delete_category(cat.id, self.user_id))
+
+    def test_rename_and_delete_reach_users_who_favorited(self):
+        cat = self.db.add_category("Cache Compartilhada", self.user_id)
+        self.assertTrue(self.db.toggle_favorite_cascade(cat.id, self.other_id))
+        self.assertIn("Cache Compartilhada", self._names(self.other_id))
+
+        self.assertTrue(self.db.update_category(
+            cat.id, "Cache Renomeada", self.user_id))
+        self.assertIn("Cache Renomeada", self._names())
+        self.assertIn("Cache Renomeada", self._names(self.other_id))
+
+        self.assertTrue(self.db.delete_category(cat.id, self.user_id))
+        self.assertNotIn("Cache Renomeada", self._names())
+        self.assertNotIn("Cache Renomeada", self._names(self.other_id))
+
+    def test_favorite_toggle_invalidates(self):
+        cat = self.db.get_all_categories_for_user(self.user_id)[0]
+        self.assertFalse(cat.is_favorite)
+        self.assertTrue(self.db.toggle_favorite_cascade(cat.id, self.user_id))
+        self.assertTrue(self.db.get_all_categories_for_user(
+            self.user_id)[0].is_favorite)
+        self.assertFalse(self.db.toggle_favorite_cascade(cat.id, self.user_id))
+        self.assertFalse(self.db.get_all_categories_for_user(
+            self.user_id)[0].is_favorite)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,6 +36,8 @@ class TestCategoryQueries(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Limpeza do arquivo temporário."""
+        # Fecha o pool antes de apagar o arquivo (senão -wal/-shm ficam para trás)
+        db_module.close_all_pools()
         # Restaura configuração original
         db_module.DB_NAME = cls.original_db
         db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.original_db)
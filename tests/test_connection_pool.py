@@ -0,0 +1,89 @@
+import src.database.database as db_module
+from src.core.exceptions import DatabaseError
+import unittest
+import os
+import sys
+import threading
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Banco de teste isolado."""
+        random_id = str(uuid.uuid4())[:8]
+        cls.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        cls.original_db = db_module.DB_NAME
+        db_module.DB_NAME = cls.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME)
+        db_module.init_database()
+
+    @classmethod
+    def tearDownClass(cls):
+        db_module.close_all_pools()
+        db_module.DB_NAME = cls.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    def test_connection_is_reused_with_pragmas(self):
+        with db_module.db_connection() as first:
+            self.assertEqual(first.execute(
+                "PRAGMA foreign_keys").fetchone()[0], 1)
+        with db_module.db_connection() as second:
+            self.assertIs(first, second)
+
+    def test_nested_borrow_same_thread_reuses_connection(self):
+        with db_module.db_connection() as outer:
+            with db_module.db_connection() as inner:
+                self.assertIs(outer, inner)
+
+    def test_uncommitted_transaction_is_rolled_back_on_release(self):
+        with db_module.db_connection() as conn:
+            conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('X', 'pool@test.com', 'h')")
+        with db_module.db_connection() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM users WHERE email='pool@test.com'").fetchone()
+            self.assertIsNone(row)
+
+    def test_broken_connection_is_replaced(self):
+        pool = db_module.get_pool()
+        with pool.connection() as conn:
+            pass
+        conn.close()  # Simula conexão morta no pool
+        with pool.connection() as fresh:
+            self.assertIsNot(fresh, conn)
+            self.assertEqual(fresh.execute("SELECT 1").fetchone()[0], 1)
+
+    def test_pool_is_bounded(self):
+        pool = db_module.ConnectionPool(
+            db_module.get_db_path(), max_size=1, timeout=0.1)
+        held = pool.acquire()
+        errors = []
+
+        def borrow():
+            try:
+                pool.acquire()
+            except DatabaseError as e:
+                errors.append(e)
+
+        t = threading.Thread(target=borrow)
+        t.start()
+        t.join()
+        self.assertEqual(len(errors), 1)
+
+        pool.release(held)
+        self.assertIsNotNone(pool.acquire())
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
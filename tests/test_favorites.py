@@ -0,0 +1,113 @@
+from src.models.recipe import RecipeCreate
+from src.database.recipe_queries import RecipeQueries
+from src.database.category_queries import CategoryQueries
+from src.database.database import db_connection
+import src.database.database as db_module
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestCategoryFavorites(unittest.TestCase):
+
+    def setUp(self):
+        """Banco novo e isolado para cada teste."""
+        random_id = str(uuid.uuid4())[:8]
+        self.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        self.original_db = db_module.DB_NAME
+        db_module.DB_NAME = self.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, self.TEST_DB_NAME)
+        db_module.init_database()
+
+        with db_connection() as conn:
+            self.owner_id = conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('Dono', 'dono@test.com', 'h')").lastrowid
+            self.user_id = conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('Fã', 'fa@test.com', 'h')").lastrowid
+            self.cat_id = conn.execute(
+                "INSERT INTO categories (name, user_id) VALUES ('Favoritas Teste', NULL)").lastrowid
+            self.other_cat = conn.execute(
+                "INSERT INTO categories (name, user_id) VALUES ('Outras Teste', NULL)").lastrowid
+            conn.commit()
+
+        self.recipes = RecipeQueries()
+        self.categories = CategoryQueries()
+        self.in_cat = [self._create(f"Receita {n}", self.cat_id) for n in range(3)]
+        self.outside = self._create("Receita Fora", self.other_cat)
+
+    def tearDown(self):
+        db_module.close_all_pools()
+        db_module.DB_NAME = self.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, self.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, self.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    def _create(self, title, category_id):
+        created, _ = self.recipes.create_recipes_bulk(
+            [RecipeCreate(category_id=category_id, title=title, instructions="x")], self.owner_id)
+        return created[0]
+
+    def _favorites(self):
+        return {r['id'] for r in self.recipes.search_advanced(self.user_id) if r['is_favorite']}
+
+    def _row_count(self, table):
+        with db_connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_category_favorite_is_resolved_on_read(self):
+        self.assertTrue(self.categories.toggle_favorite_cascade(
+            self.cat_id, self.user_id))
+        self.assertEqual(self._favorites(), set(self.in_cat))
+        self.assertEqual(self._row_count("favorite_recipes"), 0)
+
+        # Receitas novas da categoria herdam o favorito
+        late = self._create("Receita Nova", self.cat_id)
+        self.assertIn(late, self._favorites())
+
+        # Favoritos aparecem em "Minhas Receitas" do usuário
+        mine = {r['id'] for r in self.recipes.get_user_recipes(self.user_id)}
+        self.assertEqual(mine, set(self.in_cat) | {late})
+        self.assertEqual(self.recipes.count_user_recipes(self.user_id), 4)
+
+    def test_recipe_can_be_unfavorited_inside_favorite_category(self):
+        self.categories.toggle_favorite_cascade(self.cat_id, self.user_id)
+        self.assertFalse(self.recipes.toggle_favorite(
+            self.in_cat[0], self.user_id))
+        self.assertEqual(self._favorites(), set(self.in_cat[1:]))
+
+        self.assertTrue(self.recipes.toggle_favorite(
+            self.in_cat[0], self.user_id))
+        self.assertEqual(self._favorites(), set(self.in_cat))
+        self.assertEqual(self._row_count("favorite_recipe_exclusions"), 0)
+
+    def test_unfavorite_category_clears_its_recipes_only(self):
+        self.recipes.toggle_favorite(self.in_cat[0], self.user_id)
+        self.recipes.toggle_favorite(self.outside, self.user_id)
+        self.categories.toggle_favorite_cascade(self.cat_id, self.user_id)
+        self.recipes.toggle_favorite(self.in_cat[1], self.user_id)
+
+        self.assertFalse(self.categories.toggle_favorite_cascade(
+            self.cat_id, self.user_id))
+        self.assertEqual(self._favorites(), {self.outside})
+        self.assertEqual(self._row_count("favorite_recipe_exclusions"), 0)
+
+        # Favoritar de novo marca todas, inclusive as desmarcadas antes
+        self.categories.toggle_favorite_cascade(self.cat_id, self.user_id)
+        self.assertEqual(self._favorites(), set(self.in_cat) | {self.outside})
+
+    def test_category_favorite_is_per_user(self):
+        self.categories.toggle_favorite_cascade(self.cat_id, self.user_id)
+        owner_favs = [r for r in self.recipes.search_advanced(self.owner_id)
+                      if r['is_favorite']]
+        self.assertEqual(owner_favs, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
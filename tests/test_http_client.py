@@ -0,0 +1,160 @@
+from src.services.http_client import HttpCache, HttpClient
+from src.services import http_client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import shutil
+import tempfile
+import threading
+import unittest
+import os
+import sys
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+RECIPE_PAGE = """<html><head><script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "Recipe", "name": "Bolo de Fubá",
+ "recipeIngredient": ["2 xícaras de fubá"], "recipeInstructions": "Asse."}
+</script></head><body>Receita</body></html>"""
+
+# Rota -> cabeçalhos de cache
+ROUTES = {
+    "/fresh": {"Cache-Control": "max-age=3600"},
+    "/etag": {"ETag": '"v1"', "Cache-Control": "no-cache"},
+    "/modified": {"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    "/nostore": {"Cache-Control": "no-store", "ETag": '"x"'},
+    "/recipe": {"ETag": '"r1"'},
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        server.log.append((self.path, dict(self.headers), self.client_address[1]))
+        path = self.path.split("?")[0]
+        headers = ROUTES.get(path, {})
+        if path.startswith("/big"):
+            headers = {"Cache-Control": "max-age=3600"}
+
+        if (self.headers.get("If-None-Match") and self.headers["If-None-Match"] == headers.get("ETag")) or \
+                (self.headers.get("If-Modified-Since") and self.headers["If-Modified-Since"] == headers.get("Last-Modified")):
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = (RECIPE_PAGE if path == "/recipe" else f"corpo {path}").encode("utf-8")
+        if path.startswith("/big"):
+            body = b"x" * 400
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        cls.server.log = []
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.log.clear()
+        self.cache_dir = tempfile.mkdtemp(prefix="http_cache_test_")
+        self.client = HttpClient(HttpCache(self.cache_dir, max_bytes=1024 * 1024))
+
+    def tearDown(self):
+        self.client.close()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _hits(self, path):
+        return [entry for entry in self.server.log if entry[0] == path]
+
+    def test_fresh_response_is_served_without_request(self):
+        first = self.client.fetch(self.base + "/fresh")
+        second = self.client.fetch(self.base + "/fresh")
+        self.assertEqual(second.text, "corpo /fresh")
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(len(self._hits("/fresh")), 1)
+
+    def test_etag_revalidation_uses_conditional_get(self):
+        self.client.fetch(self.base + "/etag")
+        second = self.client.fetch(self.base + "/etag")
+        self.assertTrue(second.revalidated)
+        self.assertEqual(second.text, "corpo /etag")
+        self.assertEqual(self._hits("/etag")[1][1].get("If-None-Match"), '"v1"')
+
+    def test_last_modified_revalidation(self):
+        self.client.fetch(self.base + "/modified")
+        second = self.client.fetch(self.base + "/modified")
+        self.assertTrue(second.revalidated)
+        self.assertIn("If-Modified-Since", self._hits("/modified")[1][1])
+
+    def test_no_store_is_never_cached(self):
+        self.client.fetch(self.base + "/nostore")
+        second = self.client.fetch(self.base + "/nostore")
+        self.assertFalse(second.from_cache)
+        self.assertNotIn("If-None-Match", self._hits("/nostore")[1][1])
+
+    def test_cache_survives_new_client_instance(self):
+        self.client.fetch(self.base + "/fresh")
+        other = HttpClient(HttpCache(self.cache_dir, max_bytes=1024 * 1024))
+        self.assertTrue(other.fetch(self.base + "/fresh").from_cache)
+        other.close()
+        self.assertEqual(len(self._hits("/fresh")), 1)
+
+    def test_lru_eviction_bounds_disk_usage(self):
+        cache = HttpCache(self.cache_dir, max_bytes=2000)
+        client = HttpClient(cache)
+        for n in range(3):
+            client.fetch(f"{self.base}/big{n}")
+        client.fetch(f"{self.base}/big0")  # Uso recente protege big0
+        for n in range(3, 5):
+            client.fetch(f"{self.base}/big{n}")
+
+        self.assertLessEqual(cache.total_bytes, 2000)
+        self.assertTrue(client.fetch(f"{self.base}/big0").from_cache)
+        self.assertFalse(client.fetch(f"{self.base}/big1").from_cache)
+        client.close()
+
+    def test_connections_are_reused(self):
+        for path in ("/fresh", "/etag", "/nostore"):
+            self.client.fetch(self.base + path)
+        ports = {entry[2] for entry in self.server.log}
+        self.assertEqual(len(ports), 1)
+
+    def test_scraper_reimport_is_revalidated(self):
+        from src.services.scraper_service import RecipeScraper
+        original = http_client._client
+        http_client._client = self.client
+        try:
+            for _ in range(2):
+                error, data = RecipeScraper.fetch_recipe(self.base + "/recipe")
+                self.assertIsNone(error)
+                self.assertEqual(data["title"], "Bolo de Fubá")
+        finally:
+            http_client._client = original
+        hits = self._hits("/recipe")
+        self.assertEqual(len(hits), 2)
+        self.assertEqual(hits[1][1].get("If-None-Match"), '"r1"')
+
+
+if __name__ == '__main__':
+    unittest.main()
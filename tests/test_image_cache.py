@@ -0,0 +1,151 @@
+from src.services import image_cache
+from src.services.image_cache import DiskLru, ImageCache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import os
+import sys
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+RESPONSE_DELAY = 0.05
+
+
+def _photo_bytes():
+    """JPEG 600x400 real se houver Pillow; senão, bytes quaisquer (cache guarda o original)."""
+    if not image_cache.HAS_PIL:
+        return b"\xff\xd8\xff" + b"foto" * 5000
+    from PIL import Image
+    out = io.BytesIO()
+    Image.new("RGB", (600, 400), (200, 120, 40)).save(out, "JPEG")
+    return out.getvalue()
+
+
+PHOTO = _photo_bytes()
+
+
+class _ImageHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(self.path)
+        time.sleep(RESPONSE_DELAY)
+        if self.path.startswith("/missing"):
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(PHOTO)))
+        self.end_headers()
+        self.wfile.write(PHOTO)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDiskLru(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="lru_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def test_least_recently_used_is_evicted(self):
+        lru = DiskLru(self.workdir, max_bytes=250)
+        lru.put("a", b"a" * 100)
+        lru.put("b", b"b" * 100)
+        self.assertEqual(lru.get("a"), b"a" * 100)  # "a" passa a ser o mais recente
+        lru.put("c", b"c" * 100)
+
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.total_bytes, 200)
+        # Índice reconstruído do disco em outra instância
+        self.assertEqual(DiskLru(self.workdir, max_bytes=250).get("c"), b"c" * 100)
+        lru.put("grande", b"x" * 300)  # Maior que o limite: não é guardado
+        self.assertIsNone(lru.get("grande"))
+
+
+class TestImageCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ImageHandler)
+        cls.server.lock = threading.Lock()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests = []
+        self.workdir = tempfile.mkdtemp(prefix="image_cache_test_")
+        self.caches = []
+
+    def tearDown(self):
+        for cache in self.caches:
+            cache.close()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _cache(self, **kwargs):
+        cache = ImageCache(self.workdir, **kwargs)
+        self.caches.append(cache)
+        return cache
+
+    def test_downloads_once_and_serves_from_disk(self):
+        url = f"{self.base_url}/bolo.jpg"
+        cache = self._cache()
+        self.assertIsNone(cache.cached(url, "grid"))
+        first = cache.get(url, "grid")
+        self.assertIsNotNone(first)
+
+        # Outra instância (nova sessão do app): disco, sem rede, inclusive outro tamanho
+        again = self._cache()
+        self.assertEqual(again.cached(url, "grid"), first)
+        self.assertIsNotNone(again.get(url, "list"))
+        self.assertEqual(self.server.requests, ["/bolo.jpg"])
+
+    def test_concurrent_requests_share_one_download(self):
+        cache = self._cache()
+        url = f"{self.base_url}/pudim.jpg"
+        futures = [cache.load(url, "grid") for _ in range(8)]
+        results = {f.result(timeout=5) for f in futures}
+        self.assertEqual(len(results), 1)
+        self.assertEqual(self.server.requests, ["/pudim.jpg"])
+
+        received = threading.Event()
+        cache.load_into(url, "grid", lambda data: received.set() if data else None)
+        self.assertTrue(received.wait(5))
+
+    def test_failed_download_is_not_cached(self):
+        cache = self._cache()
+        url = f"{self.base_url}/missing.jpg"
+        self.assertIsNone(cache.get(url, "hero"))
+        self.assertIsNone(cache.get(url, "hero"))
+        self.assertEqual(len(self.server.requests), 2)
+
+    @unittest.skipUnless(image_cache.HAS_PIL, "Pillow não instalado")
+    def test_thumbnails_per_variant(self):
+        from PIL import Image
+        cache = self._cache()
+        url = f"{self.base_url}/frango.jpg"
+        for variant, short_side in (("list", 60), ("grid", 220), ("hero", 250)):
+            with self.subTest(variant):
+                with Image.open(io.BytesIO(cache.get(url, variant))) as thumb:
+                    self.assertEqual(min(thumb.size), short_side)
+                    self.assertEqual(thumb.size[0] * 400, thumb.size[1] * 600)
+        self.assertLess(len(cache.cached(url, "list")), len(PHOTO))
+        self.assertEqual(len(self.server.requests), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+from src.utils.ingredient_parser import (normalize_ingredients, normalize_unit, parse_ingredient, parse_ingredients,
+                                         split_spoken_list)
+from src.services.scraper_service import RecipeScraper
+import unittest
+import os
+import sys
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestIngredientParser(unittest.TestCase):
+
+    def _check(self, cases):
+        for line, expected in cases:
+            with self.subTest(line):
+                self.assertEqual(tuple(parse_ingredient(line))[:3], expected)
+
+    def test_portuguese_lines(self):
+        self._check([
+            ("1 1/2 xícara (chá) de farinha de trigo", ("farinha de trigo", "1 1/2", "xícara")),
+            ("2 a 3 colheres (sopa) de manteiga", ("manteiga", "2-3", "colher de sopa")),
+            ("3 colheres sopa de azeite", ("azeite", "3", "colher de sopa")),
+            ("1 colher de chá de sal", ("sal", "1", "colher de chá")),
+            ("meia xícara de óleo", ("óleo", "1/2", "xícara")),
+            ("uma pitada de sal", ("sal", "1", "pitada")),
+            ("1,5 kg de carne", ("carne", "1.5", "kg")),
+            ("1kg de batata", ("batata", "1", "kg")),
+            ("2 litros de água", ("água", "2", "l")),
+            ("200 g (1 xícara) de farinha", ("farinha", "200", "g")),
+            ("2-3 dentes de alho", ("alho", "2-3", "dente")),
+            ("3 gemas", ("gemas", "3", "")),
+            ("- 4 limões", ("limões", "4", "")),
+        ])
+
+    def test_english_lines(self):
+        self._check([
+            ("1 1/2 cups all-purpose flour", ("all-purpose flour", "1 1/2", "xícara")),
+            ("2 tbsp olive oil", ("olive oil", "2", "colher de sopa")),
+            ("1 tsp salt", ("salt", "1", "colher de chá")),
+            ("1 (14 oz) can diced tomatoes", ("diced tomatoes", "1", "lata")),
+            ("salt to taste", ("salt", "a gosto", "")),
+        ])
+
+    def test_unicode_fractions(self):
+        self._check([
+            ("½ xícara de leite", ("leite", "1/2", "xícara")),
+            ("1½ cup sugar", ("sugar", "1 1/2", "xícara")),
+            ("1 e 1/2 xícara de açúcar", ("açúcar", "1 1/2", "xícara")),
+            ("1 e meia xícara de farinha", ("farinha", "1 1/2", "xícara")),
+            ("2 e meio quilos de batata", ("batata", "2 1/2", "kg")),
+        ])
+        self.assertEqual(parse_ingredient("1 e meia xícara de farinha").amount, 1.5)
+        parsed = parse_ingredient("1½ xícara de leite")
+        self.assertEqual(parsed.amount, 1.5)
+        self.assertIsNone(parsed.amount_max)
+        self.assertEqual(parse_ingredient("2 a 3 ovos").amount_max, 3.0)
+
+    def test_to_taste_and_plain_names(self):
+        self._check([
+            ("Sal a gosto", ("Sal", "a gosto", "")),
+            ("Sal e pimenta-do-reino a gosto", ("Sal e pimenta-do-reino", "a gosto", "")),
+            ("azeite q.b.", ("azeite", "a gosto", "")),
+            ("Fios de ovos", ("Fios de ovos", "", "")),
+            ("Noz-moscada (opcional)", ("Noz-moscada (opcional)", "", "")),
+            ("Kebab", ("Kebab", "", "")),
+        ])
+
+    def test_batch_matches_single_line(self):
+        lines = ["2 ovos", "1 xícara de leite", "2 ovos", "Sal a gosto"] * 500
+        parsed = parse_ingredients(lines)
+        self.assertEqual(len(parsed), 2000)
+        self.assertEqual(parsed[2], parse_ingredient("2 ovos"))
+
+    def test_normalize_ingredients_mixed_sources(self):
+        result = normalize_ingredients([
+            "2 xícaras de farinha",
+            {"name": "Sal", "quantity": "1", "unit": "a gosto"},
+            {"name": "Açúcar", "quantity": "3", "unit": "colheres sopa"},
+            {"name": "Óleo", "quantity": "2", "unit": "Litros"},
+            {"name": "Canela", "quantity": "1", "unit": "colher chá rasa"},
+            {"name": "1 lata de milho", "quantity": "", "unit": ""},
+        ])
+        self.assertEqual(result, [
+            {"name": "farinha", "quantity": "2", "unit": "xícara"},
+            {"name": "Sal", "quantity": "a gosto", "unit": ""},
+            {"name": "Açúcar", "quantity": "3", "unit": "colher de sopa"},
+            {"name": "Óleo", "quantity": "2", "unit": "l"},
+            {"name": "Canela", "quantity": "1", "unit": "colher chá rasa"},
+            {"name": "milho", "quantity": "1", "unit": "lata"},
+        ])
+        self.assertEqual(normalize_unit("Xícaras"), "xícara")
+
+    def test_split_spoken_list(self):
+        cases = [
+            ("duas xícaras de farinha e três ovos, sal e pimenta a gosto",
+             ["duas xícaras de farinha", "três ovos", "sal e pimenta a gosto"]),
+            ("1 e 1/2 xícara de leite e 2 ovos", ["1 e 1/2 xícara de leite", "2 ovos"]),
+            ("uma xícara e meia de açúcar próximo fermento", ["uma xícara e meia de açúcar", "fermento"]),
+            ("arroz e feijão.", ["arroz e feijão"]),
+        ]
+        for text, expected in cases:
+            with self.subTest(text):
+                self.assertEqual(split_spoken_list(text), expected)
+        self.assertEqual(tuple(parse_ingredient("três ovos"))[:3], ("ovos", "3", ""))
+
+    def test_scraper_splits_ingredients(self):
+        data = RecipeScraper._parse_schema({
+            "name": "Panqueca", "recipeIngredient": ["1 xícara de leite", "2 ovos"],
+            "recipeInstructions": "Misture.",
+        }, "https://x.com")
+        self.assertEqual(data["ingredients"][0], {"name": "leite", "quantity": "1", "unit": "xícara"})
+        self.assertEqual(data["ingredients"][1], {"name": "ovos", "quantity": "2", "unit": ""})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+from src.services import jsonld_extractor
+from src.services.jsonld_extractor import extract_recipe, extract_recipe_soup, iter_jsonld_blocks
+from src.services.scraper_service import RecipeScraper
+from unittest import mock
+import json
+import unittest
+import os
+import sys
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+RECIPE = {"@type": "Recipe", "name": "Pão de Queijo", "totalTime": "PT1H10M",
+          "recipeIngredient": ["500 g de polvilho"], "recipeInstructions": "Asse."}
+ORG = {"@type": "Organization", "name": "Portal"}
+
+
+def _page(*blocks, head="", body="<p>conteúdo</p>"):
+    return f"<html><head>{head}{''.join(blocks)}</head><body>{body}</body></html>"
+
+
+def _ld(data, attrs='type="application/ld+json"'):
+    return f"<script {attrs}>{json.dumps(data, ensure_ascii=False)}</script>"
+
+
+PAGES = {
+    "simples": _page(_ld(RECIPE)),
+    "grafo": _page(_ld({"@context": "https://schema.org", "@graph": [ORG, RECIPE]})),
+    "lista": _page(_ld([ORG, RECIPE])),
+    "segundo_bloco": _page(_ld(ORG), _ld(RECIPE)),
+    "bloco_invalido_antes": _page("<script type='application/ld+json'>{quebrado</script>", _ld(RECIPE)),
+    "atributos": _page(_ld(RECIPE, attrs='class="yoast-schema-graph" TYPE = "application/ld+json" nonce="x"')),
+    "maiusculas": _page(f"<SCRIPT type=application/ld+json>{json.dumps(RECIPE)}</SCRIPT >"),
+    "tipo_lista": _page(_ld(dict(RECIPE, **{"@type": ["Recipe", "NewsArticle"]}))),
+    "outros_scripts": _page(_ld(RECIPE), head='<script>var x = "<script>";</script>'),
+    "sem_receita": _page(_ld(ORG)),
+    "sem_jsonld": _page(),
+}
+
+
+class TestJsonLdExtractor(unittest.TestCase):
+
+    def test_matches_soup_reference(self):
+        for name, page in PAGES.items():
+            with self.subTest(name):
+                self.assertEqual(extract_recipe(page), extract_recipe_soup(page))
+
+    def test_bytes_documents(self):
+        page = PAGES["grafo"]
+        self.assertEqual(extract_recipe(page.encode("utf-8")), RECIPE)
+        self.assertEqual(extract_recipe(page.encode("latin-1"), "latin-1"), RECIPE)
+
+    def test_legacy_wrappers_are_stripped(self):
+        for wrapped in (f"<!-- {json.dumps(RECIPE)} -->",
+                        f"//<![CDATA[\n{json.dumps(RECIPE)}\n//]]>"):
+            page = _page(f'<script type="application/ld+json">{wrapped}</script>')
+            self.assertEqual(extract_recipe(page), RECIPE)
+
+    def test_stops_at_first_recipe(self):
+        page = _page(_ld(RECIPE), _ld(ORG), _ld(ORG))
+        with mock.patch.object(jsonld_extractor, "_load_block",
+                               wraps=jsonld_extractor._load_block) as load:
+            extract_recipe(page)
+        self.assertEqual(load.call_count, 1)
+
+    def test_soup_only_when_scan_finds_nothing_usable(self):
+        with mock.patch.object(jsonld_extractor, "extract_recipe_soup") as soup:
+            extract_recipe(PAGES["sem_jsonld"])
+            extract_recipe(PAGES["sem_receita"])
+            soup.assert_not_called()
+            extract_recipe(_page('<script type="application/ld+json"></script>'))
+            soup.assert_called_once()
+
+    def test_iter_blocks_ignores_unclosed_script(self):
+        self.assertEqual(list(iter_jsonld_blocks('<script type="application/ld+json">{}')), [])
+
+    def test_scraper_parse_html_uses_shared_extractor(self):
+        error, data = RecipeScraper.parse_html(PAGES["grafo"].encode("utf-8"), "https://x.com/p")
+        self.assertIsNone(error)
+        self.assertEqual(data["title"], "Pão de Queijo")
+        self.assertEqual(data["preparation_time"], "70")
+
+        error, data = RecipeScraper.parse_html(PAGES["sem_receita"], "https://x.com/p")
+        self.assertIsNone(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+from src.database import migrations
+from src.database.database import db_connection
+import src.database.database as db_module
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestMigrations(unittest.TestCase):
+
+    def setUp(self):
+        """Banco novo e isolado para cada teste."""
+        random_id = str(uuid.uuid4())[:8]
+        self.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        self.original_db = db_module.DB_NAME
+        db_module.DB_NAME = self.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, self.TEST_DB_NAME)
+        db_module.get_db_path()
+
+    def tearDown(self):
+        db_module.close_all_pools()
+        db_module.DB_NAME = self.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, self.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, self.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    def _index_names(self, conn):
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index'").fetchall()
+        return {r[0] for r in rows}
+
+    def test_fresh_database_reaches_latest_version(self):
+        db_module.init_database()
+        with db_connection() as conn:
+            self.assertEqual(migrations.get_schema_version(conn),
+                             migrations.SCHEMA_VERSION)
+            self.assertTrue(set(migrations.SECONDARY_INDEXES)
+                            <= self._index_names(conn))
+
+    def test_up_to_date_database_is_skipped(self):
+        db_module.init_database()
+        with db_connection() as conn:
+            self.assertEqual(migrations.apply_migrations(conn), 0)
+
+    def test_legacy_database_is_upgraded(self):
+        """Banco criado antes das migrações (user_version = 0) com dados."""
+        with db_connection() as conn:
+            migrations._create_base_tables(conn.cursor())
+            conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('A', 'a@a.com', 'h')")
+            conn.execute(
+                "INSERT INTO recipes (user_id, title, instructions) VALUES (1, 'Feijão Tropeiro', 'x')")
+            conn.commit()
+
+        db_module.init_database()
+        with db_connection() as conn:
+            self.assertEqual(migrations.get_schema_version(conn),
+                             migrations.SCHEMA_VERSION)
+            hit = conn.execute(
+                "SELECT rowid FROM recipes_fts WHERE recipes_fts MATCH 'feijao'").fetchone()
+            self.assertIsNotNone(hit)
+
+    def test_failed_migration_is_rolled_back(self):
+        def broken(cursor):
+            cursor.execute("CREATE TABLE half_done (id INTEGER)")
+            raise RuntimeError("falha simulada")
+
+        steps = migrations.MIGRATIONS + \
+            [(migrations.SCHEMA_VERSION + 1, "Quebrada", broken)]
+        with db_connection() as conn:
+            with self.assertRaises(RuntimeError):
+                migrations.apply_migrations(conn, steps)
+            self.assertEqual(migrations.get_schema_version(conn),
+                             migrations.SCHEMA_VERSION)
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name='half_done'").fetchone()
+            self.assertIsNone(row)
+
+    def test_cascaded_category_favorites_are_compacted(self):
+        """Favoritos gravados pela cascata antiga viram herança + exclusões."""
+        with db_connection() as conn:
+            migrations.apply_migrations(conn, migrations.MIGRATIONS[:6])
+            conn.execute(
+                "INSERT INTO users (id, full_name, email, hashed_password) VALUES (1, 'A', 'a@a.com', 'h')")
+            conn.execute(
+                "INSERT INTO categories (id, name, user_id) VALUES (100, 'Cascata', NULL)")
+            conn.executemany("INSERT INTO recipes (id, user_id, category_id, title, instructions) VALUES (?, 1, 100, ?, 'x')",
+                             [(1, 'Um'), (2, 'Dois'), (3, 'Três')])
+            conn.execute(
+                "INSERT INTO favorite_categories (user_id, category_id) VALUES (1, 100)")
+            conn.executemany(
+                "INSERT INTO favorite_recipes (user_id, recipe_id) VALUES (1, ?)", [(1,), (2,)])
+            conn.commit()
+
+            migrations.apply_migrations(conn)
+            self.assertEqual(conn.execute(
+                "SELECT COUNT(*) FROM favorite_recipes").fetchone()[0], 0)
+            self.assertEqual(conn.execute(
+                "SELECT recipe_id FROM favorite_recipe_exclusions").fetchall()[0][0], 3)
+
+    def test_servings_count_is_backfilled(self):
+        with db_connection() as conn:
+            migrations.apply_migrations(conn, migrations.MIGRATIONS[:9])
+            conn.execute(
+                "INSERT INTO users (id, full_name, email, hashed_password) VALUES (1, 'A', 'a@a.com', 'h')")
+            conn.executemany("INSERT INTO recipes (id, user_id, title, servings, instructions) VALUES (?, 1, ?, ?, 'x')",
+                             [(1, 'Um', '4 pessoas'), (2, 'Dois', '6-8 porções'), (3, 'Três', 'a gosto')])
+            conn.commit()
+
+            migrations.apply_migrations(conn)
+            rows = conn.execute(
+                "SELECT id, servings_count FROM recipes ORDER BY id").fetchall()
+            self.assertEqual([tuple(r) for r in rows], [(1, 4), (2, 6), (3, None)])
+            plan = " ".join(r[3] for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM recipes WHERE preparation_time <= 30"))
+            self.assertIn("idx_recipes_prep_time", plan)
+
+    def test_ingredient_lookup_uses_index(self):
+        db_module.init_database()
+        with db_connection() as conn:
+            plan = " ".join(r[3] for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT name FROM recipe_ingredients WHERE recipe_id = 1"))
+            self.assertIn("idx_recipe_ingredients_recipe", plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+from src.services import ocr_service
+from src.services.ocr_service import (ImageOcr, OcrCache, OcrSettings, clear_span, otsu_threshold,
+                                      projection_score, target_scale, text_bounds)
+import shutil
+import tempfile
+import unittest
+import os
+import sys
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestPreprocessingMath(unittest.TestCase):
+
+    def test_target_scale(self):
+        # Foto de 12 MP (4032 x 3024) reduzida para 200 dpi numa página de 11"
+        self.assertAlmostEqual(target_scale((4032, 3024), 200), 2200 / 4032)
+        self.assertEqual(target_scale((1200, 900), 200), 1.0)  # Nunca amplia
+        self.assertEqual(target_scale((4032, 3024), None), 1.0)
+
+    def test_otsu_threshold_splits_bimodal_histogram(self):
+        histogram = [0] * 256
+        histogram[30] = 500  # Texto
+        histogram[220] = 9500  # Papel
+        threshold = otsu_threshold(histogram)
+        self.assertTrue(30 <= threshold < 220)
+        self.assertEqual(otsu_threshold([0] * 256), 128)
+
+    def test_projection_score_prefers_aligned_lines(self):
+        aligned = [0, 200, 200, 0, 0, 200, 200, 0]
+        skewed = [50, 100, 100, 50, 50, 100, 100, 50]
+        self.assertGreater(projection_score(aligned), projection_score(skewed))
+
+    def test_text_bounds(self):
+        rows = [0] * 10 + [120] * 80 + [0] * 10
+        cols = [0] * 20 + [90] * 50 + [0] * 30
+        self.assertEqual(text_bounds(rows, cols, margin=0.05), (15, 5, 75, 95))
+        self.assertIsNone(text_bounds([0] * 10, cols))
+
+    def test_clear_span_skips_dark_borders(self):
+        # Mesa escura dos dois lados da página; a página tem texto (tinta < 80%)
+        profile = [255] * 15 + [0, 60, 0, 90, 0, 0] + [250] * 5 + [0] * 2
+        self.assertEqual(clear_span(profile), (15, 21))
+        self.assertIsNone(clear_span([255] * 4))
+
+
+class TestOcrCache(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="ocr_test_")
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _recognize(self, data, settings):
+        self.calls.append((data, settings))
+        return f"  texto {len(self.calls)}\n"
+
+    def _ocr(self, settings=OcrSettings()):
+        return ImageOcr(settings, OcrCache(os.path.join(self.workdir, "cache")), self._recognize)
+
+    def _image(self, name, content):
+        path = os.path.join(self.workdir, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_same_content_is_recognized_once(self):
+        first = self._image("pagina.jpg", b"\xff\xd8 pagina 12")
+        copy = self._image("copia.jpg", b"\xff\xd8 pagina 12")
+
+        self.assertEqual(self._ocr().image_to_text(first), "texto 1")
+        # Outra instância, outro nome de arquivo, mesmo conteúdo: vem do disco
+        self.assertEqual(self._ocr().image_to_text(copy), "texto 1")
+        self.assertEqual(len(self.calls), 1)
+
+    def test_key_includes_content_and_settings(self):
+        path = self._image("pagina.jpg", b"\xff\xd8 pagina 12")
+        self._ocr().image_to_text(path)
+        self._ocr(OcrSettings(lang="eng")).image_to_text(path)
+        self._ocr().bytes_to_text(b"\xff\xd8 pagina 13")
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual(self.calls[1][1].lang, "eng")
+
+    def test_failures_are_not_cached(self):
+        def broken(data, settings):
+            raise RuntimeError("tesseract falhou")
+
+        ocr = ImageOcr(OcrSettings(), OcrCache(os.path.join(self.workdir, "cache")), broken)
+        with self.assertRaises(RuntimeError):
+            ocr.bytes_to_text(b"imagem")
+        self.assertEqual(self._ocr().bytes_to_text(b"imagem"), "texto 1")
+
+
+@unittest.skipUnless(ocr_service.HAS_PIL, "Pillow não instalado")
+class TestPreprocessImage(unittest.TestCase):
+
+    def _page(self, angle):
+        from PIL import Image, ImageDraw
+        page = Image.new("L", (2400, 3200), 235)
+        draw = ImageDraw.Draw(page)
+        for top in range(600, 2600, 90):
+            draw.rectangle((500, top, 1900, top + 30), fill=20)
+        return page.rotate(angle, fillcolor=235)
+
+    def test_downscale_binarize_and_crop(self):
+        result = ocr_service.preprocess_image(self._page(0), OcrSettings(target_dpi=100))
+        self.assertLessEqual(max(result.size), 1100)
+        self.assertEqual(set(result.tobytes()) - {0, 255}, set())
+        # Recorte descarta a margem branca em volta das "linhas de texto"
+        self.assertLess(result.width, 1100 * 2400 / 3200 * 0.8)
+
+    def test_estimate_skew(self):
+        binary = ocr_service.binarize(self._page(3))
+        self.assertAlmostEqual(ocr_service.estimate_skew(binary), -3.0, delta=0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
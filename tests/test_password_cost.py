@@ -0,0 +1,81 @@
+from src.database import auth_queries
+from src.database.database import db_connection
+from src.database.settings_queries import get_setting
+import src.database.database as db_module
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestPasswordCost(unittest.TestCase):
+
+    def setUp(self):
+        """Banco novo e isolado para cada teste; custos baixos para rapidez."""
+        random_id = str(uuid.uuid4())[:8]
+        self.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        self.original_db = db_module.DB_NAME
+        self.original_cost = auth_queries.get_bcrypt_cost()
+        db_module.DB_NAME = self.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, self.TEST_DB_NAME)
+        db_module.init_database()
+
+    def tearDown(self):
+        auth_queries.set_bcrypt_cost(self.original_cost)
+        db_module.close_all_pools()
+        db_module.DB_NAME = self.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, self.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, self.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    def _stored_hash(self, email):
+        with db_connection() as conn:
+            return conn.execute(
+                "SELECT hashed_password FROM users WHERE email = ?", (email,)).fetchone()[0]
+
+    def test_calibration_respects_bounds(self):
+        self.assertEqual(auth_queries.calibrate_bcrypt_cost(
+            target_ms=1, min_cost=4, max_cost=8), 4)
+        self.assertEqual(auth_queries.calibrate_bcrypt_cost(
+            target_ms=10 ** 9, min_cost=4, max_cost=6), 6)
+
+    def test_calibrated_cost_is_persisted(self):
+        cost = auth_queries.init_password_hashing(target_ms=1)
+        self.assertEqual(cost, auth_queries.BCRYPT_MIN_COST)
+        self.assertEqual(get_setting("bcrypt_cost"), str(cost))
+
+        # Próxima inicialização reutiliza o valor salvo sem recalibrar
+        with db_connection() as conn:
+            conn.execute(
+                "UPDATE app_settings SET value = '5' WHERE key = 'bcrypt_cost'")
+            conn.commit()
+        self.assertEqual(auth_queries.init_password_hashing(target_ms=1), 5)
+
+    def test_login_rehashes_when_cost_changes(self):
+        auth_queries.set_bcrypt_cost(4)
+        auth_queries.register_user("Rehash", "rehash@email.com", "senha123")
+        self.assertEqual(auth_queries._hash_cost(
+            self._stored_hash("rehash@email.com")), 4)
+
+        auth_queries.set_bcrypt_cost(5)
+        self.assertIsNone(auth_queries.get_user_by_email_and_password(
+            "rehash@email.com", "errada"))
+        self.assertEqual(auth_queries._hash_cost(
+            self._stored_hash("rehash@email.com")), 4)
+
+        self.assertIsNotNone(auth_queries.get_user_by_email_and_password(
+            "rehash@email.com", "senha123"))
+        self.assertEqual(auth_queries._hash_cost(
+            self._stored_hash("rehash@email.com")), 5)
+        self.assertIsNotNone(auth_queries.get_user_by_email_and_password(
+            "rehash@email.com", "senha123"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+from src.services import pdf_import_service
+from src.services.pdf_import_service import PageCache, PageText, PdfTextPipeline, split_recipes
+from src.database.database import db_connection
+import src.database.database as db_module
+from concurrent.futures import ThreadPoolExecutor
+import shutil
+import tempfile
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+PAGE_1 = """EBOOK DE RECEITAS
+Sumário
+
+SUCO VERDE DETOX
+Rendimento: 2 copos
+Tempo de preparo: 10 minutos
+Ingredientes:
+• 1 folha de couve
+• 1 limão
+• 200 ml de água
+Modo de preparo:
+Bata tudo no liquidificador.
+"""
+
+PAGE_2 = """Coe e sirva gelado.
+Bolo de Cenoura
+Ingredientes (12 porções)
+Massa:
+3 cenouras médias
+4 ovos
+Ingredientes da cobertura:
+1 xícara (chá) de chocolate em pó
+Modo de preparo: Bata a massa.
+Asse por 40 minutos.
+Curiosidades sobre a cenoura
+Texto informativo sem receita.
+"""
+
+PAGES = {1: PAGE_1, 2: PAGE_2, 3: "", 4: "A couve é rica em ferro."}
+
+
+def _fake_page_count(path):
+    return len(PAGES)
+
+
+class _CountingExtractor:
+    """Extrator de teste: devolve PAGES e registra as páginas pedidas."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, path, pages, dpi, lang):
+        self.calls.append((os.path.basename(path), list(pages)))
+        return [(n, PAGES[n], "text" if PAGES[n] else "empty") for n in pages]
+
+
+class TestSplitRecipes(unittest.TestCase):
+
+    def _pages(self):
+        return [PageText("livro.pdf", n, text, "text") for n, text in PAGES.items()]
+
+    def test_recipes_are_segmented(self):
+        records = split_recipes(self._pages(), "EBOOK DE RECEITAS")
+        self.assertEqual([r["title"] for r in records], ["Suco Verde Detox", "Bolo de Cenoura"])
+
+        suco, bolo = records
+        self.assertEqual(suco["ingredients"], ["1 folha de couve", "1 limão", "200 ml de água"])
+        self.assertEqual(suco["instructions"], "Bata tudo no liquidificador.\nCoe e sirva gelado.")
+        self.assertEqual(suco["servings"], "2 copos")
+        self.assertEqual(suco["preparation_time"], 10)
+        self.assertEqual(suco["source"], "EBOOK DE RECEITAS, p. 1")
+        self.assertEqual(suco["category"], pdf_import_service.PDF_CATEGORY)
+
+        # Subseção de ingredientes não abre outra receita; preparo vai até o fim do texto
+        self.assertIn("1 xícara (chá) de chocolate em pó", bolo["ingredients"])
+        self.assertNotIn("Ingredientes da cobertura:", bolo["ingredients"])
+        self.assertTrue(bolo["instructions"].startswith("Bata a massa.\nAsse por 40 minutos."))
+        self.assertEqual(bolo["source"], "EBOOK DE RECEITAS, p. 2")
+
+    def test_text_without_recipes(self):
+        pages = [PageText("x.pdf", 1, "SOBRE CHÁ\nO chá verde tem antioxidantes.", "text")]
+        self.assertEqual(split_recipes(pages, "SOBRE CHÁ"), [])
+
+
+class TestPdfPipeline(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        random_id = str(uuid.uuid4())[:8]
+        cls.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        cls.original_db = db_module.DB_NAME
+        db_module.DB_NAME = cls.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME)
+        db_module.init_database()
+
+    @classmethod
+    def tearDownClass(cls):
+        db_module.close_all_pools()
+        db_module.DB_NAME = cls.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="pdf_import_test_")
+        self.library = os.path.join(self.workdir, "receitas")
+        os.makedirs(self.library)
+        for name in ("a.pdf", "b.pdf"):
+            with open(os.path.join(self.library, name), "wb") as f:
+                f.write(f"%PDF-1.4 {name}".encode())
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.extractor = _CountingExtractor()
+
+    def tearDown(self):
+        self.executor.shutdown()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _pipeline(self):
+        return PdfTextPipeline(cache=PageCache(os.path.join(self.workdir, "cache")),
+                               executor=self.executor, page_count=_fake_page_count,
+                               extract=self.extractor)
+
+    def test_pages_are_split_into_tasks_and_cached(self):
+        paths = pdf_import_service.find_pdfs(self.library)
+        documents = self._pipeline().extract_library(paths)
+        self.assertEqual([p.page for p in documents[paths[0]]], [1, 2, 3, 4])
+        self.assertEqual(sum(len(pages) for _, pages in self.extractor.calls), 8)
+
+        # Segunda execução: só a página vazia (sem OCR) é tentada de novo
+        self.extractor.calls.clear()
+        documents = self._pipeline().extract_library(paths)
+        self.assertEqual(sorted(self.extractor.calls), [("a.pdf", [3]), ("b.pdf", [3])])
+        self.assertEqual(documents[paths[1]][0].method, "cache:text")
+
+        # PDF alterado (outro hash) é reprocessado por inteiro
+        with open(paths[0], "ab") as f:
+            f.write(b" editado")
+        self.extractor.calls.clear()
+        self._pipeline().extract_library(paths)
+        self.assertEqual(sum(len(pages) for name, pages in self.extractor.calls if name == "a.pdf"), 4)
+
+    def test_import_is_idempotent(self):
+        pipeline = self._pipeline()
+        found, created = pdf_import_service.import_pdf_library(self.library, pipeline)
+        self.assertEqual((found, created), (4, 4))
+
+        found, created = pdf_import_service.import_pdf_library(self.library, pipeline)
+        self.assertEqual(created, 0)
+
+        with db_connection() as conn:
+            rows = conn.execute("""
+                SELECT r.title, c.name FROM recipes r JOIN categories c ON c.id = r.category_id
+                WHERE r.source LIKE 'a, p.%' ORDER BY r.id
+            """).fetchall()
+            unit = conn.execute("""
+                SELECT i.unit FROM recipe_ingredients i JOIN recipes r ON r.id = i.recipe_id
+                WHERE r.source = 'a, p. 1' AND i.name = 'água'
+            """).fetchone()
+        self.assertEqual([tuple(r) for r in rows],
+                         [("Suco Verde Detox", "Livros de Receitas"), ("Bolo de Cenoura", "Livros de Receitas")])
+        self.assertEqual(unit[0], "ml")
+
+    @unittest.skipUnless(pdf_import_service.HAS_PDF_TEXT, "PyMuPDF/pypdf não instalados")
+    def test_real_library_text_layer(self):
+        paths = pdf_import_service.find_pdfs("receitas")
+        pipeline = PdfTextPipeline(cache=PageCache(os.path.join(self.workdir, "cache")),
+                                   executor=self.executor)
+        documents = pipeline.extract_library(paths[:1])
+        self.assertTrue(documents[paths[0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+from src.services.prefetch_service import Prefetcher
+from concurrent.futures import Future
+import threading
+import unittest
+import os
+import sys
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class _FakeImages:
+    """Registra as miniaturas pedidas; cada load() já volta concluído."""
+
+    def __init__(self):
+        self.loaded = []
+        self.lock = threading.Lock()
+
+    def load(self, url, variant):
+        with self.lock:
+            self.loaded.append((url, variant))
+        future = Future()
+        future.set_result(b"img")
+        return future
+
+
+def _results(prefix, count):
+    return [{'id': i, 'title': f"{prefix} {i}",
+             'image_path': f"https://img.test/{prefix}/{i}.jpg" if i % 2 else ""}
+            for i in range(1, count + 1)]
+
+
+class TestPrefetcher(unittest.TestCase):
+
+    def setUp(self):
+        self.images = _FakeImages()
+        self.detail_calls = []
+        self.release = threading.Event()
+        self.done = threading.Event()
+
+    def _load_details(self, ids):
+        self.detail_calls.append(ids)
+        if len(self.detail_calls) == 1:
+            self.release.wait(5)  # Primeira busca fica presa até a segunda começar
+        else:
+            self.done.set()
+        return {}
+
+    def test_first_results_are_warmed(self):
+        self.release.set()
+        prefetcher = Prefetcher(self._load_details, self.images, count=4, variants=("grid", "hero"))
+        prefetcher.prefetch(_results("bolo", 10))
+        prefetcher.wait_idle()
+
+        self.assertEqual(self.detail_calls, [[1, 2, 3, 4]])
+        self.assertEqual(self.images.loaded, [
+            ("https://img.test/bolo/1.jpg", "grid"), ("https://img.test/bolo/1.jpg", "hero"),
+            ("https://img.test/bolo/3.jpg", "grid"), ("https://img.test/bolo/3.jpg", "hero")])
+
+    def test_new_search_cancels_outstanding_work(self):
+        prefetcher = Prefetcher(self._load_details, self.images, count=4, variants=("grid",))
+        prefetcher.prefetch(_results("bolo", 10))
+        prefetcher.prefetch(_results("torta", 10))
+        prefetcher.prefetch(_results("sopa", 2))
+        self.release.set()
+        self.assertTrue(self.done.wait(5))
+        prefetcher.wait_idle()
+
+        # A primeira busca parou antes das imagens; a segunda nem começou
+        self.assertEqual(self.detail_calls, [[1, 2, 3, 4], [1, 2]])
+        self.assertEqual(self.images.loaded, [("https://img.test/sopa/1.jpg", "grid")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 from src.models.recipe import RecipeCreate, IngredientSchema
 from src.database.recipe_queries import RecipeQueries
+from src.database import recipe_queries
 from src.database.database import get_db_connection
 import src.database.database as db_module
 import unittest
@@ -43,6 +44,10 @@ class TestRecipeQueries(unittest.TestCase):
         conn.execute(
             "INSERT INTO users (full_name, email, hashed_password) VALUES ('Chef Teste', 'chef@test.com', 'hash')")
         cls.user_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        conn.execute(
+            "INSERT INTO categories (name, user_id) VALUES ('Categoria Teste', ?)", (cls.user_id,))
+        cls.category_id = conn.execute(
+            "SELECT last_insert_rowid()").fetchone()[0]
         conn.commit()
         conn.close()
 
@@ -50,6 +55,7 @@ class TestRecipeQueries(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
+        db_module.close_all_pools()
         db_module.DB_NAME = cls.original_db
         db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.original_db)
         try:
@@ -101,6 +107,204 @@ class TestRecipeQueries(unittest.TestCase):
 
         conn.close()
 
+    def _create(self, title: str, ingredients: list, category_id: int = None) -> int:
+        data = RecipeCreate(
+            category_id=category_id or self.category_id,
+            title=title,
+            instructions="Modo de preparo.",
+            ingredients=[IngredientSchema(name=n, quantity="1", unit="un")
+                         for n in ingredients]
+        )
+        self.assertTrue(self.db.create_recipe(data, self.user_id))
+        conn = get_db_connection()
+        rid = conn.execute(
+            "SELECT MAX(id) FROM recipes WHERE title = ?", (title,)).fetchone()[0]
+        conn.close()
+        return rid
+
+    def test_get_recipes_details_bulk(self):
+        """Carrega várias receitas e ingredientes em lote (com blocos pequenos)."""
+        r1 = self._create("Lote Um", ["Arroz", "Feijão"])
+        r2 = self._create("Lote Dois", [])
+        r3 = self._create("Lote Três", ["Ovo", "Leite", "Açúcar"])
+
+        original_chunk = recipe_queries.DETAILS_CHUNK_SIZE
+        recipe_queries.DETAILS_CHUNK_SIZE = 2
+        try:
+            details = self.db.get_recipes_details([r3, r1, 999999, r1, r2])
+        finally:
+            recipe_queries.DETAILS_CHUNK_SIZE = original_chunk
+
+        self.assertEqual(set(details), {r1, r2, r3})
+        self.assertEqual([i['name'] for i in details[r3]['ingredients']],
+                         ["Ovo", "Leite", "Açúcar"])
+        self.assertEqual(details[r2]['ingredients'], [])
+        self.assertEqual(details[r1]['title'], "Lote Um")
+        self.assertEqual(self.db.get_recipes_details([]), {})
+
+        single = self.db.get_recipe_details(r1)
+        self.assertEqual(single, details[r1])
+        self.assertIsNone(self.db.get_recipe_details(999999))
+
+    def test_details_cache(self):
+        """Detalhes vêm da memória até a receita ser alterada pelo RecipeQueries."""
+        rid = self._create("Cache Detalhes", ["Arroz"])
+        first = self.db.get_recipe_details(rid)
+        first['ingredients'].append({'name': 'Intruso'})  # Cópia: não contamina o cache
+
+        conn = get_db_connection()
+        conn.execute("UPDATE recipes SET title = 'Fora do App' WHERE id = ?", (rid,))
+        conn.commit()
+        conn.close()
+        cached = self.db.get_recipe_details(rid)
+        self.assertEqual(cached['title'], "Cache Detalhes")
+        self.assertEqual([i['name'] for i in cached['ingredients']], ["Arroz"])
+
+        data = RecipeCreate(category_id=self.category_id, title="Cache Editada",
+                            instructions="Novo preparo.",
+                            ingredients=[IngredientSchema(name="Feijão", quantity="1", unit="kg")])
+        self.assertTrue(self.db.update_recipe(rid, data, self.user_id))
+        updated = self.db.get_recipe_details(rid)
+        self.assertEqual(updated['title'], "Cache Editada")
+        self.assertEqual([i['name'] for i in updated['ingredients']], ["Feijão"])
+
+        self.assertTrue(self.db.delete_recipe(rid, self.user_id))
+        self.assertIsNone(self.db.get_recipe_details(rid))
+
+    def test_details_cache_follows_category_delete(self):
+        """ON DELETE SET NULL em recipes.category_id invalida os detalhes em cache."""
+        from src.database.category_queries import CategoryQueries
+        category = CategoryQueries().add_category("Categoria Efêmera", self.user_id)
+        rid = self._create("Receita Órfã", ["Sal"], category_id=category.id)
+        self.assertEqual(self.db.get_recipe_details(rid)['category_id'], category.id)
+
+        self.assertTrue(CategoryQueries().delete_category(category.id, self.user_id))
+        self.assertIsNone(self.db.get_recipe_details(rid)['category_id'])
+
+    def _ingredient_rows(self, rid: int) -> list:
+        conn = get_db_connection()
+        rows = conn.execute(
+            "SELECT id, name, quantity FROM recipe_ingredients WHERE recipe_id = ? ORDER BY id", (rid,)).fetchall()
+        conn.close()
+        return [tuple(r) for r in rows]
+
+    def _update(self, rid: int, title: str, ingredients: list) -> bool:
+        data = RecipeCreate(
+            category_id=self.category_id,
+            title=title,
+            instructions="Modo de preparo.",
+            ingredients=[IngredientSchema(name=n, quantity=q, unit="un")
+                         for n, q in ingredients]
+        )
+        return self.db.update_recipe(rid, data, self.user_id)
+
+    def test_update_recipe_applies_ingredient_diff(self):
+        """Ids de ingredientes permanecem estáveis; só a diferença é gravada."""
+        rid = self._create("Diff Base", ["Arroz", "Feijão", "Sal"])
+        original = self._ingredient_rows(rid)
+
+        # 1. Apenas o título muda: nenhum ingrediente é reescrito
+        self.assertTrue(self._update(
+            rid, "Diff Renomeada", [("Arroz", "1"), ("Feijão", "1"), ("Sal", "1")]))
+        self.assertEqual(self._ingredient_rows(rid), original)
+
+        # 2. Uma quantidade muda: UPDATE no mesmo id
+        self.assertTrue(self._update(
+            rid, "Diff Renomeada", [("Arroz", "1"), ("Feijão", "2"), ("Sal", "1")]))
+        rows = self._ingredient_rows(rid)
+        self.assertEqual([r[0] for r in rows], [r[0] for r in original])
+        self.assertEqual(rows[1][2], "2")
+
+        # 3. Acréscimo no final preserva os ids existentes
+        self.assertTrue(self._update(rid, "Diff Renomeada", [
+            ("Arroz", "1"), ("Feijão", "2"), ("Sal", "1"), ("Louro", "1")]))
+        rows = self._ingredient_rows(rid)
+        self.assertEqual([r[0] for r in rows[:3]], [r[0] for r in original])
+        self.assertEqual(rows[3][1], "Louro")
+
+        # 4. Remoção apaga apenas as sobras
+        self.assertTrue(self._update(rid, "Diff Renomeada", [("Arroz", "1")]))
+        self.assertEqual(self._ingredient_rows(rid), [original[0]])
+
+    def test_ingredient_diff_matches_rows_by_content(self):
+        """Remover/alterar uma linha no início não reescreve as seguintes."""
+        names = ["Farinha", "Ovos", "Leite", "Açúcar", "Fermento"]
+        rid = self._create("Diff Conteúdo", names)
+        original = self._ingredient_rows(rid)
+
+        def sync(items):
+            conn = get_db_connection()
+            try:
+                counts = self.db._sync_ingredients(conn.cursor(), rid, [
+                    IngredientSchema(name=n, quantity=q, unit="un") for n, q in items])
+                conn.commit()
+                return counts
+            finally:
+                conn.close()
+
+        # 1. Remove o primeiro: 0 updates, 1 delete, ids restantes intactos
+        self.assertEqual(sync([(n, "1") for n in names[1:]]), (0, 0, 1))
+        self.assertEqual(self._ingredient_rows(rid), original[1:])
+
+        # 2. Troca no meio: um único UPDATE no mesmo id
+        self.assertEqual(sync([("Ovos", "1"), ("Leite", "2"), ("Açúcar", "1"), ("Fermento", "1")]),
+                         (0, 1, 0))
+        self.assertEqual([r[0] for r in self._ingredient_rows(rid)], [r[0] for r in original[1:]])
+
+        # 3. Acréscimo antes de linhas mantidas preserva a ordem de exibição
+        sync([("Sal", "1"), ("Ovos", "1"), ("Leite", "2"), ("Açúcar", "1"), ("Fermento", "1")])
+        self.assertEqual([r[1] for r in self._ingredient_rows(rid)],
+                         ["Sal", "Ovos", "Leite", "Açúcar", "Fermento"])
+
+    def test_create_recipes_bulk_reports_item_failures(self):
+        """Lote parcial: itens inválidos são reportados sem desfazer os demais."""
+        def items():
+            for n in range(5):
+                yield {
+                    "category_id": self.category_id,
+                    "title": f"Bulk {n}",
+                    "instructions": "Misture.",
+                    "ingredients": [{"name": "Farinha", "quantity": str(n), "unit": "g"}],
+                }
+            yield {"category_id": self.category_id, "instructions": "Sem título"}
+            yield {"category_id": 999999, "title": "Bulk Categoria Inexistente",
+                   "instructions": "FK inválida."}
+            yield RecipeCreate(category_id=self.category_id, title="Bulk Final",
+                               instructions="Fim.")
+
+        created, failures = self.db.create_recipes_bulk(
+            items(), self.user_id, chunk_size=3)
+
+        self.assertEqual(len(created), 6)
+        self.assertEqual([index for index, _ in failures], [5, 6])
+        self.assertEqual(len(set(created)), 6)
+
+        details = self.db.get_recipes_details(created)
+        self.assertEqual(details[created[2]]['title'], "Bulk 2")
+        self.assertEqual(details[created[2]]['ingredients'][0]['quantity'], "2")
+        self.assertEqual(details[created[-1]]['title'], "Bulk Final")
+
+        # Índice de busca reconstruído por bloco; a pausa não vaza para fora da transação
+        found = self.db.search_advanced(self.user_id, term="bulk")
+        self.assertEqual({r['id'] for r in found}, set(created))
+        with db_module.db_connection() as conn:
+            self.assertIsNone(conn.execute(
+                "SELECT 1 FROM search_index_pause").fetchone())
+
+        # Ids reservados continuam compatíveis com o AUTOINCREMENT
+        rid = self._create("Depois do Lote", [])
+        self.assertGreater(rid, max(created))
+
+    def test_create_recipes_bulk_parses_raw_ingredient_lines(self):
+        created, failures = self.db.create_recipes_bulk([{
+            "category_id": self.category_id, "title": "Linhas Cruas", "instructions": "Asse.",
+            "ingredients": ["2 xícaras (chá) de farinha", {"name": "Sal", "quantity": "1", "unit": "a gosto"}],
+        }], self.user_id)
+        self.assertEqual(failures, [])
+        ingredients = self.db.get_recipe_details(created[0])['ingredients']
+        self.assertEqual([(i['name'], i['quantity'], i['unit']) for i in ingredients],
+                         [("farinha", "2", "xícara"), ("Sal", "a gosto", "")])
+
 
 if __name__ == '__main__':
     unittest.main()
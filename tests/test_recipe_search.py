@@ -0,0 +1,271 @@
+from src.core.exceptions import ValidationError
+from src.models.recipe import RecipeCreate, IngredientSchema
+from src.database.recipe_queries import RecipeQueries
+from src.database.category_queries import CategoryQueries
+from src.database.database import db_connection
+import src.database.database as db_module
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestRecipeSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Banco de teste isolado com um pequeno catálogo."""
+        random_id = str(uuid.uuid4())[:8]
+        cls.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        cls.original_db = db_module.DB_NAME
+        db_module.DB_NAME = cls.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME)
+        db_module.init_database()
+
+        with db_connection() as conn:
+            cur = conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('Chef Busca', 'busca@test.com', 'hash')")
+            cls.user_id = cur.lastrowid
+            cur = conn.execute(
+                "INSERT INTO categories (name, user_id) VALUES ('Testes Busca', ?)", (cls.user_id,))
+            cls.category_id = cur.lastrowid
+            conn.commit()
+
+        cls.db = RecipeQueries()
+        cls._create("Bolo de Cenoura", "Bata tudo e asse.",
+                    ["Cenoura", "Farinha de trigo"], time=50)
+        cls._create("Torta Salgada", "Misture e leve ao forno com bolo de massa.",
+                    ["Frango", "Farinha de trigo"], time=40, servings="8 fatias")
+        cls._create("Suco Verde", "Bata no liquidificador.",
+                    ["Couve", "Limão"], time=5, servings="18 copos")
+        cls._create("Pão Caseiro", "Sove a massa e deixe crescer.",
+                    ["Açúcar", "Fermento"], time=90)
+
+    @classmethod
+    def tearDownClass(cls):
+        db_module.close_all_pools()
+        db_module.DB_NAME = cls.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    @classmethod
+    def _create(cls, title, instructions, ingredients, time=10, servings=None):
+        data = RecipeCreate(
+            category_id=cls.category_id,
+            title=title,
+            preparation_time=time,
+            servings=servings,
+            instructions=instructions,
+            ingredients=[IngredientSchema(name=n, quantity="1", unit="un")
+                         for n in ingredients]
+        )
+        assert cls.db.create_recipe(data, cls.user_id)
+
+    def _titles(self, **kwargs):
+        return [r['title'] for r in self.db.search_advanced(self.user_id, **kwargs)]
+
+    def test_prefix_match_on_title(self):
+        self.assertEqual(self._titles(term="cenou"), ["Bolo de Cenoura"])
+
+    def test_match_on_ingredient_name(self):
+        self.assertEqual(self._titles(term="couve"), ["Suco Verde"])
+
+    def test_title_ranks_above_instructions(self):
+        titles = self._titles(term="bolo")
+        self.assertEqual(titles, ["Bolo de Cenoura", "Torta Salgada"])
+
+    def test_terms_are_combined_with_and(self):
+        self.assertEqual(self._titles(term="farinha frango"),
+                         ["Torta Salgada"])
+
+    def test_filters_combine_with_match(self):
+        self.assertEqual(self._titles(term="farinha", max_time=45),
+                         ["Torta Salgada"])
+
+    def test_numeric_servings_filter_uses_count(self):
+        # "8" não casa mais por substring com "18 copos"
+        self.assertEqual(self._titles(servings="8"), ["Torta Salgada"])
+        self.assertEqual(self._titles(servings="copos"), ["Suco Verde"])
+
+    def test_quotes_in_term_are_escaped(self):
+        self.assertEqual(self._titles(term='"bolo'), [
+                         "Bolo de Cenoura", "Torta Salgada"])
+
+    def test_accent_insensitive_match(self):
+        self.assertEqual(self._titles(term="pao"), ["Pão Caseiro"])
+        self.assertEqual(self._titles(term="acucar"), ["Pão Caseiro"])
+        self.assertEqual(self._titles(term="LIMAO"), ["Suco Verde"])
+
+    def test_accented_term_matches_accented_data(self):
+        self.assertEqual(self._titles(term="Açúc"), ["Pão Caseiro"])
+
+    def _walk(self, fetch, **kwargs):
+        items, cursor = fetch(limit=1, **kwargs)
+        while cursor:
+            page, cursor = fetch(limit=1, after=cursor, **kwargs)
+            self.assertLessEqual(len(page), 1)
+            items.extend(page)
+        return [r['id'] for r in items]
+
+    def test_search_page_walks_full_result_in_order(self):
+        expected = [r['id'] for r in self.db.search_advanced(self.user_id)]
+        walked = self._walk(lambda **kw: self.db.search_page(
+            self.user_id, **kw))
+        self.assertEqual(walked, expected)
+        self.assertEqual(self.db.count_search(self.user_id), len(expected))
+
+    def test_search_page_with_term_follows_rank(self):
+        expected = [r['id']
+                    for r in self.db.search_advanced(self.user_id, term="farinha")]
+        walked = self._walk(lambda **kw: self.db.search_page(
+            self.user_id, term="farinha", **kw))
+        self.assertEqual(walked, expected)
+        self.assertEqual(self.db.count_search(
+            self.user_id, term="farinha"), 2)
+
+    def test_user_recipes_page_walks_full_result(self):
+        walked = self._walk(lambda **kw: self.db.get_user_recipes_page(
+            self.user_id, **kw))
+        expected = [r['id'] for r in self.db.get_user_recipes(self.user_id)]
+        self.assertEqual(sorted(walked), sorted(expected))
+        self.assertEqual(len(set(walked)), len(walked))
+        self.assertEqual(self.db.count_user_recipes(
+            self.user_id), len(expected))
+
+    def test_user_recipes_page_merges_favorites_in_order(self):
+        """Próprias + favoritas diretas + categoria favorita (com exclusão), sem duplicatas."""
+        categories = CategoryQueries()
+        with db_connection() as conn:
+            cur = conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('Chef Vizinho', 'vizinho@test.com', 'hash')")
+            other = cur.lastrowid
+            cur = conn.execute(
+                "INSERT INTO categories (name, user_id) VALUES ('Do Vizinho', ?)", (other,))
+            other_category = cur.lastrowid
+            conn.commit()
+        for i, category in enumerate([self.category_id] + [other_category] * 3):
+            self.assertTrue(self.db.create_recipe(RecipeCreate(
+                category_id=category, title=f"Receita do Vizinho {i}", instructions="x"), other))
+        with db_connection() as conn:
+            other_ids = [r[0] for r in conn.execute(
+                "SELECT id FROM recipes WHERE user_id = ? ORDER BY id", (other,))]
+            own_id = conn.execute(
+                "SELECT MIN(id) FROM recipes WHERE user_id = ?", (self.user_id,)).fetchone()[0]
+            # Mesma data em ramos diferentes: o desempate por id vale no merge
+            conn.execute("UPDATE recipes SET created_at = '2020-01-01 00:00:00' WHERE id IN (?, ?)",
+                         (own_id, other_ids[2]))
+            conn.commit()
+
+        self.db.toggle_favorite(own_id, self.user_id)          # Própria e favorita: uma vez só
+        self.db.toggle_favorite(other_ids[0], self.user_id)    # Favorita direta
+        self.db.toggle_favorite(other_ids[1], self.user_id)    # Direta e da categoria favorita
+        categories.toggle_favorite_cascade(other_category, self.user_id)
+        self.db.toggle_favorite(other_ids[3], self.user_id)    # Desmarcada dentro da categoria
+        try:
+            rows = self.db.get_user_recipes(self.user_id)
+            expected = [r['id'] for r in sorted(rows, key=lambda r: (r['created_at'], r['id']), reverse=True)]
+            walked = self._walk(lambda **kw: self.db.get_user_recipes_page(self.user_id, **kw))
+            self.assertEqual(walked, expected)
+            self.assertEqual(set(walked) & set(other_ids), set(other_ids[:3]))
+            page, cursor = self.db.get_user_recipes_page(self.user_id, limit=len(expected))
+            self.assertIsNone(cursor)
+            self.assertEqual({r['id'] for r in page if r['is_favorite']}, {own_id, *other_ids[:3]})
+        finally:
+            categories.toggle_favorite_cascade(other_category, self.user_id)
+            self.db.toggle_favorite(own_id, self.user_id)
+            with db_connection() as conn:
+                conn.execute("DELETE FROM users WHERE id = ?", (other,))
+                conn.commit()
+
+    def test_user_recipes_page_plan_has_no_sort(self):
+        """Regressão: cada ramo segue seu índice; nenhuma página ordena o conjunto visível."""
+        CategoryQueries().toggle_favorite_cascade(self.category_id, self.user_id)
+        try:
+            with db_connection() as conn:
+                first = self.db._build_user_recipes_page_sql(conn, self.user_id, 10)
+                _, cursor = self.db.get_user_recipes_page(self.user_id, limit=1)
+                deep = self.db._build_user_recipes_page_sql(conn, self.user_id, 10, after=cursor)
+                for sql, params in (first, deep):
+                    plan = "\n".join(r[3] for r in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+                    self.assertNotIn("TEMP B-TREE", plan)
+                    self.assertIn("idx_recipes_user_created", plan)
+                    self.assertIn("idx_favorite_recipes_user_created", plan)
+                    self.assertIn("idx_recipes_category_created", plan)
+        finally:
+            CategoryQueries().toggle_favorite_cascade(self.category_id, self.user_id)
+
+    def test_page_limit_must_be_positive(self):
+        with self.assertRaises(ValidationError):
+            self.db.get_user_recipes_page(self.user_id, limit=0)
+        with self.assertRaises(ValidationError):
+            self.db.search_page(self.user_id, limit=0)
+
+    def test_invalid_cursor_returns_empty_page(self):
+        self.assertEqual(self.db.search_page(
+            self.user_id, after="nao-e-um-cursor"), ([], None))
+
+    def test_list_projection_is_narrow(self):
+        row = self.db.search_advanced(self.user_id, term="cenoura")[0]
+        self.assertEqual(set(row), {"id", "title", "preparation_time",
+                                    "image_path", "is_favorite"})
+
+    def test_is_favorite_flag(self):
+        rid = self.db.search_advanced(self.user_id, term="suco")[0]['id']
+        self.db.toggle_favorite(rid, self.user_id)
+        try:
+            rows = {r['id']: r['is_favorite']
+                    for r in self.db.search_advanced(self.user_id)}
+            self.assertEqual(rows[rid], 1)
+            self.assertEqual(sum(rows.values()), 1)
+        finally:
+            self.db.toggle_favorite(rid, self.user_id)
+
+    def _plan(self, **kwargs) -> str:
+        sql, params = self.db._build_search_sql(self.user_id, **kwargs)
+        with db_connection() as conn:
+            rows = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        return "\n".join(r[3] for r in rows)
+
+    def test_query_plan_uses_favorite_primary_key(self):
+        """Regressão: favoritos (diretos e por categoria) via PK, sem subquery correlacionada nem DISTINCT."""
+        for kwargs in ({}, {"term": "bolo"}, {"term": "bolo", "category_id": 1, "max_time": 30}):
+            plan = self._plan(**kwargs)
+            self.assertIn(
+                "SEARCH fr USING COVERING INDEX sqlite_autoindex_favorite_recipes_1 (user_id=? AND recipe_id=?)", plan)
+            self.assertIn(
+                "SEARCH fc USING COVERING INDEX sqlite_autoindex_favorite_categories_1 (user_id=? AND category_id=?)", plan)
+            self.assertIn(
+                "SEARCH fx USING PRIMARY KEY (user_id=? AND recipe_id=?)", plan)
+            self.assertNotIn("CORRELATED", plan)
+            self.assertNotIn("DISTINCT", plan)
+
+    def test_query_plan_text_search_uses_fts_index(self):
+        plan = self._plan(term="bolo")
+        self.assertIn("SCAN recipes_fts VIRTUAL TABLE INDEX", plan)
+        self.assertIn("SEARCH r USING INTEGER PRIMARY KEY (rowid=?)", plan)
+        self.assertNotIn("SCAN r\n", plan + "\n")
+
+    def test_index_follows_updates_and_deletes(self):
+        self._create("Pudim Temporário", "Leve ao forno.", ["Leite"])
+        rid = self.db.search_advanced(self.user_id, term="pudim")[0]['id']
+
+        data = RecipeCreate(
+            category_id=self.category_id, title="Pudim Renomeado",
+            instructions="Leve ao forno.",
+            ingredients=[IngredientSchema(name="Leite condensado")])
+        self.assertTrue(self.db.update_recipe(rid, data, self.user_id))
+        self.assertEqual(self._titles(term="condensado"), ["Pudim Renomeado"])
+
+        self.assertTrue(self.db.delete_recipe(rid, self.user_id))
+        self.assertEqual(self._titles(term="pudim"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+from src.utils.schema_org import parse_duration_minutes, parse_yield, recipe_total_minutes
+from src.services.scraper_service import RecipeScraper
+from src.models.recipe import RecipeCreate
+import unittest
+import os
+import sys
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestDurations(unittest.TestCase):
+
+    def test_iso_8601_shapes(self):
+        cases = {
+            "PT40M": 40, "PT1H": 60, "PT1H30M": 90, "PT1H30M0S": 90,
+            "P1DT2H": 1560, "P0DT0H45M": 45, "PT90S": 2, "PT0.5H": 30,
+            "pt20m": 20, " PT20M ": 20, "P1W": 10080,
+        }
+        for value, minutes in cases.items():
+            with self.subTest(value):
+                self.assertEqual(parse_duration_minutes(value), minutes)
+
+    def test_free_text_and_numbers(self):
+        self.assertEqual(parse_duration_minutes("1 h 20 min"), 80)
+        self.assertEqual(parse_duration_minutes("2 horas"), 120)
+        self.assertEqual(parse_duration_minutes("45"), 45)
+        self.assertEqual(parse_duration_minutes(30), 30)
+
+    def test_missing_or_zero_is_none(self):
+        for value in (None, "", "PT", "P0D", "PT0M", 0, "a gosto", True):
+            with self.subTest(value):
+                self.assertIsNone(parse_duration_minutes(value))
+
+    def test_total_falls_back_to_sum_of_parts(self):
+        self.assertEqual(recipe_total_minutes({"totalTime": "PT50M", "prepTime": "PT10M"}), 50)
+        self.assertEqual(recipe_total_minutes({"prepTime": "PT15M", "cookTime": "PT1H"}), 75)
+        self.assertEqual(recipe_total_minutes({"totalTime": "PT0M", "cookTime": "PT5M"}), 5)
+        self.assertIsNone(recipe_total_minutes({}))
+
+
+class TestYield(unittest.TestCase):
+
+    def test_yield_shapes(self):
+        cases = [
+            (4, (4, "4")),
+            ("4 servings", (4, "4")),
+            ("Serves 6", (6, "6")),
+            ("6-8 porções", (6, "6-8")),
+            ("Rende: 24 cookies", (24, "24 cookies")),
+            (["4", "4 servings"], (4, "4")),
+            (["1", "1 bolo de 20 cm"], (1, "1 bolo de 20 cm")),
+            ({"@type": "QuantitativeValue", "value": 6}, (6, "6")),
+            ("a gosto", (None, "a gosto")),
+            ([], (None, None)),
+            (None, (None, None)),
+        ]
+        for value, expected in cases:
+            with self.subTest(value):
+                self.assertEqual(tuple(parse_yield(value)), expected)
+
+    def test_model_derives_servings_count(self):
+        recipe = RecipeCreate(category_id=1, title="Bolo", instructions="x", servings="8 fatias")
+        self.assertEqual(recipe.servings_count, 8)
+        explicit = RecipeCreate(category_id=1, title="Bolo", instructions="x",
+                                servings="uma forma", servings_count=12)
+        self.assertEqual(explicit.servings_count, 12)
+
+    def test_scraper_uses_normalizers(self):
+        data = RecipeScraper._parse_schema({
+            "name": "Lasanha", "prepTime": "PT30M", "cookTime": "PT1H15M",
+            "recipeYield": ["8", "8 porções"], "recipeInstructions": "Monte e asse.",
+        }, "https://x.com")
+        self.assertEqual(data["preparation_time"], "105")
+        self.assertEqual(data["servings"], "8")
+        self.assertEqual(data["servings_count"], 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
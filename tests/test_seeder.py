@@ -0,0 +1,158 @@
+from src.database import seeder
+from src.database.database import db_connection
+import src.database.database as db_module
+import io
+import json
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+def _recipe(title, category="Doces", ingredients=("Açúcar",)):
+    return {
+        "title": title,
+        "category": category,
+        "preparation_time": 20,
+        "servings": "4 pessoas",
+        "instructions": "Misture tudo.",
+        "ingredients": [{"name": n, "quantity": "1", "unit": "xícara"} for n in ingredients],
+    }
+
+
+class TestSeeder(unittest.TestCase):
+
+    def setUp(self):
+        """Banco novo e isolado para cada teste."""
+        random_id = str(uuid.uuid4())[:8]
+        self.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        self.original_db = db_module.DB_NAME
+        db_module.DB_NAME = self.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, self.TEST_DB_NAME)
+        db_module.init_database()
+        self.json_path = os.path.join(
+            db_module.DB_DIR, f"seed_test_{random_id}.json")
+
+    def tearDown(self):
+        db_module.close_all_pools()
+        db_module.DB_NAME = self.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, self.original_db)
+        for path in (os.path.join(db_module.DB_DIR, self.TEST_DB_NAME), self.json_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _seed(self, recipes):
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump(recipes, f, ensure_ascii=False, indent=2)
+        with db_connection() as conn:
+            return seeder._seed_from_file(conn, self.json_path, chunk_size=2)
+
+    def _system_titles(self):
+        with db_connection() as conn:
+            rows = conn.execute(
+                "SELECT title FROM recipes WHERE user_id = 1 ORDER BY id").fetchall()
+        return [r[0] for r in rows]
+
+    def test_iter_json_array_across_small_blocks(self):
+        data = [_recipe(f"Receita {n} ]}}, \"[") for n in range(5)]
+        stream = io.StringIO(json.dumps(data, ensure_ascii=False))
+        self.assertEqual(
+            list(seeder.iter_json_array(stream, block_size=7)), data)
+        self.assertEqual(list(seeder.iter_json_array(io.StringIO(" [ ] "))), [])
+
+    def test_iter_json_array_rejects_truncated_file(self):
+        stream = io.StringIO(json.dumps([_recipe("Bolo")])[:-10])
+        with self.assertRaises(ValueError):
+            list(seeder.iter_json_array(stream, block_size=16))
+
+    def test_seed_is_incremental(self):
+        first = [_recipe("Bolo"), _recipe("Pudim"), _recipe(
+            "Farofa", category="Acompanhamentos")]
+        self.assertEqual(self._seed(first), 3)
+        self.assertEqual(self._seed(first), 0)
+
+        self.assertEqual(self._seed(first + [_recipe("Brigadeiro")]), 1)
+        self.assertEqual(self._system_titles(), [
+                         "Bolo", "Pudim", "Farofa", "Brigadeiro"])
+
+        with db_connection() as conn:
+            cats = conn.execute(
+                "SELECT name FROM categories WHERE user_id IS NULL ORDER BY name").fetchall()
+            hit = conn.execute(
+                "SELECT rowid FROM recipes_fts WHERE recipes_fts MATCH 'brigadeiro'").fetchone()
+        self.assertTrue({"Acompanhamentos", "Doces"} <= {c[0] for c in cats})
+        self.assertIsNotNone(hit)
+
+    def test_invalid_item_is_skipped_and_retried(self):
+        bad = _recipe("X")  # Título curto demais para a validação
+        self.assertEqual(self._seed([_recipe("Bolo"), bad]), 1)
+        self.assertEqual(self._seed([_recipe("Bolo"), bad]), 0)
+        self.assertEqual(self._system_titles(), ["Bolo"])
+
+    def test_deleted_native_recipe_is_not_recreated(self):
+        self._seed([_recipe("Bolo"), _recipe("Pudim")])
+        with db_connection() as conn:
+            conn.execute("DELETE FROM recipes WHERE title = 'Pudim'")
+            conn.commit()
+        self.assertEqual(self._seed([_recipe("Bolo"), _recipe("Pudim")]), 0)
+        self.assertEqual(self._system_titles(), ["Bolo"])
+
+    def test_corrected_entry_updates_recipe_in_place(self):
+        self._seed([_recipe("Bolo", ingredients=("Açúcar", "Farinah")),
+                    dict(_recipe("Pudm"), id="pudim")])
+        with db_connection() as conn:
+            ids = [r[0] for r in conn.execute(
+                "SELECT id FROM recipes WHERE user_id = 1 ORDER BY id")]
+
+        # Correções no conteúdo (chave: título + fonte) e no título (chave: id)
+        fixed = [_recipe("Bolo", ingredients=("Açúcar", "Farinha")),
+                 dict(_recipe("Pudim"), id="pudim")]
+        self.assertEqual(self._seed(fixed), 0)
+        self.assertEqual(self._seed(fixed), 0)
+        self.assertEqual(self._system_titles(), ["Bolo", "Pudim"])
+
+        with db_connection() as conn:
+            self.assertEqual([r[0] for r in conn.execute(
+                "SELECT id FROM recipes WHERE user_id = 1 ORDER BY id")], ids)
+            names = [r[0] for r in conn.execute(
+                "SELECT name FROM recipe_ingredients WHERE recipe_id = ? ORDER BY id", (ids[0],))]
+            seeds = conn.execute("SELECT COUNT(*) FROM native_recipe_seeds").fetchone()[0]
+            hit = conn.execute(
+                "SELECT rowid FROM recipes_fts WHERE recipes_fts MATCH 'pudim'").fetchone()
+        self.assertEqual(names, ["Açúcar", "Farinha"])
+        self.assertEqual(seeds, 2)
+        self.assertEqual(hit[0], ids[1])
+
+    def test_corrected_entry_stays_deleted(self):
+        self._seed([_recipe("Bolo"), _recipe("Pudim")])
+        with db_connection() as conn:
+            conn.execute("DELETE FROM recipes WHERE title = 'Pudim'")
+            conn.commit()
+        self.assertEqual(
+            self._seed([_recipe("Bolo"), _recipe("Pudim", ingredients=("Leite",))]), 0)
+        self.assertEqual(self._system_titles(), ["Bolo"])
+
+    def test_legacy_seed_is_adopted_by_title(self):
+        """Banco semeado pela versão antiga (sem hashes) não é duplicado."""
+        with db_connection() as conn:
+            conn.execute(
+                "INSERT INTO users (id, full_name, email, hashed_password) VALUES (1, 'Admin', 'admin@system.local', 'h')")
+            cat = conn.execute(
+                "INSERT INTO categories (name, user_id) VALUES ('Doces', NULL)").lastrowid
+            conn.execute(
+                "INSERT INTO recipes (user_id, category_id, title, instructions) VALUES (1, ?, 'Bolo', 'x')", (cat,))
+            conn.commit()
+
+        self.assertEqual(self._seed([_recipe("Bolo"), _recipe("Pudim")]), 1)
+        self.assertEqual(self._seed([_recipe("Bolo"), _recipe("Pudim")]), 0)
+        self.assertEqual(self._system_titles(), ["Bolo", "Pudim"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+from src.database import session_queries
+from src.database.database import db_connection
+from src.models.user_model import User
+import src.database.database as db_module
+import unittest
+import os
+import sys
+import uuid
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestSessions(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Banco de teste isolado."""
+        random_id = str(uuid.uuid4())[:8]
+        cls.TEST_DB_NAME = f"recipes_test_{random_id}.db"
+        cls.original_db = db_module.DB_NAME
+        db_module.DB_NAME = cls.TEST_DB_NAME
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME)
+        db_module.init_database()
+
+        with db_connection() as conn:
+            uid = conn.execute(
+                "INSERT INTO users (full_name, email, hashed_password) VALUES ('Sessão', 'sessao@test.com', 'h')").lastrowid
+            conn.commit()
+        cls.user = User(id=uid, full_name="Sessão", email="sessao@test.com")
+
+    @classmethod
+    def tearDownClass(cls):
+        db_module.close_all_pools()
+        db_module.DB_NAME = cls.original_db
+        db_module.DB_PATH = os.path.join(db_module.DB_DIR, cls.original_db)
+        try:
+            os.remove(os.path.join(db_module.DB_DIR, cls.TEST_DB_NAME))
+        except OSError:
+            pass
+
+    def setUp(self):
+        session_queries._cache.clear()
+
+    def test_token_round_trip_survives_cache_loss(self):
+        token = session_queries.create_session(self.user)
+        self.assertEqual(session_queries.validate_session(token).id, self.user.id)
+
+        session_queries._cache.clear()  # Simula outro processo/reinício
+        self.assertEqual(session_queries.validate_session(token).email,
+                         "sessao@test.com")
+
+    def test_tampered_or_malformed_tokens_are_rejected(self):
+        token = session_queries.create_session(self.user)
+        session_id, signature = token.split(".")
+        for bad in (None, "", "sem-ponto", f"{session_id}.{signature[:-1]}x",
+                    f"outro{session_id}.{signature}", f"{session_id}.ção", token + ".extra"):
+            self.assertIsNone(session_queries.validate_session(bad), bad)
+
+    def test_only_token_hash_is_stored(self):
+        token = session_queries.create_session(self.user)
+        with db_connection() as conn:
+            stored = [r[0] for r in conn.execute("SELECT token_hash FROM sessions")]
+        self.assertNotIn(token.split(".")[0], stored)
+
+    def test_revoked_session_is_invalid(self):
+        token = session_queries.create_session(self.user)
+        self.assertTrue(session_queries.revoke_session(token))
+        self.assertIsNone(session_queries.validate_session(token))
+
+    def test_expired_session_is_invalid_and_purged(self):
+        token = session_queries.create_session(self.user, ttl=-1)
+        session_queries._cache.clear()
+        self.assertIsNone(session_queries.validate_session(token))
+        self.assertGreaterEqual(session_queries.purge_expired_sessions(), 1)
+
+    def test_cache_is_bounded_lru(self):
+        cache = session_queries._SessionCache(max_size=2)
+        for key in ("a", "b"):
+            cache.put(key, self.user, expires_at=float("inf"))
+        cache.get("a")
+        cache.put("c", self.user, expires_at=float("inf"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        cache.put("d", self.user, expires_at=0)
+        self.assertIsNone(cache.get("d"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+from src.services.voice_service import (DictationSession, TranscriptFileRecognizer, WavFileSource,
+                                        chunk_rms)
+from src.viewmodels.recipe_viewmodel import RecipeViewModel
+from types import SimpleNamespace
+import array
+import asyncio
+import math
+import shutil
+import tempfile
+import threading
+import unittest
+import wave
+import os
+import sys
+
+# Ajusta path
+sys.path.insert(0, os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..')))
+
+RATE = 16000
+PHRASES = ["duas xícaras de farinha e três ovos", "sal a gosto", "200 ml de leite"]
+
+
+def _tone(seconds, amplitude=8000):
+    return [int(amplitude * math.sin(2 * math.pi * 440 * i / RATE)) for i in range(int(RATE * seconds))]
+
+
+def _silence(seconds):
+    return [0] * int(RATE * seconds)
+
+
+def write_dictation_wav(path, phrases, channels=1):
+    """Uma "frase" (tom de 0,6 s) por item, separadas por 0,8 s de silêncio + .txt ao lado."""
+    samples = _silence(0.3)
+    for _ in phrases:
+        samples += _tone(0.6) + _silence(0.8)
+    pcm = array.array("h", (s for s in samples for _ in range(channels)))
+    if sys.byteorder == "big":
+        pcm.byteswap()
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(pcm.tobytes())
+    with open(os.path.splitext(path)[0] + ".txt", "w", encoding="utf-8") as f:
+        f.write("\n".join(phrases))
+    return path
+
+
+class _SlowWavSource(WavFileSource):
+    """WAV entregue em "tempo real" acelerado, para testar stop() no meio do ditado."""
+
+    def chunks(self):
+        for chunk in super().chunks():
+            threading.Event().wait(0.01)
+            yield chunk
+
+
+class TestVoiceDictation(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="voice_test_")
+        self.wav = write_dictation_wav(os.path.join(self.workdir, "ingredientes.wav"), PHRASES)
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _session(self, source=None):
+        return DictationSession(source or WavFileSource(self.wav),
+                                TranscriptFileRecognizer.for_wav(self.wav))
+
+    def test_wav_source_chunks_and_downmix(self):
+        chunks = list(WavFileSource(self.wav).chunks())
+        self.assertEqual(len(chunks[0]), RATE // 10 * 2)  # 100 ms, 16 bits
+        stereo = write_dictation_wav(os.path.join(self.workdir, "estereo.wav"), PHRASES, channels=2)
+        self.assertEqual(b"".join(WavFileSource(stereo).chunks()), b"".join(chunks))
+        self.assertEqual(chunk_rms(chunks[0]), 0.0)
+        self.assertGreater(chunk_rms(chunks[5]), 5000)
+
+    def test_partials_then_finals_in_order(self):
+        events = []
+        self._session().run(events.append)
+
+        finals = [t.text for t in events if t.final]
+        self.assertEqual(finals, PHRASES)
+        first_partials = [t.text for t in events[:events.index(next(t for t in events if t.final))]]
+        # Parciais crescem palavra a palavra até a frase final
+        self.assertEqual(first_partials[:3], ["duas", "duas xícaras", "duas xícaras de"])
+        self.assertTrue(all(PHRASES[0].startswith(text) for text in first_partials))
+
+    def test_stream_runs_on_background_thread(self):
+        worker_threads = set()
+
+        class _Recognizer(TranscriptFileRecognizer):
+            def reset(self, sample_rate):
+                # Carga do modelo (Vosk) acontece aqui: nunca no loop da UI
+                worker_threads.add(threading.current_thread().name)
+                super().reset(sample_rate)
+
+            def feed(self, chunk):
+                worker_threads.add(threading.current_thread().name)
+                return super().feed(chunk)
+
+        session = DictationSession(WavFileSource(self.wav), _Recognizer.for_wav(self.wav))
+        worker_threads.clear()  # reset() do construtor
+
+        async def collect():
+            return [t async for t in session.stream()]
+
+        events = asyncio.run(collect())
+        self.assertEqual([t.text for t in events if t.final], PHRASES)
+        self.assertEqual(worker_threads, {"dictation"})
+        self.assertTrue(session.stopped)
+
+    def test_stop_flushes_pending_phrase(self):
+        session = self._session(_SlowWavSource(self.wav))
+
+        async def collect():
+            events = []
+            async for transcript in session.stream():
+                events.append(transcript)
+                if not transcript.final and transcript.text == "sal":
+                    session.stop()
+            return events
+
+        finals = [t.text for t in asyncio.run(collect()) if t.final]
+        self.assertEqual(finals, PHRASES[:2])
+
+    def test_viewmodel_adds_dictated_ingredients(self):
+        vm = RecipeViewModel(SimpleNamespace(data={}))
+
+        async def collect():
+            return [added async for _, added in vm.dictate_ingredients(self._session())]
+
+        self.assertEqual(sum(asyncio.run(collect())), 4)
+        self.assertEqual([(i.name, i.quantity, i.unit) for i in vm.temp_ingredients], [
+            ("farinha", "2", "xícara"), ("ovos", "3", ""), ("sal", "a gosto", ""), ("leite", "200", "ml")])
+
+
+if __name__ == '__main__':
+    unittest.main()